@@ -0,0 +1,3 @@
+"""
+Performance benchmarks for montykit, run with ``python -m benchmarks.<name>``.
+"""
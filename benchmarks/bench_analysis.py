@@ -0,0 +1,77 @@
+"""
+Benchmarks for montykit.analysis
+
+Run from the repository root with ``python -m benchmarks.bench_analysis``.
+"""
+
+import random
+import timeit
+
+from montykit.analysis import _SentimentLexicon, _lexicon, text_sentiments
+
+
+_FUNCTION_WORDS = ("the a an and but or not no never very really quite it this that "
+                   "is was were be been I you we they he she my our your of to in on "
+                   "for with at by from as so too just don't isn't can't").split()
+_MARKS = ("",) * 12 + (",", ",", ";", ":")
+
+
+def _zipf(rng: random.Random, words: list, k: int) -> list:
+    return rng.choices(words, [1 / (rank + 1) for rank in range(len(words))], k=k)
+
+
+def _corpus(amount: int, seed: int = 0) -> list:
+    """Review-like texts of 1 to 6 sentences: Zipf-distributed function
+    words, opinion words from the sentiment lexicon and made-up nouns."""
+    rng = random.Random(seed)
+    opinions = sorted(_lexicon().scores)
+    rng.shuffle(opinions)
+    nouns = sorted({"".join(rng.choice("bcdfgklmnprstvz") + rng.choice("aeiou")
+                            for _ in range(rng.randint(1, 4))) for _ in range(20000)})
+    rng.shuffle(nouns)
+    pools = (_FUNCTION_WORDS, opinions, nouns)
+    texts = []
+    for _ in range(amount):
+        sentences = []
+        for _ in range(rng.randint(1, 6)):
+            words = [_zipf(rng, pool, 1)[0] + rng.choice(_MARKS)
+                     for pool in rng.choices(pools, (45, 15, 40), k=rng.randint(4, 18))]
+            sentences.append(" ".join(words).rstrip(",;:").capitalize() + rng.choice("..!?"))
+        texts.append(" ".join(sentences))
+    return texts
+
+
+def _report(label: str, seconds: float, amount: int) -> None:
+    print(f"{label:<45} {seconds * 1000:10.2f} ms {seconds / amount * 1e6:10.1f} us/text")
+
+
+def bench_sentiment(amount: int = 2000, repeat: int = 3) -> None:
+    """Compares TextBlob with text_sentiments on fresh texts, both with an
+    empty chunk cache and with every chunk seen before."""
+    from textblob import TextBlob
+
+    lexicon = _lexicon()
+    if not isinstance(lexicon, _SentimentLexicon):
+        print("The installed TextBlob does not match the sentiment fast path, "
+              "so text_sentiments falls back to it")
+        return
+    texts = _corpus(amount)
+    slow = min(timeit.repeat(lambda: [TextBlob(text).sentiment for text in texts],
+                             number=1, repeat=repeat))
+    _report(f"TextBlob ({amount} texts)", slow, amount)
+
+    def cold():
+        lexicon._words.clear()
+        text_sentiments(texts)
+    fast = min(timeit.repeat(cold, number=1, repeat=repeat))
+    _report(f"text_sentiments, cold cache ({slow / fast:.1f}x)", fast, amount)
+    fast = min(timeit.repeat(lambda: text_sentiments(texts), number=1, repeat=repeat))
+    _report(f"text_sentiments, warm cache ({slow / fast:.1f}x)", fast, amount)
+
+
+def main() -> None:
+    bench_sentiment()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmarks for montykit.hash
+
+Run from the repository root with ``python -m benchmarks.bench_hash``.
+"""
+
+import os
+import tempfile
+import timeit
+
+from montykit.hash import (generate_hash, generate_hashes, hash_file,
+                           hash_file_multi, hash_many)
+
+
+ALGORITHMS = ("md5", "sha1", "sha256")
+
+
+def _report(label: str, seconds: float, size: int = None) -> None:
+    """Prints one benchmark line, with throughput when a byte size is given."""
+    line = f"{label:<45} {seconds * 1000:10.2f} ms"
+    if size:
+        line += f" {size / seconds / 1e6:10.1f} MB/s"
+    print(line)
+
+
+def bench_multi_digest(size: int = 64 * 1024 * 1024, repeat: int = 3) -> None:
+    """Compares one hash per algorithm against a single multi-digest pass."""
+    text = "montykit " * (size // 9)
+    _report("generate_hash x3 (str)", min(timeit.repeat(
+        lambda: [generate_hash(text, algo) for algo in ALGORITHMS],
+        number=1, repeat=repeat)), size)
+    _report("generate_hashes (str)", min(timeit.repeat(
+        lambda: generate_hashes(text, ALGORITHMS), number=1, repeat=repeat)), size)
+
+    fd, path = tempfile.mkstemp()
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(text.encode())
+        _report("hash_file x3", min(timeit.repeat(
+            lambda: [hash_file(path, algo) for algo in ALGORITHMS],
+            number=1, repeat=repeat)), size)
+        _report("hash_file_multi", min(timeit.repeat(
+            lambda: hash_file_multi(path, ALGORITHMS), number=1, repeat=repeat)), size)
+    finally:
+        os.remove(path)
+
+
+def bench_hash_many(amount: int = 200_000, repeat: int = 3) -> None:
+    """Compares generate_hash in a loop against hash_many on short strings."""
+    texts = [f"user-{i}@example.com" for i in range(amount)]
+    _report(f"generate_hash loop ({amount} strings)", min(timeit.repeat(
+        lambda: [generate_hash(t) for t in texts], number=1, repeat=repeat)))
+    _report(f"hash_many ({amount} strings)", min(timeit.repeat(
+        lambda: hash_many(texts), number=1, repeat=repeat)))
+
+
+def main() -> None:
+    bench_multi_digest()
+    bench_hash_many()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmarks for montykit.validators
+
+Run from the repository root with ``python -m benchmarks.bench_validators``.
+"""
+
+import re
+import timeit
+
+from montykit.validators import compile_schema, schema_batch_validator
+
+
+SCHEMA = {
+    "type": "object",
+    "required": ["id", "email", "tags", "address"],
+    "additionalProperties": False,
+    "properties": {
+        "id": {"type": "integer", "minimum": 1},
+        "email": {"type": "string", "pattern": "^[^@]+@[^@]+$", "maxLength": 254},
+        "name": {"type": "string", "minLength": 1},
+        "score": {"type": "number", "minimum": 0, "maximum": 100},
+        "tags": {"type": "array", "items": {"type": "string"}, "maxItems": 10},
+        "address": {
+            "type": "object",
+            "required": ["city"],
+            "properties": {
+                "city": {"type": "string"},
+                "zip": {"type": "string", "pattern": "^[0-9]{5}$"},
+            },
+        },
+        "status": {"enum": ["active", "disabled", "pending"]},
+    },
+}
+
+_TYPES = {
+    "object": dict, "array": list, "string": str, "boolean": bool,
+    "integer": int, "number": (int, float), "null": type(None),
+}
+
+
+def interpret(schema: dict, value) -> bool:
+    """Validates by walking the schema on every call, as a naive validator does."""
+    if "type" in schema:
+        expected = _TYPES[schema["type"]]
+        if not isinstance(value, expected) or (
+                isinstance(value, bool) and schema["type"] in ("integer", "number")):
+            return False
+    if "enum" in schema and value not in schema["enum"]:
+        return False
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        if "minimum" in schema and value < schema["minimum"]:
+            return False
+        if "maximum" in schema and value > schema["maximum"]:
+            return False
+    if isinstance(value, str):
+        if "minLength" in schema and len(value) < schema["minLength"]:
+            return False
+        if "maxLength" in schema and len(value) > schema["maxLength"]:
+            return False
+        if "pattern" in schema and not re.search(schema["pattern"], value):
+            return False
+    if isinstance(value, list):
+        if "maxItems" in schema and len(value) > schema["maxItems"]:
+            return False
+        if "items" in schema and not all(interpret(schema["items"], v) for v in value):
+            return False
+    if isinstance(value, dict):
+        properties = schema.get("properties", {})
+        if any(name not in value for name in schema.get("required", ())):
+            return False
+        for name, item in value.items():
+            if name in properties:
+                if not interpret(properties[name], item):
+                    return False
+            elif schema.get("additionalProperties") is False:
+                return False
+    return True
+
+
+def _documents(amount: int) -> list:
+    return [{
+        "id": i + 1,
+        "email": f"user{i}@example.com",
+        "name": f"User {i}",
+        "score": i % 101,
+        "tags": ["a", "b", "c"][: i % 4],
+        "address": {"city": "Springfield", "zip": f"{i % 100000:05d}"},
+        "status": ("active", "disabled", "pending", "unknown")[i % 4],
+    } for i in range(amount)]
+
+
+def main(amount: int = 100_000, repeat: int = 3) -> None:
+    documents = _documents(amount)
+    validate = compile_schema(SCHEMA)
+    assert [interpret(SCHEMA, d) for d in documents] == list(map(validate, documents))
+
+    interpreted = min(timeit.repeat(lambda: [interpret(SCHEMA, d) for d in documents],
+                                    number=1, repeat=repeat))
+    compiled = min(timeit.repeat(lambda: schema_batch_validator(documents, SCHEMA),
+                                 number=1, repeat=repeat))
+    lookup = min(timeit.repeat(lambda: compile_schema(SCHEMA), number=1, repeat=repeat))
+    print(f"{'interpreted schema':<30} {interpreted * 1000:10.2f} ms "
+          f"{amount / interpreted:12.0f} docs/s")
+    print(f"{'compiled schema':<30} {compiled * 1000:10.2f} ms "
+          f"{amount / compiled:12.0f} docs/s")
+    print(f"{'speedup':<30} {interpreted / compiled:10.2f}x")
+    print(f"{'cached compile_schema lookup':<30} {lookup * 1e6:10.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,556 @@
+"""
+Benchmark suite covering every public montykit function
+
+Each function in ``montykit.__all__`` has a case that builds an input of a
+given size (1KB, 1MB and, for functions built for large inputs, 100MB) and
+records latency percentiles, throughput and peak Python heap use. Results
+can be saved as JSON and compared against an earlier run to flag
+regressions.
+
+Run from the repository root::
+
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --baseline results.json --sizes 1KB,1MB,100MB
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from functools import partial
+
+import montykit
+
+
+SIZES = {"1KB": 1 << 10, "1MB": 1 << 20, "100MB": 100 << 20}
+_SMALL = ("1KB", "1MB")
+_LARGE = ("1KB", "1MB", "100MB")
+_ONLY_1KB = ("1KB",)
+_SENTENCES = ("Arthur remained very worried about the quick brown fox. "
+              "The happy dog jumps over the lazy cat! Is this a question? ")
+_RECORD_SCHEMA = {"id": "id", "name": "full_name", "phone": "phone", "password": "password"}
+_SCHEMA = {
+    "type": "object",
+    "required": ["id", "email"],
+    "properties": {
+        "id": {"type": "integer", "minimum": 1},
+        "email": {"type": "string", "pattern": "^[^@]+@[^@]+$"},
+        "tags": {"type": "array", "items": {"type": "string"}, "maxItems": 10},
+    },
+}
+_RULES = {"id": ["required", ("type", int)], "email": ["required", "email"],
+          "name": [("min_length", 2), ("max_length", 40)]}
+
+# Function name: (case builder, size labels it runs at)
+_CASES = {}
+
+
+class Skip(Exception):
+    """Raised by a case builder when a function cannot be benchmarked here."""
+
+
+def _case(*names, sizes=_SMALL):
+    def register(builder):
+        for name in names:
+            _CASES[name] = (builder, sizes)
+        return builder
+    return register
+
+
+def _text(size: int) -> str:
+    return (_SENTENCES * (size // len(_SENTENCES) + 1))[:size]
+
+
+def _items(size: int, make) -> list:
+    """Makes items with make(index) until their lengths add up to size."""
+    items, total = [], 0
+    while total < size:
+        item = make(len(items))
+        items.append(item)
+        total += len(item)
+    return items
+
+
+def _email(index: int) -> str:
+    return f"user.{index}@example{index % 97}.com" if index % 10 else f"bad-{index}"
+
+
+def _password(index: int) -> str:
+    return f"Pa55!word{index}" if index % 3 else f"password{index}"
+
+
+def _document(index: int) -> dict:
+    return {"id": index + 1, "email": _email(index + 1), "tags": ["a", "b"]}
+
+
+def _write(tmp: str, name: str, data: bytes) -> str:
+    path = os.path.join(tmp, name)
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+
+_EXTRA_ARGS = {
+    "shift_cipher": (3,),
+    "caesar_cipher": (3,),
+    "substitution_cipher": ("QWERTYUIOPASDFGHJKLZXCVBNM",),
+}
+
+
+@_case("a1z26_cipher", "atbash_cipher", "bacon_cipher", "caesar_cipher", "eng_to_imct",
+       "eng_to_morse", "rail_fence_2_cipher", "reverse_cipher", "rot13", "shift_cipher",
+       "substitution_cipher", "text_to_binary", "text_to_hex", "text_to_url",
+       "to_camel_case", "to_snake_case", "word_freq", "text_polarity",
+       "text_subjectivity", "text_sentiment", "text_difficulty", "text_is_difficult")
+def _text_case(func, size, tmp):
+    return partial(func, _text(size), *_EXTRA_ARGS.get(func.__name__, ())), size
+
+
+@_case("text_sentiments")
+def _sentiments_case(func, size, tmp):
+    return partial(func, _items(size, lambda i: _text(200 + i % 300))), size
+
+
+@_case("base64_encode", "json_validator", sizes=_LARGE)
+def _large_text_case(func, size, tmp):
+    text = json.dumps(_items(size, lambda i: json.dumps(_document(i))))
+    return partial(func, text if func.__name__ == "json_validator" else _text(size)), size
+
+
+_ENCODERS = {"morse_to_eng": "eng_to_morse", "binary_to_text": "text_to_binary",
+             "hex_to_text": "text_to_hex", "url_to_text": "text_to_url"}
+
+
+@_case(*_ENCODERS)
+def _decode_case(func, size, tmp):
+    encoded = getattr(montykit, _ENCODERS[func.__name__])(_text(size))
+    return partial(func, encoded), len(encoded)
+
+
+@_case("base64_decode", sizes=_LARGE)
+def _base64_decode_case(func, size, tmp):
+    encoded = montykit.base64_encode(_text(size))
+    return partial(func, encoded), len(encoded)
+
+
+@_case("detect_lang", sizes=_ONLY_1KB)
+def _network_case(func, size, tmp):
+    raise Skip("needs network access")
+
+
+@_case("gen_first_name", "gen_middle_name", "gen_last_name", "gen_full_name", "gen_id",
+       "gen_password", "gen_phone", "gen_uuid", "gen_uuid7", "gen_ulid", "gen_strong_password")
+def _single_generator_case(func, size, tmp):
+    amount = max(size // len(func()), 1)
+    return lambda: [func() for _ in range(amount)], size
+
+
+@_case("gen_first_names", "gen_middle_names", "gen_last_names", "gen_uuids", "gen_ulids",
+       "gen_strong_passwords")
+def _bulk_generator_case(func, size, tmp):
+    single = getattr(montykit, func.__name__[:-1])
+    return partial(func, max(size // len(single()), 1)), size
+
+
+@_case("gen_full_names")
+def _full_names_case(func, size, tmp):
+    return partial(func, amount=max(size // len(montykit.gen_full_name()), 1)), size
+
+
+@_case("gen_records", "gen_record_batches", "write_records")
+def _records_case(func, size, tmp):
+    amount = max(size // 60, 1)
+    if func.__name__ == "gen_record_batches":
+        return lambda: list(func(_RECORD_SCHEMA, amount)), size
+    if func.__name__ == "write_records":
+        return partial(func, os.path.join(tmp, "records.csv"), _RECORD_SCHEMA, amount), size
+    return partial(func, _RECORD_SCHEMA, amount), size
+
+
+@_case("generate_hash", "generate_hashes", sizes=_LARGE)
+def _hash_text_case(func, size, tmp):
+    return partial(func, _text(size)), size
+
+
+@_case("hash_many")
+def _hash_many_case(func, size, tmp):
+    return partial(func, _items(size, _email)), size
+
+
+@_case("hash_file", "hash_file_multi", "chunk_file", "chunk_manifest", sizes=_LARGE)
+def _hash_path_case(func, size, tmp):
+    path = _write(tmp, "data.bin", os.urandom(size))
+    if func.__name__ == "chunk_file":
+        return lambda: list(func(path)), size
+    return partial(func, path), size
+
+
+@_case("hash_stream", sizes=_LARGE)
+def _hash_stream_case(func, size, tmp):
+    path = _write(tmp, "data.bin", os.urandom(size))
+
+    def run():
+        with open(path, "rb") as f:
+            return func(f)
+    return run, size
+
+
+@_case("hash_files", sizes=_LARGE)
+def _hash_files_case(func, size, tmp):
+    paths = [_write(tmp, f"data{i}.bin", os.urandom(size // 16)) for i in range(16)]
+    return lambda: list(func(paths)), size // 16 * 16
+
+
+@_case("fnv1a_32", "fnv1a_64", "murmur3_32", "xxh32", "xxh64")
+def _hash_bytes_case(func, size, tmp):
+    return partial(func, os.urandom(size)), size
+
+
+@_case("jump_hash", "rendezvous_hash")
+def _placement_case(func, size, tmp):
+    keys = _items(size, _email)
+    if func.__name__ == "jump_hash":
+        return lambda: [func(key, 1000) for key in keys], size
+    nodes = [f"node-{i}" for i in range(16)]
+    return lambda: [func(key, nodes) for key in keys], size
+
+
+@_case("diff_manifests", sizes=_LARGE)
+def _diff_manifests_case(func, size, tmp):
+    data = bytearray(os.urandom(size))
+    old = montykit.chunk_manifest(_write(tmp, "old.bin", data))
+    data[size // 2:size // 2 + 100] = os.urandom(100)
+    new = montykit.chunk_manifest(_write(tmp, "new.bin", data))
+    return partial(func, old, new), size
+
+
+@_case("MerkleTree", sizes=_LARGE)
+def _merkle_case(func, size, tmp):
+    data = os.urandom(size)
+    return partial(func.from_bytes, data, 4096), size
+
+
+@_case("verify_merkle_proof")
+def _merkle_proof_case(func, size, tmp):
+    data = os.urandom(size)
+    tree = montykit.MerkleTree.from_bytes(data, 1024)
+    checks = [(data[i * 1024:(i + 1) * 1024], tree.proof(i)) for i in range(len(tree))]
+    root = tree.root
+    return lambda: [func(block, proof, root) for block, proof in checks], size
+
+
+@_case("CorpusIndex", "NgramCounter")
+def _corpus_case(func, size, tmp):
+    documents = _items(size, lambda i: _text(200 + i % 300))
+
+    def build():
+        index = func()
+        index.add_many(documents)
+        return index
+    return build, size
+
+
+@_case("minhash", "simhash")
+def _fingerprint_case(func, size, tmp):
+    return partial(func, _text(size)), size
+
+
+@_case("minhash_signatures", "simhash_signatures", "minhash_duplicates", "simhash_duplicates")
+def _dedup_case(func, size, tmp):
+    documents = _items(size, lambda i: _text(200 + i % 300))
+    return partial(func, documents), size
+
+
+@_case("LSHIndex")
+def _lsh_case(func, size, tmp):
+    documents = _items(size, lambda i: _text(200 + i % 300))
+    signatures = montykit.minhash_signatures(documents)
+
+    def build():
+        index = func()
+        index.add_many(signatures)
+        return index.candidate_pairs()
+    return build, size
+
+
+@_case("minhash_similarity", "hamming_distance", "lsh_bands", sizes=_ONLY_1KB)
+def _dedup_helper_case(func, size, tmp):
+    if func.__name__ == "minhash_similarity":
+        args = (montykit.minhash(_text(size)), montykit.minhash(_text(size // 2)))
+    elif func.__name__ == "hamming_distance":
+        args = (montykit.simhash(_text(size)), montykit.simhash(_text(size // 2)))
+    else:
+        args = (128, 0.8)
+    return partial(func, *args), size
+
+
+@_case("find_json_error", "json_stream_validator", sizes=_LARGE)
+def _json_stream_case(func, size, tmp):
+    document = json.dumps(_items(size, lambda i: json.dumps(_document(i)))).encode()
+    return partial(func, document), len(document)
+
+
+@_case("jsonl_validator", sizes=_LARGE)
+def _jsonl_case(func, size, tmp):
+    lines = _items(size, lambda i: json.dumps(_document(i)) + "\n")
+    path = _write(tmp, "data.jsonl", "".join(lines).encode())
+    return partial(func, path), os.path.getsize(path)
+
+
+@_case("is_email", "is_strong_pass", "password_strength")
+def _string_check_case(func, size, tmp):
+    values = _items(size, _email if func.__name__ == "is_email" else _password)
+    return lambda: [func(value) for value in values], size
+
+
+@_case("validate_emails", sizes=_LARGE)
+def _validate_emails_case(func, size, tmp):
+    return partial(func, _items(size, _email)), size
+
+
+@_case("validate_email_column", sizes=_LARGE)
+def _email_column_case(func, size, tmp):
+    lines = ["email\n"] + _items(size, lambda i: _email(i) + "\n")
+    path = _write(tmp, "emails.csv", "".join(lines).encode())
+    return partial(func, path), os.path.getsize(path)
+
+
+@_case("compile_schema", "compile_rules", sizes=_ONLY_1KB)
+def _compile_case(func, size, tmp):
+    if func.__name__ == "compile_rules":
+        return partial(func, _RULES), len(repr(_RULES))
+    cache = sys.modules["montykit.validators"]._SCHEMA_CACHE
+
+    def compile_uncached():
+        cache.clear()
+        return func(_SCHEMA)
+    return compile_uncached, len(json.dumps(_SCHEMA))
+
+
+@_case("schema_validator", "schema_batch_validator")
+def _schema_case(func, size, tmp):
+    documents = _items(size, lambda i: json.dumps(_document(i)))
+    documents = [json.loads(document) for document in documents]
+    if func.__name__ == "schema_batch_validator":
+        return partial(func, documents, _SCHEMA), size
+    return lambda: [func(document, _SCHEMA) for document in documents], size
+
+
+@_case("validate_records", "validate_columns")
+def _rules_case(func, size, tmp):
+    records = [dict(_document(i), name="Tyler") for i in
+               range(len(_items(size, lambda i: json.dumps(_document(i)))))]
+    if func.__name__ == "validate_columns":
+        columns = {field: [record[field] for record in records] for field in records[0]}
+        return partial(func, columns, _RULES), size
+    return partial(func, records, _RULES), size
+
+
+@_case("build_password_list")
+def _build_password_list_case(func, size, tmp):
+    passwords = _items(size, _password)
+    return partial(func, passwords, os.path.join(tmp, "common.txt")), size
+
+
+@_case("password_in_list", "audit_passwords")
+def _password_list_case(func, size, tmp):
+    path = os.path.join(tmp, "common.txt")
+    montykit.build_password_list([f"password{i}" for i in range(100_000)], path)
+    passwords = _items(size, _password)
+    if func.__name__ == "audit_passwords":
+        return partial(func, passwords, path), size
+    return lambda: [func(password, path) for password in passwords], size
+
+
+def public_functions() -> list[str]:
+    """Lists the public montykit names that are not submodules."""
+    return [name for name in montykit.__all__ if name not in montykit._SUBMODULES]
+
+
+def missing_cases() -> list[str]:
+    """Lists public functions that have no benchmark case."""
+    return [name for name in public_functions() if name not in _CASES]
+
+
+def _percentile(ordered: list, fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run_case(name: str, size: str, min_time: float = 0.2, min_runs: int = 3,
+             max_runs: int = 100) -> dict:
+    """Benchmarks one public function at one input size.
+
+    Parameters
+    ----------
+    name : str
+        The name of the function in montykit.__all__
+    size : str
+        One of the labels in SIZES
+    min_time : float, optional
+        Keep timing until this many seconds have passed, by default 0.2
+    min_runs : int, optional
+        The minimum number of timed runs, by default 3
+    max_runs : int, optional
+        The maximum number of timed runs, by default 100
+
+    Returns
+    -------
+    dict
+        The timings, throughput and peak memory, or an "error"/"skipped"
+        reason if the function could not be run
+    """
+    result = {"name": name, "size": size}
+    builder, _ = _CASES[name]
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            func, nbytes = builder(getattr(montykit, name), SIZES[size], tmp)
+            func()  # warm-up, also pays for lazy imports and caches
+            times = []
+            started = time.perf_counter()
+            while len(times) < max_runs and (
+                    len(times) < min_runs or time.perf_counter() - started < min_time):
+                start = time.perf_counter()
+                func()
+                times.append(time.perf_counter() - start)
+            tracemalloc.start()
+            try:
+                func()
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        except Skip as exc:
+            result["skipped"] = str(exc)
+            return result
+        except Exception as exc:
+            result["error"] = f"{type(exc).__name__}: {' '.join(str(exc).split())[:200]}"
+            return result
+
+    times.sort()
+    result.update({
+        "bytes": nbytes,
+        "runs": len(times),
+        "mean_ms": sum(times) / len(times) * 1000,
+        "p50_ms": _percentile(times, 0.50) * 1000,
+        "p90_ms": _percentile(times, 0.90) * 1000,
+        "p99_ms": _percentile(times, 0.99) * 1000,
+        "throughput_mb_s": nbytes / _percentile(times, 0.50) / 1e6,
+        "peak_kb": peak / 1024,
+    })
+    return result
+
+
+def run_suite(sizes=_SMALL, pattern: str = None, min_time: float = 0.2,
+              progress=None) -> dict:
+    """Runs every matching case at the requested sizes it supports.
+
+    Returns
+    -------
+    dict
+        {"meta": run information, "results": list of run_case results}
+    """
+    matcher = re.compile(pattern) if pattern else None
+    results = []
+    for name in public_functions():
+        if matcher and not matcher.search(name):
+            continue
+        for size in _CASES[name][1]:
+            if size in sizes:
+                results.append(run_case(name, size, min_time=min_time))
+                if progress:
+                    progress(results[-1])
+    return {
+        "meta": {
+            "montykit": montykit.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        },
+        "results": results,
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float = 0.25) -> list[dict]:
+    """Finds runs that got slower or use more memory than the baseline.
+
+    Parameters
+    ----------
+    results : dict
+        The output of run_suite
+    baseline : dict
+        An earlier output of run_suite
+    threshold : float, optional
+        The allowed relative increase in median latency or peak memory,
+        by default 0.25 (25%)
+
+    Returns
+    -------
+    list of dict
+        One entry per regression with the name, size, metric, baseline
+        value, current value and their ratio
+    """
+    previous = {(r["name"], r["size"]): r for r in baseline["results"] if "p50_ms" in r}
+    regressions = []
+    for result in results["results"]:
+        old = previous.get((result["name"], result["size"]))
+        if old is None or "p50_ms" not in result:
+            continue
+        for metric in ("p50_ms", "peak_kb"):
+            if old[metric] > 0 and result[metric] > old[metric] * (1 + threshold):
+                regressions.append({"name": result["name"], "size": result["size"],
+                                    "metric": metric, "baseline": old[metric],
+                                    "current": result[metric],
+                                    "ratio": result[metric] / old[metric]})
+    return regressions
+
+
+def _print_result(result: dict) -> None:
+    label = f"{result['name']} [{result['size']}]"
+    if "p50_ms" not in result:
+        print(f"{label:<40} {result.get('skipped') or result.get('error')}", flush=True)
+        return
+    print(f"{label:<40} p50 {result['p50_ms']:10.3f} ms  p99 {result['p99_ms']:10.3f} ms"
+          f"  {result['throughput_mb_s']:9.2f} MB/s  peak {result['peak_kb']:10.1f} KiB",
+          flush=True)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(_SMALL),
+                        help="comma-separated sizes from 1KB,1MB,100MB (default 1KB,1MB)")
+    parser.add_argument("--filter", help="only run functions matching this regex")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="seconds to keep timing each case (default 0.2)")
+    parser.add_argument("-o", "--output", help="save the results as JSON")
+    parser.add_argument("--baseline", help="compare against an earlier JSON result")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="relative slowdown counted as a regression (default 0.25)")
+    args = parser.parse_args(argv)
+
+    sizes = tuple(args.sizes.split(","))
+    unknown = set(sizes) - set(SIZES)
+    if unknown:
+        parser.error(f"unknown sizes: {', '.join(sorted(unknown))}")
+    results = run_suite(sizes, args.filter, args.min_time, progress=_print_result)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if not args.baseline:
+        return 0
+    with open(args.baseline) as f:
+        regressions = compare(results, json.load(f), args.threshold)
+    for r in regressions:
+        print(f"REGRESSION {r['name']} [{r['size']}] {r['metric']}: "
+              f"{r['baseline']:.3f} -> {r['current']:.3f} ({r['ratio']:.2f}x)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
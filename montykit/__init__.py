@@ -1,39 +1,89 @@
 __version__ = "0.1.0"
 
-from . import analysis
-from . import ciphers
-from . import converters
-from . import generator
-from . import hash
-from . import validators
-
-from .analysis import (detect_lang, text_difficulty, text_is_difficult,
-                       text_polarity, text_subjectivity, word_freq,)
-from .ciphers import (a1z26_cipher, atbash_cipher, bacon_cipher, caesar_cipher,
-                      eng_to_imct, eng_to_morse, morse_to_eng,
-                      rail_fence_2_cipher, reverse_cipher, rot13, shift_cipher,
-                      substitution_cipher,)
-from .converters import (base64_decode, base64_encode, binary_to_text,
-                         hex_to_text, text_to_binary, text_to_hex, text_to_url,
-                         to_camel_case, to_snake_case, url_to_text,)
-from .generator import (gen_first_name, gen_first_names, gen_full_name,
-                        gen_full_names, gen_id, gen_last_name, gen_last_names,
-                        gen_middle_name, gen_middle_names, gen_password,
-                        gen_phone, gen_uuid,)
-from .hash import (generate_hash,)
-from .validators import (is_email, is_strong_pass, json_validator,)
-
-__all__ = ['a1z26_cipher', 'analysis', 'atbash_cipher', 'bacon_cipher',
-           'base64_decode', 'base64_encode', 'binary_to_text', 'caesar_cipher',
-           'ciphers', 'converters', 'detect_lang', 'eng_to_imct',
-           'eng_to_morse', 'gen_first_name', 'gen_first_names',
-           'gen_full_name', 'gen_full_names', 'gen_id', 'gen_last_name',
-           'gen_last_names', 'gen_middle_name', 'gen_middle_names',
-           'gen_password', 'gen_phone', 'gen_uuid', 'generate_hash',
-           'generator', 'hash', 'hex_to_text', 'is_email', 'is_strong_pass',
-           'json_validator', 'morse_to_eng', 'rail_fence_2_cipher',
-           'reverse_cipher', 'rot13', 'shift_cipher', 'substitution_cipher',
-           'text_difficulty', 'text_is_difficult', 'text_polarity',
-           'text_subjectivity', 'text_to_binary', 'text_to_hex', 'text_to_url',
-           'to_camel_case', 'to_snake_case', 'url_to_text', 'validators',
-           'word_freq']
+import os
+import sys
+
+# Submodules and the public names they provide. Nothing is imported until
+# one of these is first accessed, so `import montykit` stays cheap and
+# heavy dependencies (textblob, textstat) load only when needed.
+_SUBMODULES = {
+    "aio": (),
+    "analysis": (
+        "NgramCounter", "detect_lang", "text_difficulty", "text_is_difficult",
+        "text_polarity", "text_sentiment", "text_sentiments", "text_subjectivity",
+        "word_freq",
+    ),
+    "cache": (),
+    "ciphers": (
+        "a1z26_cipher", "atbash_cipher", "bacon_cipher", "caesar_cipher",
+        "eng_to_imct", "eng_to_morse", "morse_to_eng", "rail_fence_2_cipher",
+        "reverse_cipher", "rot13", "shift_cipher", "substitution_cipher",
+    ),
+    "converters": (
+        "base64_decode", "base64_encode", "binary_to_text", "hex_to_text",
+        "text_to_binary", "text_to_hex", "text_to_url", "to_camel_case",
+        "to_snake_case", "url_to_text",
+    ),
+    "corpus": (
+        "CorpusIndex",
+    ),
+    "dedup": (
+        "LSHIndex", "hamming_distance", "lsh_bands", "minhash", "minhash_duplicates",
+        "minhash_signatures", "minhash_similarity", "simhash", "simhash_duplicates",
+        "simhash_signatures",
+    ),
+    "generator": (
+        "gen_first_name", "gen_first_names", "gen_full_name", "gen_full_names",
+        "gen_id", "gen_last_name", "gen_last_names", "gen_middle_name",
+        "gen_middle_names", "gen_password", "gen_phone", "gen_record_batches",
+        "gen_records", "gen_strong_password", "gen_strong_passwords", "gen_ulid",
+        "gen_ulids", "gen_uuid", "gen_uuid7", "gen_uuids", "write_records",
+    ),
+    "hash": (
+        "MerkleTree", "chunk_file", "chunk_manifest", "diff_manifests",
+        "fnv1a_32", "fnv1a_64", "generate_hash", "generate_hashes",
+        "hash_file", "hash_file_multi", "hash_files", "hash_many",
+        "hash_stream", "jump_hash", "murmur3_32", "rendezvous_hash",
+        "verify_merkle_proof", "xxh32", "xxh64",
+    ),
+    "instrument": (),
+    "validators": (
+        "audit_passwords", "build_password_list", "compile_rules",
+        "compile_schema", "find_json_error", "is_email", "is_strong_pass",
+        "json_stream_validator", "json_validator", "jsonl_validator",
+        "password_in_list", "password_strength", "schema_batch_validator",
+        "schema_validator", "validate_columns", "validate_email_column",
+        "validate_emails", "validate_records",
+    ),
+}
+_ATTRIBUTES = {name: module for module, names in _SUBMODULES.items()
+               for name in names}
+
+__all__ = sorted([*_SUBMODULES, *_ATTRIBUTES])
+
+
+def _load(module: str):
+    # __import__ rather than importlib.import_module so the submodule shows
+    # up in `python -X importtime` profiles
+    __import__(f"{__name__}.{module}")
+    return sys.modules[f"{__name__}.{module}"]
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        value = _load(name)
+    elif name in _ATTRIBUTES:
+        value = getattr(_load(_ATTRIBUTES[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if os.environ.get("MONTYKIT_INSTRUMENT"):
+    from .instrument import _enable_from_environment
+    _enable_from_environment()
@@ -0,0 +1,261 @@
+"""
+asyncio versions of montykit functions
+
+Every public montykit function is available here as a coroutine function,
+e.g. ``await aio.text_polarity(text)``, which runs the real function on a
+shared executor so the event loop is never blocked. The executor is a
+thread pool by default; use configure("process") for CPU-heavy pure-Python
+work such as text analysis.
+"""
+
+import asyncio
+import functools
+import inspect
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+
+_CHUNK_SIZE = 1 << 20
+_EXECUTOR_KINDS = ("thread", "process")
+_executor = None
+_workers = None
+
+
+def configure(kind: str = "thread", max_workers: int = None) -> None:
+    """Replaces the shared executor that runs montykit functions.
+
+    Parameters
+    ----------
+    kind : str, optional
+        "thread" or "process", by default "thread"
+    max_workers : int, optional
+        The pool size, by default the cpu count (plus 4 for threads)
+
+    Raises
+    ------
+    ValueError
+        If the executor kind is not supported
+    """
+    global _executor, _workers
+    if kind not in _EXECUTOR_KINDS:
+        raise ValueError(f"Executor {kind} is not supported.")
+    cpus = os.cpu_count() or 1
+    if max_workers is None:
+        max_workers = min(32, cpus + 4) if kind == "thread" else cpus
+    old = _executor
+    if kind == "thread":
+        _executor = ThreadPoolExecutor(max_workers, thread_name_prefix="montykit")
+    else:
+        _executor = ProcessPoolExecutor(max_workers)
+    _workers = max_workers
+    if old is not None:
+        old.shutdown(wait=False)
+
+
+def shutdown(wait: bool = True) -> None:
+    """Shuts down the shared executor; the next call creates a new one."""
+    global _executor, _workers
+    if _executor is not None:
+        _executor.shutdown(wait=wait)
+    _executor = _workers = None
+
+
+def _get_executor():
+    if _executor is None:
+        configure()
+    return _executor
+
+
+async def run(func, *args, **kwargs):
+    """Runs any function on the shared executor and awaits its result.
+
+    With a process pool the function and its arguments must be picklable,
+    so use module-level functions rather than lambdas.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), functools.partial(func, *args, **kwargs))
+
+
+async def _ordered_window(start, items, limit: int):
+    """Starts start(item) for at most limit items at a time and yields the
+    results in input order."""
+    pending = deque()
+    try:
+        for item in items:
+            pending.append(asyncio.ensure_future(start(item)))
+            if len(pending) >= limit:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _default_limit() -> int:
+    _get_executor()
+    return _workers * 2
+
+
+async def imap_bounded(func, items, limit: int = None):
+    """Applies a function to many items on the shared executor.
+
+    At most limit calls are queued or running at once, so items can be a
+    lazy iterable of any length.
+
+    Parameters
+    ----------
+    func : callable
+        The function to call with each item
+    items : iterable
+        The items to process
+    limit : int, optional
+        The maximum number of calls in flight, by default twice the pool size
+
+    Yields
+    ------
+    object
+        The results, in the same order as items
+    """
+    loop = asyncio.get_running_loop()
+    executor = _get_executor()
+    window = _ordered_window(lambda item: loop.run_in_executor(executor, func, item),
+                             items, limit or _default_limit())
+    async for result in window:
+        yield result
+
+
+async def map_bounded(func, items, limit: int = None) -> list:
+    """Like imap_bounded, but returns all the results as a list."""
+    return [result async for result in imap_bounded(func, items, limit)]
+
+
+def _read_and_update(f, hashers, size: int) -> int:
+    """Reads one chunk and feeds it to every hasher, off the event loop."""
+    chunk = f.read(size)
+    for hasher in hashers:
+        hasher.update(chunk)
+    return len(chunk)
+
+
+async def stream_file(path, chunk_size: int = _CHUNK_SIZE):
+    """Reads a file in chunks on a worker thread.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The file to read
+    chunk_size : int, optional
+        The number of bytes per chunk, by default 1 MiB
+
+    Yields
+    ------
+    bytes
+        The file contents, one chunk at a time
+    """
+    loop = asyncio.get_running_loop()
+    f = await loop.run_in_executor(None, open, path, "rb")
+    try:
+        while True:
+            chunk = await loop.run_in_executor(None, f.read, chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    finally:
+        await loop.run_in_executor(None, f.close)
+
+
+async def hash_file(path, algorithm: str = "sha256", chunk_size: int = _CHUNK_SIZE) -> str:
+    """Hashes a file without blocking the event loop.
+
+    Each chunk is read and hashed in one hop to a worker thread (hashlib
+    releases the GIL on large buffers), and the task can be cancelled
+    between chunks.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The file to hash
+    algorithm : str, optional
+        The hashing algorithm to use, by default "sha256"
+    chunk_size : int, optional
+        The number of bytes read per chunk, by default 1 MiB
+
+    Returns
+    -------
+    str
+        The hexadecimal hash string
+
+    Raises
+    ------
+    ValueError
+        If the specified algorithm is not supported
+    OSError
+        If the file cannot be read
+    """
+    from .hash import _hash_constructor
+
+    hasher = _hash_constructor(algorithm)()
+    loop = asyncio.get_running_loop()
+    f = await loop.run_in_executor(None, open, path, "rb")
+    try:
+        while await loop.run_in_executor(None, _read_and_update, f, (hasher,), chunk_size):
+            pass
+    finally:
+        await loop.run_in_executor(None, f.close)
+    return hasher.hexdigest()
+
+
+async def hash_files(paths, algorithm: str = "sha256", limit: int = 4,
+                     chunk_size: int = _CHUNK_SIZE):
+    """Hashes many files, with at most limit files open at once.
+
+    Yields
+    ------
+    tuple
+        (path, hexadecimal hash string) pairs in input order
+    """
+    async def start(path):
+        return path, await hash_file(path, algorithm, chunk_size)
+    async for result in _ordered_window(start, paths, limit):
+        yield result
+
+
+def _collect(func, *args, **kwargs) -> list:
+    """Runs a generator function to completion (picklable for process pools)."""
+    return list(func(*args, **kwargs))
+
+
+def _async_version(name: str, func):
+    import montykit
+    generator = inspect.isgeneratorfunction(func)
+    returns = "a list of everything it yields" if generator else "its result"
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        # Looked up per call so instrumentation enabled later is picked up
+        current = getattr(montykit, name)
+        if generator:
+            return await run(_collect, current, *args, **kwargs)
+        return await run(current, *args, **kwargs)
+    wrapper.__doc__ = (f"Async version of montykit.{name}, run on the shared executor.\n\n"
+                       f"Awaiting it returns {returns}.")
+    return wrapper
+
+
+def __getattr__(name: str):
+    import montykit
+    if name in montykit._ATTRIBUTES:
+        func = getattr(montykit, name)
+        if inspect.isfunction(func):
+            wrapper = _async_version(name, func)
+            globals()[name] = wrapper
+            return wrapper
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    import montykit
+    return sorted(set(globals()) | {name for name in montykit._ATTRIBUTES
+                                    if name[0].islower()})
@@ -3,11 +3,418 @@ Utilities for basic text analysis.
 """
 
 from collections import Counter
+from functools import lru_cache, partial, wraps
+from itertools import islice
+from multiprocessing import Pool
+import heapq
+import math
 import re
-from textblob import TextBlob
-import textstat
 
 
+_PUNCTUATION = re.compile(r'[^\w\s]')
+_CHUNK_CACHE_SIZE = 1 << 16
+_ID_BITS = 32
+_ID_MASK = (1 << _ID_BITS) - 1
+_COLLOCATION_MEASURES = ("pmi", "llr")
+# Texts the sentiment fast path must score exactly like TextBlob
+_SENTIMENT_PROBES = (
+    "The movie was not very good, but the actors were really great!",
+    "I don't like it. It's NOT bad at all :) (!) but kinda sad :( ...",
+    "Mr. Smith was extremely happy!!! e.g. a terribly awful, horribly bad day.",
+    "\u201cQuoted\u201d isn't bad; really not good.\n\nNever a dull moment o.O xD <3",
+)
+
+# Set by montykit.cache.enable_cache
+_result_cache = None
+
+
+def _tokenize(text: str) -> list[str]:
+    """Splits text into lowercase words with punctuation removed."""
+    return _PUNCTUATION.sub('', text.lower()).split()
+
+
+def _cached(func):
+    """Serves a text function's results from the persistent cache when it
+    is enabled."""
+    @wraps(func)
+    def wrapper(text: str):
+        if _result_cache is None:
+            return func(text)
+        return _result_cache.call(func, text)
+    return wrapper
+
+
+def _trie_pattern(strings, separator: str = "", fragments=None) -> str:
+    """A regex matching any of strings, nested by shared prefixes so it only
+    branches where they differ, with separator allowed between characters.
+    Characters in fragments stand for the regex they map to."""
+    fragments = fragments or {}
+    tree = {}
+    for string in strings:
+        node = tree
+        for char in string:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node) -> str:
+        branches = [fragments.get(char, re.escape(char))
+                    + (separator + build(child) if set(child) != {""} else "")
+                    for char, child in sorted(node.items()) if char]
+        if "" in node:
+            branches.append("")
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    return build(tree)
+
+
+class _SentimentLexicon:
+    """TextBlob's pattern sentiment lexicon and tokenizer rules, flattened
+    into plain dicts and compiled regexes so scoring a text needs no
+    TextBlob objects."""
+
+    def __init__(self):
+        from textblob import _text
+        from textblob.en import sentiment
+
+        if not dict.__len__(sentiment):
+            sentiment.load()
+        # word -> (polarity, subjectivity, intensity, is an adverb modifier)
+        self.scores = {word: tuple(scores[None]) + ("RB" in scores,)
+                       for word, scores in dict.items(sentiment)}
+        self.negations = frozenset(sentiment.negations)
+        self.emoticons = {}
+        for (_, polarity), faces in _text.EMOTICONS.items():
+            for face in faces:
+                self.emoticons.setdefault(face.lower(), polarity)
+        self.punctuation = _text.PUNCTUATION
+        self.leading = tuple(_text.PUNCTUATION.replace(".", ""))
+        self.trailing = self.leading + (".",)
+        self.split_chars = frozenset(self.leading)
+        self.replacements = tuple(_text.replacements.items())
+        self.contractions = frozenset(_text.replacements)
+        self.quote_marks = "\u201c\u201d\u2018\u2019'\""
+        self.abbreviations = frozenset(_text.ABBREVIATIONS)
+        self.abbreviation_patterns = (_text.RE_ABBR1, _text.RE_ABBR2, _text.RE_ABBR3)
+        self.end_of_sentence = _text.EOS
+        self.linebreak = re.compile(r"\n{2,}")
+        self.sarcasm = _text.RE_SARCASM
+        self.emoticon = _text.RE_EMOTICONS
+        # Tokenizing only inserts spaces, so an emoticon it splits up is
+        # still in the text with nothing but whitespace between its characters
+        faces = [face for faces in _text.EMOTICONS.values() for face in faces if len(face) > 1]
+        self.split_emoticon = re.compile(_trie_pattern(faces, r"\s*"))
+        self.face_pairs = frozenset(face[k:k + 2] for face in faces for k in range(len(face) - 1))
+        # Emoticons and "(!)" typed with spaces inside them span chunks, so
+        # text that holds one cannot be split chunk by chunk. An emoticon must
+        # end where pattern's regex needs it to, unless its last mark may be
+        # split off the word after it
+        gap, space, end = "\0", "\1", "\2"
+        spanning = [f"({gap}!{space})", f"(!{gap})"]
+        for face in faces:
+            for k in range(1, len(face)):
+                spanning.append(face[:k] + gap + space.join(face[k:])
+                                + ("" if face[-1] in _text.PUNCTUATION else end))
+        self.spanning = re.compile(_trie_pattern(spanning, fragments={
+            gap: r"\s+", space: r"\s*", end: "(?=[\\s" + re.escape(_text.PUNCTUATION) + "]|$)"}))
+        self.sentence_ends = frozenset(("...", ".", "!", "?", _text.EOS))
+        # A quote never closes a sentence: find_tokens checks quote balance
+        # against the sentence before adding its tokens, so always stops there
+        self.closing = frozenset(("\u201d", "\u2019", "...", ".", "!", "?", ")", _text.EOS))
+        self._marks = {mark: self._scored((mark,))[0][0] for mark in self.split_chars}
+        # Whitespace-separated chunk -> its words from _scored
+        self._words = {}
+
+    def _prepare(self, text: str) -> str:
+        """Spaces out contractions and quotes, and marks blank lines as
+        sentence ends."""
+        if "'" in text:
+            for contraction, spaced in self.replacements:
+                if contraction in text:
+                    text = text.replace(contraction, spaced)
+        for quote in self.quote_marks:
+            if quote in text:
+                text = text.replace(quote, f" {quote} ")
+        if "\n" in text:
+            text = self.linebreak.sub(f" {self.end_of_sentence} ", text.replace("\r\n", "\n"))
+        return text
+
+    def _split(self, token: str, tokens: list) -> None:
+        """Splits leading and trailing punctuation off one token, exactly as
+        pattern's find_tokens does."""
+        tail = []
+        while token.startswith(self.leading) and token not in self.contractions:
+            tokens.append(token[0])
+            token = token[1:]
+        while token.endswith(self.trailing) and token not in self.contractions:
+            if token.endswith(self.leading):
+                tail.append(token[-1])
+                token = token[:-1]
+            if token.endswith("..."):
+                tail.append("...")
+                token = token[:-3].rstrip(".")
+            if token.endswith("."):
+                if token in self.abbreviations or any(
+                        pattern.match(token) for pattern in self.abbreviation_patterns):
+                    break
+                tail.append(token[-1])
+                token = token[:-1]
+        if token:
+            tokens.append(token)
+        tokens.extend(reversed(tail))
+
+    def _tokens(self, text: str) -> list:
+        tokens = []
+        append, split_chars, abbreviations = tokens.append, self.split_chars, self.abbreviations
+        for token in text.split():
+            if token.isalnum():
+                append(token)
+                continue
+            # Fast path for a word followed by one punctuation mark, which
+            # cannot be an abbreviation unless it is short or capitalized
+            body, last = token[:-1], token[-1]
+            if body.isalnum() and (last in split_chars or (
+                    last == "." and len(token) > 2 and token[0].islower()
+                    and token not in abbreviations)):
+                append(body)
+                append(last)
+            else:
+                self._split(token, tokens)
+        return tokens
+
+    def _sentences(self, tokens: list) -> list:
+        """Groups tokens into sentences like find_tokens: each ends at a
+        ".", "!", "?", "..." or blank line plus any closing marks after it.
+        The end-of-sentence markers left by blank lines are dropped."""
+        sentences, start, stop = [], 0, 0
+        ends, closing = self.sentence_ends, self.closing
+        for index in [k for k, token in enumerate(tokens) if token in ends]:
+            if index < stop:
+                continue
+            stop = index
+            while stop < len(tokens) and tokens[stop] in closing:
+                stop += 1
+            sentences.append(tokens[start:stop])
+            start = stop
+        sentences.append(tokens[start:])
+        eos = self.end_of_sentence
+        return [" ".join(token for token in sentence if token != eos)
+                for sentence in sentences if sentence and sentence != [eos]]
+
+    def _regroup(self, text: str) -> list:
+        """The lowercase words of prepared text with emoticons or "(!)" that
+        may span chunks."""
+        tokens = []
+        for chunk in text.split():
+            tokens.extend(self._tokens(chunk))
+        # Emoticons are rejoined, but only within a sentence
+        sentences = self._sentences(tokens)
+        for k, sentence in enumerate(sentences):
+            sentences[k] = self._rejoin(sentence)
+        return " ".join(sentences).lower().split()
+
+    def _rejoin(self, sentence: str) -> str:
+        """Rejoins the "(!)" and emoticons tokenizing split up."""
+        if "!" in sentence:
+            sentence = self.sarcasm.sub("(!)", sentence)
+        if self.split_emoticon.search(sentence):
+            sentence = self.emoticon.sub(lambda m: m.group(1).replace(" ", "") + m.group(2), sentence)
+        return sentence
+
+    def _inert(self, word: str, entry) -> bool:
+        """Whether score can skip word when no modifier or negation is
+        pending: it is not in the lexicon, not a negation and not a mark
+        that scores."""
+        if entry is not None or word in self.negations:
+            return False
+        if word.isalpha():
+            return True
+        return word not in ("!", "(!)") and (
+            word not in self.emoticons or len(word) > 5 or word in self.punctuation)
+
+    def _scored(self, words) -> tuple:
+        """(word, lexicon entry, inert) triples for words, and whether they
+        are all inert."""
+        scored = tuple((word, self.scores.get(word)) for word in words)
+        scored = tuple((word, entry, self._inert(word, entry)) for word, entry in scored)
+        return scored, all(inert for _, _, inert in scored)
+
+    def _chunk_group(self, chunk: str) -> tuple:
+        """The words of one whitespace-separated chunk, from _scored."""
+        if chunk.isalnum():
+            # One token, with nothing to split off or rejoin
+            word = chunk.lower()
+            entry = self.scores.get(word)
+            inert = entry is None and word.isalpha() and word not in self.negations
+            return ((word, entry, inert),), inert
+        body, last = chunk[:-1], chunk[-1]
+        if last in self.split_chars and body.isalnum() and chunk[-2:] not in self.face_pairs:
+            # A word and one mark that do not make an emoticon together
+            word = body.lower()
+            entry = self.scores.get(word)
+            scored = (word, entry, self._inert(word, entry)), self._marks[last]
+            return scored, scored[0][2] and scored[1][2]
+        eos = self.end_of_sentence
+        joined = " ".join(token for token in self._tokens(chunk) if token != eos)
+        return self._scored(self._rejoin(joined).lower().split())
+
+    def _groups(self, text: str) -> list:
+        """The lowercase words pattern's sentiment scorer sees for text, in
+        groups from _scored.
+
+        Unless an emoticon or "(!)" could reach across whitespace, each
+        whitespace-separated chunk splits into the same words wherever it
+        appears, so common chunks like "good," are only split once.
+        """
+        text = self._prepare(text)
+        eos = self.end_of_sentence
+        # Sentence marks are dropped before emoticons are rejoined, so one
+        # can span a blank line too
+        if self.spanning.search(text.replace(eos, " ") if eos in text else text):
+            return [self._scored(self._regroup(text))]
+        cache = self._words
+        if len(cache) > _CHUNK_CACHE_SIZE:
+            cache.clear()
+        chunks = text.split()
+        groups = list(map(cache.get, chunks))
+        if None in groups:
+            for k, group in enumerate(groups):
+                if group is None:
+                    groups[k] = cache[chunks[k]] = self._chunk_group(chunks[k])
+        return groups
+
+    def score(self, text: str) -> tuple:
+        """Replays pattern's Sentiment.assessments over the tokens: a
+        modifier ("very") scales the next known word by its intensity, a
+        negation ("not") flips and halves it, "!" boosts it, and emoticons
+        and "(!)" count as words of their own."""
+        negations, emoticons, punctuation = self.negations, self.emoticons, self.punctuation
+        found = []  # [polarity, subjectivity, intensity, negated]
+        modifier = negation = None
+        for words, inert in self._groups(text):
+            if inert and negation is None and modifier is None:
+                continue
+            for word, entry, quiet in words:
+                if quiet and negation is None and modifier is None:
+                    continue
+                if entry is not None:
+                    p, s, i, is_modifier = entry
+                    if modifier is None:
+                        found.append([p, s, i, False])
+                    else:
+                        last = found[-1]
+                        p *= last[2]
+                        s *= last[2]
+                        last[0] = -1.0 if p < -1.0 else 1.0 if p > 1.0 else p
+                        last[1] = -1.0 if s < -1.0 else 1.0 if s > 1.0 else s
+                        last[2] = i
+                    if negation is not None:
+                        found[-1][2] = 1.0 / found[-1][2]
+                        found[-1][3] = True
+                    modifier = word if is_modifier else None
+                    negation = word if word in negations else None
+                    continue
+                if negation is None and modifier is None and word.isalpha():
+                    if word in negations:
+                        negation = word
+                    continue
+                if word in negations:
+                    negation = word
+                elif negation is not None and len(word.strip("'")) > 1:
+                    negation = None
+                if modifier is not None:
+                    if negation is not None and modifier.endswith("ly"):
+                        found[-1][3] = True
+                        negation = None
+                    elif len(word) > 2:
+                        modifier = None
+                if word.isalpha():
+                    continue
+                if word == "!":
+                    if found:
+                        p = found[-1][0] * 1.25
+                        found[-1][0] = -1.0 if p < -1.0 else 1.0 if p > 1.0 else p
+                elif word == "(!)":
+                    found.append([0.0, 1.0, 1.0, False])
+                polarity = emoticons.get(word)
+                if polarity is not None and len(word) <= 5 and word not in punctuation:
+                    found.append([polarity, 1.0, 1.0, False])
+        if not found:
+            return 0.0, 0.0
+        polarity = sum(p * -0.5 if negated else p for p, _, _, negated in found)
+        return polarity / len(found), sum(entry[1] for entry in found) / len(found)
+
+
+class _TextBlobScorer:
+    """Scores with TextBlob itself, for TextBlob versions whose lexicon or
+    tokenizer the fast path does not reproduce."""
+
+    def score(self, text: str) -> tuple:
+        from textblob import TextBlob
+        return tuple(TextBlob(text).sentiment)
+
+
+@lru_cache(maxsize=1)
+def _lexicon():
+    """The fast path, or TextBlob itself if the installed version's private
+    internals changed so that the fast path no longer matches it."""
+    from textblob import TextBlob
+
+    close = partial(math.isclose, abs_tol=1e-9)
+    try:
+        lexicon = _SentimentLexicon()
+        for text in _SENTIMENT_PROBES:
+            if not all(map(close, lexicon.score(text), TextBlob(text).sentiment)):
+                return _TextBlobScorer()
+    except (AttributeError, ImportError, KeyError, TypeError, ValueError):
+        return _TextBlobScorer()
+    return lexicon
+
+
+def _sentiment(text: str) -> tuple:
+    return _lexicon().score(text)
+
+
+def text_sentiment(text: str) -> tuple:
+    """Scores how positive and how subjective the text is in one pass.
+
+    Parameters
+    ----------
+    text : str
+        The text to score
+
+    Returns
+    -------
+    tuple
+        (polarity, subjectivity), the same values text_polarity and
+        text_subjectivity return
+    """
+    return _sentiment(text)
+
+
+def text_sentiments(texts) -> list:
+    """Scores many texts, loading the sentiment lexicon only once.
+
+    How each whitespace-separated chunk ("good,", "not") splits into words
+    is cached, so the speedup over TextBlob grows with how often chunks
+    repeat. benchmarks/bench_analysis.py measures roughly 6-11x on fresh
+    review-like text and 9-14x once its chunks have been seen, depending
+    on the machine, so 10x is not reached on every machine. If the installed TextBlob scores differently from the
+    fast path, TextBlob itself is used.
+
+    Parameters
+    ----------
+    texts : iterable of str
+        The texts to score
+
+    Returns
+    -------
+    list of tuple
+        One (polarity, subjectivity) pair per text, in input order
+    """
+    score = _lexicon().score
+    return [score(text) for text in texts]
+
+
+@_cached
 def text_polarity(text: str) -> float:
     """Tests how positive or negative the text is.
 
@@ -21,9 +428,10 @@ def text_polarity(text: str) -> float:
     float
         The polarity score ranging from -1.0 (negative) to 1.0 (positive)
     """
-    return TextBlob(text).sentiment.polarity
+    return _sentiment(text)[0]
 
 
+@_cached
 def text_subjectivity(text: str) -> float:
     """Tests how subjective the text is.
 
@@ -37,7 +445,7 @@ def text_subjectivity(text: str) -> float:
     float
         The subjectivity score ranging from 0.0 (objective) to 1.0 (subjective)
     """
-    return TextBlob(text).sentiment.subjectivity
+    return _sentiment(text)[1]
 
 
 def word_freq(text: str) -> dict:
@@ -53,8 +461,7 @@ def word_freq(text: str) -> dict:
     dict
         Example: {"happy": 10, "sad": 2, "sleep": 1}
     """
-    clean_text = re.sub(r'[^\w\s]', '', text.lower())
-    return dict(Counter(clean_text.split()))
+    return dict(Counter(_tokenize(text)))
 
 
 def detect_lang(text: str) -> str:
@@ -70,9 +477,11 @@ def detect_lang(text: str) -> str:
     str
         The detected ISO 639-1 language code (e.g., 'en')
     """
+    from textblob import TextBlob
     return TextBlob(text).detect_language()
 
 
+@_cached
 def text_difficulty(text: str) -> dict:
     """Determines the difficulty of text using multiple readability metrics.
 
@@ -86,6 +495,7 @@ def text_difficulty(text: str) -> dict:
     dict
         A dictionary mapping various readability metrics to their values
     """
+    import textstat
     return {
         "flesch_reading_ease": textstat.flesch_reading_ease(text),
         "flesch_kincaid_grade": textstat.flesch_kincaid_grade(text),
@@ -96,6 +506,7 @@ def text_difficulty(text: str) -> dict:
     }
 
 
+@_cached
 def text_is_difficult(text: str) -> bool:
     """Determines if text has a grade level of 13 or over.
 
@@ -109,4 +520,275 @@ def text_is_difficult(text: str) -> bool:
     bool
         True if the Flesch-Kincaid grade is 13 or higher, False otherwise
     """
+    import textstat
     return textstat.flesch_kincaid_grade(text) >= 13
+
+
+def _pack(ids) -> int:
+    """Packs word ids into one int, _ID_BITS bits per word."""
+    key = 0
+    for word_id in ids:
+        key = key << _ID_BITS | word_id
+    return key
+
+
+def _unpack(key: int, n: int) -> list:
+    return [key >> (_ID_BITS * (n - 1 - k)) & _ID_MASK for k in range(n)]
+
+
+def _log_likelihood(together: int, first: int, second: int, total: int) -> float:
+    """Dunning's log-likelihood ratio (G2) of a bigram's 2x2 contingency table.
+
+    The margins are word counts rather than bigram counts, so with repeated
+    words ("a a a") the last cell can come out negative. It is clamped to
+    zero and the expected counts are taken from the table's own margins,
+    which keeps every expected count positive wherever a cell is observed.
+    """
+    table = ((together, first - together),
+             (second - together, max(0, total - first - second + together)))
+    rows = [sum(row) for row in table]
+    columns = [sum(column) for column in zip(*table)]
+    size = sum(rows)
+    return 2 * sum(table[i][j] * math.log(table[i][j] * size / (rows[i] * columns[j]))
+                   for i in range(2) for j in range(2) if table[i][j] > 0)
+
+
+class NgramCounter:
+    """Counts the words and n-grams of up to n words in a stream of texts.
+
+    Words are tokenized like word_freq and interned to integer ids, and each
+    n-gram is stored as one int packing its word ids, so counts take far
+    less memory than tuples of strings. N-grams never span two texts. Once
+    an order of 2 or more words holds more than max_ngrams distinct
+    n-grams, the rarest are pruned, at the cost of undercounting n-grams
+    that were rare early on. Only those orders are capped: the vocabulary
+    and word counts grow with the number of distinct words.
+
+    Parameters
+    ----------
+    n : int, optional
+        The longest n-gram to count, by default 2
+    max_ngrams : int, optional
+        The most distinct n-grams of 2 or more words kept per order before
+        pruning, by default 1,000,000
+    """
+
+    def __init__(self, n: int = 2, max_ngrams: int = 1_000_000):
+        if n < 1:
+            raise ValueError(f"N-grams of {n} words are not supported.")
+        self.n = n
+        self.max_ngrams = max_ngrams
+        self.total = 0
+        self.pruned = False
+        # Word -> id, in order of first appearance
+        self._vocab = {}
+        self._words = []
+        # Order -> Counter of packed n-gram -> count
+        self._counts = {order: Counter() for order in range(1, n + 1)}
+
+    @property
+    def vocabulary_size(self) -> int:
+        """The number of distinct words."""
+        return len(self._vocab)
+
+    def _word_list(self) -> list:
+        if len(self._words) < len(self._vocab):
+            self._words = list(self._vocab)
+        return self._words
+
+    def add(self, text: str) -> None:
+        """Counts the words and n-grams of one text."""
+        vocab = self._vocab
+        setdefault = vocab.setdefault
+        ids = [setdefault(word, len(vocab)) for word in _tokenize(text)]
+        self.total += len(ids)
+        self._counts[1].update(ids)
+        keys = ids
+        for order in range(2, self.n + 1):
+            # Each n-gram's key extends the key of the (n-1)-gram before it
+            keys = [key << _ID_BITS | word_id for key, word_id in zip(keys, ids[order - 1:])]
+            if not keys:
+                break
+            counts = self._counts[order]
+            counts.update(keys)
+            if len(counts) > self.max_ngrams:
+                self._prune(order)
+
+    def add_many(self, texts) -> None:
+        """Counts the words and n-grams of every text."""
+        for text in texts:
+            self.add(text)
+
+    def add_file(self, path, encoding: str = "utf-8") -> None:
+        """Counts a text file line by line, treating each line as a text."""
+        with open(path, encoding=encoding) as f:
+            for line in f:
+                self.add(line)
+
+    def _prune(self, order: int) -> None:
+        """Keeps only the most frequent half of max_ngrams n-grams of one
+        order, and at least one. N-grams tied at the boundary count are kept
+        in the order they were first seen."""
+        counts = self._counts[order]
+        target = max(1, self.max_ngrams // 2)
+        histogram = Counter(counts.values())
+        kept, boundary = 0, 0
+        for count in sorted(histogram, reverse=True):
+            if kept + histogram[count] > target:
+                boundary = count
+                break
+            kept += histogram[count]
+        ties = islice((key for key, c in counts.items() if c == boundary), target - kept)
+        pruned = Counter({key: c for key, c in counts.items() if c > boundary})
+        pruned.update(dict.fromkeys(ties, boundary))
+        self._counts[order] = pruned
+        self.pruned = True
+
+    def prune(self, min_count: int) -> None:
+        """Drops every n-gram of two or more words seen fewer than min_count
+        times. Word counts are kept for scoring collocations."""
+        for order in range(2, self.n + 1):
+            counts = self._counts[order]
+            self._counts[order] = Counter({key: c for key, c in counts.items() if c >= min_count})
+        self.pruned = True
+
+    def merge(self, other: "NgramCounter") -> None:
+        """Adds the counts of another counter, such as one built by another
+        worker, mapping its word ids onto this counter's."""
+        if other.n > self.n:
+            raise ValueError(f"Cannot merge {other.n}-grams into a counter of {self.n}-grams.")
+        vocab = self._vocab
+        ids = [vocab.setdefault(word, len(vocab)) for word in other._word_list()]
+        self.total += other.total
+        self.pruned = self.pruned or other.pruned
+        self._counts[1].update({ids[key]: c for key, c in other._counts[1].items()})
+        for order in range(2, other.n + 1):
+            counts = self._counts[order]
+            counts.update({_pack([ids[word_id] for word_id in _unpack(key, order)]): c
+                           for key, c in other._counts[order].items()})
+            if len(counts) > self.max_ngrams:
+                self._prune(order)
+
+    def _key(self, words):
+        if isinstance(words, str):
+            words = _tokenize(words)
+        ids = [self._vocab.get(word) for word in words]
+        if not ids or len(ids) > self.n or None in ids:
+            return None, ids
+        return _pack(ids), ids
+
+    def count(self, words) -> int:
+        """The number of times an n-gram was seen.
+
+        Parameters
+        ----------
+        words : str or sequence of str
+            The n-gram, as text ("new york") or as words
+
+        Returns
+        -------
+        int
+            Its count, 0 if it was never seen or has been pruned
+        """
+        key, ids = self._key(words)
+        return 0 if key is None else self._counts[len(ids)][key]
+
+    def most_common(self, k: int = 10, order: int = None) -> list:
+        """The k most frequent n-grams of one order, by default n.
+
+        Returns
+        -------
+        list of tuple
+            (words, count) pairs, most frequent first
+        """
+        order = self.n if order is None else order
+        if order not in self._counts:
+            raise ValueError(f"N-grams of {order} words are not supported.")
+        words = self._word_list()
+        return [(tuple(words[word_id] for word_id in _unpack(key, order)), count)
+                for key, count in self._counts[order].most_common(k)]
+
+    def collocations(self, k: int = 20, measure: str = "pmi", min_count: int = 3) -> list:
+        """Ranks bigrams by how much more often their words appear together
+        than chance would predict.
+
+        Parameters
+        ----------
+        k : int, optional
+            The number of bigrams to return, by default 20
+        measure : str, optional
+            "pmi" (pointwise mutual information, in bits) or "llr"
+            (Dunning's log-likelihood ratio), by default "pmi"
+        min_count : int, optional
+            Bigrams seen fewer times are skipped, since PMI overrates rare
+            pairs, by default 3
+
+        Returns
+        -------
+        list of tuple
+            ((first, second), score) pairs, highest score first
+
+        Raises
+        ------
+        ValueError
+            If the measure is not supported or the counter's n is below 2
+        """
+        if measure not in _COLLOCATION_MEASURES:
+            raise ValueError(f"Measure {measure} is not supported.")
+        if self.n < 2:
+            raise ValueError("Collocations need a counter of at least 2-grams.")
+        unigrams, total = self._counts[1], self.total
+        scored = []
+        for key, count in self._counts[2].items():
+            if count < min_count:
+                continue
+            first, second = unigrams[key >> _ID_BITS], unigrams[key & _ID_MASK]
+            if measure == "pmi":
+                score = math.log2(count * total / (first * second))
+            else:
+                score = _log_likelihood(count, first, second, total)
+            scored.append((score, key))
+        words = self._word_list()
+        return [((words[key >> _ID_BITS], words[key & _ID_MASK]), score)
+                for score, key in heapq.nlargest(k, scored)]
+
+    @classmethod
+    def from_files(cls, paths, n: int = 2, max_ngrams: int = 1_000_000, workers: int = 1,
+                   encoding: str = "utf-8") -> "NgramCounter":
+        """Counts text files line by line, one file per worker process, and
+        merges the results.
+
+        Parameters
+        ----------
+        paths : iterable of str or os.PathLike
+            The files to count
+        n : int, optional
+            The longest n-gram to count, by default 2
+        max_ngrams : int, optional
+            The most distinct n-grams kept per order, by default 1,000,000
+        workers : int, optional
+            The number of processes, by default 1
+        encoding : str, optional
+            The files' encoding, by default "utf-8"
+
+        Returns
+        -------
+        NgramCounter
+            The combined counts
+        """
+        counter = cls(n, max_ngrams)
+        count_file = partial(_count_file, n=n, max_ngrams=max_ngrams, encoding=encoding)
+        if workers > 1:
+            with Pool(workers) as pool:
+                for partial_counts in pool.imap_unordered(count_file, paths):
+                    counter.merge(partial_counts)
+        else:
+            for path in paths:
+                counter.add_file(path, encoding)
+        return counter
+
+
+def _count_file(path, n: int, max_ngrams: int, encoding: str) -> NgramCounter:
+    counter = NgramCounter(n, max_ngrams)
+    counter.add_file(path, encoding)
+    return counter
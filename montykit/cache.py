@@ -0,0 +1,214 @@
+"""
+Persistent on-disk cache for expensive analysis results
+
+Results are stored in a SQLite database in WAL mode, keyed by a hash of the
+function name, the montykit/textblob/textstat versions and the input text,
+so upgrading a library never serves stale scores. Many processes can share
+one cache file, and the least recently used entries are evicted once it
+grows past its size limit.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+
+
+_DEFAULT_MAX_BYTES = 256 << 20
+_ROW_OVERHEAD = 48
+_EVICT_EVERY = 256
+_EVICT_TARGET = 0.9
+_TOUCH_INTERVAL = 300.0
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key BLOB PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed);
+"""
+
+
+@lru_cache(maxsize=None)
+def _library_versions() -> str:
+    """The versions of everything that can change an analysis result."""
+    from importlib import metadata
+    from . import __version__
+
+    versions = [f"montykit={__version__}"]
+    for package in ("textblob", "textstat"):
+        try:
+            versions.append(f"{package}={metadata.version(package)}")
+        except metadata.PackageNotFoundError:
+            versions.append(f"{package}=none")
+    return ";".join(versions)
+
+
+def default_path() -> str:
+    """The cache file used when none is given: $MONTYKIT_CACHE, or
+    montykit/results.sqlite in the user's cache directory."""
+    if os.environ.get("MONTYKIT_CACHE"):
+        return os.environ["MONTYKIT_CACHE"]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "montykit", "results.sqlite")
+
+
+class ResultCache:
+    """A size-bounded, process-safe cache of function results.
+
+    Each thread and each (forked) process opens its own connection, so one
+    ResultCache can be shared freely. Values must be JSON serializable.
+
+    Parameters
+    ----------
+    path : str or os.PathLike, optional
+        The SQLite file, by default default_path()
+    max_bytes : int, optional
+        The approximate size limit for stored results, by default 256 MiB
+    """
+
+    def __init__(self, path=None, max_bytes: int = _DEFAULT_MAX_BYTES):
+        self.path = os.fspath(path) if path is not None else default_path()
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._writes = 0
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        self._connection()
+
+    def _connection(self) -> sqlite3.Connection:
+        local = self._local
+        if getattr(local, "pid", None) != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            local.connection, local.pid = connection, os.getpid()
+        return local.connection
+
+    @staticmethod
+    def key(function: str, text: str) -> bytes:
+        """The cache key for one function call."""
+        digest = hashlib.sha256(f"{function}\0{_library_versions()}\0".encode())
+        digest.update(text.encode("utf-8", "surrogatepass"))
+        return digest.digest()
+
+    def get(self, function: str, text: str):
+        """Looks up a cached result.
+
+        Returns
+        -------
+        tuple
+            (True, value) on a hit, (False, None) on a miss
+        """
+        key = self.key(function, text)
+        connection = self._connection()
+        row = connection.execute("SELECT value, accessed FROM results WHERE key = ?",
+                                 (key,)).fetchone()
+        if row is None:
+            return False, None
+        now = time.time()
+        # Only touch entries that have not been used recently, so reads
+        # rarely need the write lock
+        if now - row[1] > _TOUCH_INTERVAL:
+            connection.execute("UPDATE results SET accessed = ? WHERE key = ?", (now, key))
+        return True, json.loads(row[0])
+
+    def set(self, function: str, text: str, value) -> None:
+        """Stores a result, evicting old entries if the cache is full."""
+        key = self.key(function, text)
+        encoded = json.dumps(value)
+        size = len(key) + len(encoded) + _ROW_OVERHEAD
+        self._connection().execute(
+            "INSERT OR REPLACE INTO results (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+            (key, encoded, size, time.time()))
+        self._writes += 1
+        if self._writes % _EVICT_EVERY == 0:
+            self.evict()
+
+    def call(self, func, text: str):
+        """Returns func(text), computing and storing it only on a miss."""
+        name = f"{func.__module__}.{func.__qualname__}"
+        hit, value = self.get(name, text)
+        if not hit:
+            value = func(text)
+            self.set(name, text, value)
+        return value
+
+    def size(self) -> int:
+        """The approximate number of bytes stored."""
+        return self._connection().execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def evict(self) -> int:
+        """Removes least recently used entries until the cache is back under
+        90% of max_bytes.
+
+        Returns
+        -------
+        int
+            The number of entries removed
+        """
+        connection = self._connection()
+        size = self.size()
+        if size <= self.max_bytes:
+            return 0
+        excess = size - int(self.max_bytes * _EVICT_TARGET)
+        # Delete the oldest entries until at least excess bytes are gone
+        removed = connection.execute(
+            """DELETE FROM results WHERE key IN (
+                   SELECT key FROM (
+                       SELECT key, SUM(size) OVER (ORDER BY accessed, key) - size AS older
+                       FROM results)
+                   WHERE older < ?)""", (excess,)).rowcount
+        return removed
+
+    def clear(self) -> None:
+        """Removes every entry."""
+        self._connection().execute("DELETE FROM results")
+
+    def close(self) -> None:
+        """Closes this thread's connection."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.pid = None
+
+
+def enable_cache(path=None, max_bytes: int = _DEFAULT_MAX_BYTES) -> ResultCache:
+    """Caches text_polarity, text_subjectivity, text_difficulty and
+    text_is_difficult results on disk.
+
+    Processes forked afterwards share the cache; spawned processes need to
+    call enable_cache themselves.
+
+    Parameters
+    ----------
+    path : str or os.PathLike, optional
+        The SQLite file, by default default_path()
+    max_bytes : int, optional
+        The approximate size limit, by default 256 MiB
+
+    Returns
+    -------
+    ResultCache
+        The cache now in use
+    """
+    from . import analysis
+
+    cache = ResultCache(path, max_bytes)
+    analysis._result_cache = cache
+    return cache
+
+
+def disable_cache() -> None:
+    """Stops caching analysis results. The cache file is left in place."""
+    from . import analysis
+
+    analysis._result_cache = None
@@ -0,0 +1,306 @@
+"""
+Command-line interface for montykit
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+from contextlib import nullcontext
+from functools import partial
+from importlib import import_module
+
+
+_CIPHERS = ("a1z26_cipher", "atbash_cipher", "bacon_cipher", "caesar_cipher",
+            "eng_to_imct", "eng_to_morse", "morse_to_eng", "rail_fence_2_cipher",
+            "reverse_cipher", "rot13", "shift_cipher", "substitution_cipher")
+_CONVERTERS = ("base64_decode", "base64_encode", "binary_to_text", "hex_to_text",
+               "text_to_binary", "text_to_hex", "text_to_url", "to_camel_case",
+               "to_snake_case", "url_to_text")
+# Cipher: ((keyword argument, command-line option), ...)
+_CIPHER_OPTIONS = {
+    "shift_cipher": (("shift", "shift"),),
+    "caesar_cipher": (("shift", "shift"), ("decrypt", "decrypt")),
+    "substitution_cipher": (("alphabet_key", "key"),),
+}
+_GENERATORS = {
+    "id": "gen_id",
+    "uuid": "gen_uuid",
+    "uuid7": "gen_uuid7",
+    "ulid": "gen_ulid",
+    "phone": "gen_phone",
+    "password": "gen_password",
+    "first_name": "gen_first_name",
+    "middle_name": "gen_middle_name",
+    "last_name": "gen_last_name",
+    "full_name": "gen_full_name",
+}
+_LINE_VALIDATORS = {"email": "is_email", "strong_pass": "is_strong_pass"}
+_ANALYZERS = {
+    "polarity": "text_polarity",
+    "subjectivity": "text_subjectivity",
+    "word_freq": "word_freq",
+    "lang": "detect_lang",
+    "difficulty": "text_difficulty",
+    "is_difficult": "text_is_difficult",
+}
+_READ_SIZE = 1 << 20
+
+
+def _function(module: str, name: str):
+    """Imports a single montykit submodule and returns one of its functions."""
+    return getattr(import_module(f"montykit.{module}"), name)
+
+
+def _open_input(path: str, binary: bool = False):
+    """Opens a file for reading, with "-" meaning stdin (left open)."""
+    if path == "-":
+        return nullcontext(sys.stdin.buffer if binary else sys.stdin)
+    return open(path, "rb" if binary else "r", encoding=None if binary else "utf-8")
+
+
+def _transform_lines(module, name, kwargs, lines, write) -> int:
+    func = _function(module, name)
+    for line in lines:
+        write(func(line.rstrip("\n"), **kwargs))
+        write("\n")
+    return 0
+
+
+def _filter_lines(module, name, keep_valid, lines, write) -> int:
+    func = _function(module, name)
+    invalid = 0
+    for line in lines:
+        line = line.rstrip("\n")
+        valid = bool(func(line))
+        invalid += not valid
+        if valid == keep_valid:
+            write(line)
+            write("\n")
+    return invalid
+
+
+def _analyze_file(name, path) -> tuple[str, int]:
+    with _open_input(path) as f:
+        result = _function("analysis", name)(f.read())
+    return json.dumps(result), 0
+
+
+def _check_json_file(path) -> tuple[str, int]:
+    with _open_input(path, binary=True) as f:
+        offset = _function("validators", "find_json_error")(f)
+    if offset is None:
+        return "", 0
+    return f"{path}: invalid JSON at byte {offset}", 1
+
+
+def _check_jsonl_file(path) -> tuple[str, int]:
+    if path == "-":
+        find_json_error = _function("validators", "find_json_error")
+        errors, position = [], 0
+        for line_no, line in enumerate(sys.stdin.buffer, 1):
+            record = line.rstrip(b"\r\n")
+            offset = find_json_error(record) if record.strip() else None
+            if offset is not None:
+                errors.append((line_no, position + offset))
+            position += len(line)
+    else:
+        errors = _function("validators", "jsonl_validator")(path)
+    return "\n".join(f"{path}:{line_no}: invalid JSON at byte {offset}"
+                     for line_no, offset in errors), len(errors)
+
+
+def _run_lines(task) -> tuple[str, int]:
+    """Runs a line command over one file, returning its output and failures."""
+    handler, path = task
+    out = io.StringIO()
+    with _open_input(path) as lines:
+        failures = handler(lines, out.write)
+    return out.getvalue(), failures
+
+
+def _run_whole(task) -> tuple[str, int]:
+    handler, path = task
+    return handler(path)
+
+
+def _map_files(worker, handler, paths, jobs):
+    """Maps worker over the input files in order, on a process pool if asked."""
+    tasks = [(handler, path) for path in paths]
+    if jobs > 1 and len(tasks) > 1 and "-" not in paths:
+        from multiprocessing import Pool
+        with Pool(min(jobs, len(tasks))) as pool:
+            yield from pool.imap(worker, tasks)
+    else:
+        yield from map(worker, tasks)
+
+
+def _process_lines(handler, paths, jobs, out) -> int:
+    """Streams line commands to out, one file after another."""
+    if jobs <= 1 or len(paths) == 1:
+        failures = 0
+        for path in paths:
+            with _open_input(path) as lines:
+                failures += handler(lines, out.write)
+        return failures
+    failures = 0
+    for text, failed in _map_files(_run_lines, handler, paths, jobs):
+        out.write(text)
+        failures += failed
+    return failures
+
+
+def _process_whole(handler, paths, jobs, out, prefix: bool) -> int:
+    """Runs whole-input commands, prefixing output with the file name when
+    there are several files."""
+    failures = 0
+    for path, (text, failed) in zip(paths, _map_files(_run_whole, handler, paths, jobs)):
+        if text:
+            out.write(f"{path}\t{text}\n" if prefix and len(paths) > 1 else f"{text}\n")
+        failures += failed
+    return failures
+
+
+def _cmd_lines(args, out) -> int:
+    module = "ciphers" if args.group == "cipher" else "converters"
+    options = {"shift": args.shift, "decrypt": args.decrypt, "alphabet_key": args.key}
+    kwargs = {}
+    for key, option in _CIPHER_OPTIONS.get(args.name, ()):
+        if options[key] is None:
+            raise ValueError(f"{args.name} requires --{option}.")
+        kwargs[key] = options[key]
+    return _process_lines(partial(_transform_lines, module, args.name, kwargs),
+                          args.files, args.jobs, out)
+
+
+def _cmd_hash(args, out) -> int:
+    hash_module = import_module("montykit.hash")
+    files = [path for path in args.files if path != "-"]
+    digests = dict(hash_module.hash_files(files, args.algorithm, workers=max(args.jobs, 1)))
+    for path in args.files:
+        if path == "-":
+            digests[path] = hash_module.hash_stream(sys.stdin.buffer, args.algorithm, _READ_SIZE)
+        out.write(f"{digests[path]}  {path}\n")
+    return 0
+
+
+def _cmd_gen(args, out) -> int:
+    generator = import_module("montykit.generator")
+    if args.name in ("uuid", "uuid7"):
+        values = generator.gen_uuids(args.amount, version=7 if args.name == "uuid7" else 4)
+    elif args.name == "ulid":
+        values = generator.gen_ulids(args.amount)
+    else:
+        func = getattr(generator, _GENERATORS[args.name])
+        if args.name in ("id", "password"):
+            func = partial(func, args.length) if args.length else func
+        elif args.name == "full_name":
+            func = partial(func, args.middle)
+        values = (func() for _ in range(args.amount))
+    for value in values:
+        out.write(value)
+        out.write("\n")
+    return 0
+
+
+def _cmd_validate(args, out) -> int:
+    if args.name in _LINE_VALIDATORS:
+        handler = partial(_filter_lines, "validators", _LINE_VALIDATORS[args.name], args.valid)
+        return _process_lines(handler, args.files, args.jobs, out)
+    handler = _check_json_file if args.name == "json" else _check_jsonl_file
+    return _process_whole(handler, args.files, args.jobs, out, prefix=False)
+
+
+def _cmd_analyze(args, out) -> int:
+    handler = partial(_analyze_file, _ANALYZERS[args.name])
+    return _process_whole(handler, args.files, args.jobs, out, prefix=True)
+
+
+def _add_io_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("files", nargs="*",
+                        help='input files, "-" or none for stdin')
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="number of files to process in parallel (default 1)")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="montykit",
+                                     description="General-purpose text utilities.")
+    groups = parser.add_subparsers(dest="group", metavar="command", required=True)
+
+    for group, names, help_text in [("cipher", _CIPHERS, "apply a cipher to each line"),
+                                    ("convert", _CONVERTERS, "convert each line")]:
+        sub = groups.add_parser(group, help=help_text)
+        sub.add_argument("name", choices=names)
+        sub.add_argument("--shift", type=int, help="shift for shift_cipher/caesar_cipher")
+        sub.add_argument("--decrypt", action="store_true", help="decrypt with caesar_cipher")
+        sub.add_argument("--key", help="alphabet key for substitution_cipher")
+        _add_io_arguments(sub)
+        sub.set_defaults(run=_cmd_lines)
+
+    sub = groups.add_parser("hash", help="hash files or stdin")
+    sub.add_argument("-a", "--algorithm", default="sha256")
+    _add_io_arguments(sub)
+    sub.set_defaults(run=_cmd_hash)
+
+    sub = groups.add_parser("gen", help="generate random values, one per line")
+    sub.add_argument("name", choices=tuple(_GENERATORS))
+    sub.add_argument("-n", "--amount", type=int, default=1)
+    sub.add_argument("--length", type=int, help="length for id/password")
+    sub.add_argument("--middle", action="store_true", help="include middle names")
+    sub.set_defaults(run=_cmd_gen)
+
+    sub = groups.add_parser("validate", help="validate lines or JSON documents")
+    sub.add_argument("name", choices=tuple(_LINE_VALIDATORS) + ("json", "jsonl"))
+    sub.add_argument("--valid", action="store_true",
+                     help="print valid lines instead of invalid ones")
+    _add_io_arguments(sub)
+    sub.set_defaults(run=_cmd_validate)
+
+    sub = groups.add_parser("analyze", help="analyze whole files and print JSON")
+    sub.add_argument("name", choices=tuple(_ANALYZERS))
+    _add_io_arguments(sub)
+    sub.set_defaults(run=_cmd_analyze)
+    return parser
+
+
+def main(argv=None) -> int:
+    """Runs the montykit command-line interface.
+
+    Only the submodule a command needs is imported. Line commands (cipher,
+    convert, validate email/strong_pass) stream their input line by line;
+    with several files and --jobs N the files are processed on N processes
+    and printed in order. Validation commands exit with status 1 if any
+    input is invalid.
+
+    Parameters
+    ----------
+    argv : list of str, optional
+        The arguments, by default sys.argv[1:]
+
+    Returns
+    -------
+    int
+        The exit status
+    """
+    parser = _build_parser()
+    # Files may follow options (`validate email --valid a.txt`), which a
+    # plain parse_args rejects once the positionals have been consumed
+    args, extra = parser.parse_known_args(argv)
+    if extra and (not hasattr(args, "files") or any(
+            arg.startswith("-") and arg != "-" for arg in extra)):
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    if hasattr(args, "files"):
+        args.files = (args.files or []) + extra or ["-"]
+    try:
+        status = args.run(args, sys.stdout)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`); silence the flush at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    except (OSError, ValueError) as exc:
+        print(f"montykit: error: {exc}", file=sys.stderr)
+        return 1
+    return 1 if status else 0
@@ -0,0 +1,405 @@
+"""
+Utilities for indexing and ranking text corpora
+"""
+
+import heapq
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections import Counter
+
+from .analysis import _tokenize
+
+
+_MAGIC = b"MKCORPUS"
+_FORMAT_VERSION = 1
+_METHODS = ("bm25", "tfidf")
+# Section name: array typecode, in file order
+_SECTIONS = {
+    "term_offsets": "Q",
+    "term_blob": "B",
+    "indptr": "Q",
+    "indices": "I",
+    "counts": "I",
+    "lengths": "I",
+    "post_indptr": "Q",
+    "post_docs": "I",
+    "post_tfs": "I",
+}
+
+
+class _MappedTerms:
+    """Read-only sorted UTF-8 terms stored as one blob plus offsets, which
+    bisect can search without decoding the whole vocabulary."""
+
+    def __init__(self, offsets, blob):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> bytes:
+        return bytes(self._blob[self._offsets[index]:self._offsets[index + 1]])
+
+
+def _writable(typecode: str, values):
+    """Copies a memory-mapped view into an appendable array."""
+    if isinstance(values, array):
+        return values
+    result = array(typecode)
+    result.frombytes(memoryview(values).cast("B"))
+    return result
+
+
+class CorpusIndex:
+    """An inverted index over a growing collection of documents.
+
+    Documents are tokenized like word_freq and stored as a sparse
+    document-term matrix in CSR arrays (indptr, term ids, counts). Each term
+    has a postings list of (document, count) pairs for ranking queries with
+    BM25 or TF-IDF. Saved indexes are memory-mapped on load, so opening
+    one is instant no matter its size, and more documents can be added
+    afterwards.
+
+    Parameters
+    ----------
+    k1 : float, optional
+        BM25 term frequency saturation, by default 1.5
+    b : float, optional
+        BM25 document length normalization, by default 0.75
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        # Terms of a loaded index, sorted, with ids 0..len-1
+        self._mapped_terms = _MappedTerms(array("Q", [0]), b"")
+        # Terms added since, with ids starting after the mapped ones
+        self._new_terms = []
+        # Term -> id for new terms and mapped terms looked up so far
+        self._vocab = {}
+        self._indptr = array("Q", [0])
+        self._indices = array("I")
+        self._counts = array("I")
+        self._lengths = array("I")
+        self._total_length = 0
+        # Postings saved in the file (term-major CSR) plus those added since
+        self._post_indptr = array("Q", [0])
+        self._post_docs = array("I")
+        self._post_tfs = array("I")
+        self._new_postings = {}
+        self._mmap = None
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    @property
+    def vocabulary_size(self) -> int:
+        """The number of distinct terms."""
+        return len(self._mapped_terms) + len(self._new_terms)
+
+    def term(self, term_id: int) -> str:
+        """Returns the term with the given id."""
+        base = len(self._mapped_terms)
+        if term_id < base:
+            return self._mapped_terms[term_id].decode()
+        return self._new_terms[term_id - base]
+
+    def term_id(self, term: str):
+        """Returns the id of a term, or None if no document contains it."""
+        term_id = self._vocab.get(term)
+        if term_id is None:
+            encoded = term.encode()
+            index = bisect_left(self._mapped_terms, encoded)
+            if index < len(self._mapped_terms) and self._mapped_terms[index] == encoded:
+                term_id = self._vocab[term] = index
+        return term_id
+
+    def add(self, text: str) -> int:
+        """Adds a document to the index.
+
+        Parameters
+        ----------
+        text : str
+            The document text
+
+        Returns
+        -------
+        int
+            The new document's number, counting from 0
+        """
+        if not isinstance(self._indices, array):
+            for name, typecode in (("_indptr", "Q"), ("_indices", "I"),
+                                   ("_counts", "I"), ("_lengths", "I")):
+                setattr(self, name, _writable(typecode, getattr(self, name)))
+        doc = len(self._lengths)
+        counts = Counter(_tokenize(text))
+        length = 0
+        for term, count in counts.items():
+            term_id = self.term_id(term)
+            if term_id is None:
+                term_id = self._vocab[term] = self.vocabulary_size
+                self._new_terms.append(term)
+            self._indices.append(term_id)
+            self._counts.append(count)
+            postings = self._new_postings.get(term_id)
+            if postings is None:
+                postings = self._new_postings[term_id] = (array("I"), array("I"))
+            postings[0].append(doc)
+            postings[1].append(count)
+            length += count
+        self._indptr.append(len(self._indices))
+        self._lengths.append(length)
+        self._total_length += length
+        return doc
+
+    def add_many(self, texts) -> range:
+        """Adds many documents, returning the range of their numbers."""
+        start = len(self)
+        for text in texts:
+            self.add(text)
+        return range(start, len(self))
+
+    def term_counts(self, doc: int) -> dict:
+        """Returns {term: count} for one document."""
+        start, stop = self._indptr[doc], self._indptr[doc + 1]
+        return {self.term(term_id): count for term_id, count in
+                zip(self._indices[start:stop], self._counts[start:stop])}
+
+    def postings(self, term: str) -> list[tuple[int, int]]:
+        """Returns the (document, count) pairs for every document containing
+        the term, in document order."""
+        term_id = self.term_id(term)
+        return [] if term_id is None else self._postings(term_id)
+
+    def _postings(self, term_id: int) -> list[tuple[int, int]]:
+        result = []
+        if term_id < len(self._post_indptr) - 1:
+            start, stop = self._post_indptr[term_id], self._post_indptr[term_id + 1]
+            result.extend(zip(self._post_docs[start:stop], self._post_tfs[start:stop]))
+        new = self._new_postings.get(term_id)
+        if new is not None:
+            result.extend(zip(*new))
+        return result
+
+    def _idf(self, df: int, method: str) -> float:
+        n = len(self)
+        if method == "bm25":
+            return math.log(1 + (n - df + 0.5) / (df + 0.5))
+        return math.log((1 + n) / (1 + df)) + 1
+
+    def search(self, query: str, k: int = 10, method: str = "bm25") -> list[tuple[int, float]]:
+        """Ranks documents against a query.
+
+        Parameters
+        ----------
+        query : str
+            The query text, tokenized like the documents
+        k : int, optional
+            The number of results, by default 10
+        method : str, optional
+            "bm25" or "tfidf" (sum of tf/length * idf^2 over query terms),
+            by default "bm25"
+
+        Returns
+        -------
+        list of tuple
+            Up to k (document, score) pairs, best first
+
+        Raises
+        ------
+        ValueError
+            If the method is not supported
+        """
+        if method not in _METHODS:
+            raise ValueError(f"Method {method} is not supported.")
+        if not len(self):
+            return []
+        lengths = self._lengths
+        k1, b = self.k1, self.b
+        average = self._total_length / len(self) or 1
+        scores = {}
+        for term, query_count in Counter(_tokenize(query)).items():
+            term_id = self.term_id(term)
+            if term_id is None:
+                continue
+            postings = self._postings(term_id)
+            idf = self._idf(len(postings), method)
+            if method == "bm25":
+                weight = query_count * idf * (k1 + 1)
+                for doc, tf in postings:
+                    norm = k1 * (1 - b + b * lengths[doc] / average)
+                    scores[doc] = scores.get(doc, 0.0) + weight * tf / (tf + norm)
+            else:
+                weight = query_count * idf * idf
+                for doc, tf in postings:
+                    scores[doc] = scores.get(doc, 0.0) + weight * tf / lengths[doc]
+        return heapq.nlargest(k, scores.items(), key=lambda item: (item[1], -item[0]))
+
+    def _document_frequencies(self) -> array:
+        frequencies = array("I", bytes(4 * self.vocabulary_size))
+        for term_id in self._indices:
+            frequencies[term_id] += 1
+        return frequencies
+
+    def tfidf_matrix(self) -> tuple[array, array, array]:
+        """Builds the TF-IDF weighted document-term matrix.
+
+        Returns
+        -------
+        tuple of array
+            CSR (indptr, term ids, weights), where each weight is the term's
+            count / document length * idf and row i is document i
+        """
+        idf = [self._idf(df, "tfidf") for df in self._document_frequencies()]
+        weights = array("f", bytes(4 * len(self._indices)))
+        indptr, indices, counts, lengths = self._indptr, self._indices, self._counts, self._lengths
+        for doc in range(len(self)):
+            length = lengths[doc] or 1
+            for j in range(indptr[doc], indptr[doc + 1]):
+                weights[j] = counts[j] / length * idf[indices[j]]
+        return array("Q", indptr), array("I", indices), weights
+
+    def save(self, path) -> None:
+        """Writes the index to a file that load() can memory-map.
+
+        Terms are renumbered in sorted order, so term ids after loading can
+        differ from the ones before saving.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            The file to write
+        """
+        size = self.vocabulary_size
+        encoded = [self._mapped_terms[i] for i in range(len(self._mapped_terms))]
+        encoded += [term.encode() for term in self._new_terms]
+        order = sorted(range(size), key=encoded.__getitem__)
+        renumber = array("I", bytes(4 * size))
+        for new_id, old_id in enumerate(order):
+            renumber[old_id] = new_id
+        indices = array("I", [renumber[term_id] for term_id in self._indices])
+
+        # Term-major postings by counting sort over the document-major matrix
+        post_indptr = array("Q", bytes(8 * (size + 1)))
+        for term_id in indices:
+            post_indptr[term_id + 1] += 1
+        for term_id in range(size):
+            post_indptr[term_id + 1] += post_indptr[term_id]
+        fill = array("Q", post_indptr)
+        post_docs = array("I", bytes(4 * len(indices)))
+        post_tfs = array("I", bytes(4 * len(indices)))
+        indptr, counts = self._indptr, self._counts
+        for doc in range(len(self)):
+            for j in range(indptr[doc], indptr[doc + 1]):
+                term_id = indices[j]
+                position = fill[term_id]
+                post_docs[position] = doc
+                post_tfs[position] = counts[j]
+                fill[term_id] = position + 1
+
+        term_offsets = array("Q", [0])
+        for term_id in order:
+            term_offsets.append(term_offsets[-1] + len(encoded[term_id]))
+        sections = {
+            "term_offsets": term_offsets,
+            "term_blob": b"".join(encoded[term_id] for term_id in order),
+            "indptr": indptr,
+            "indices": indices,
+            "counts": counts,
+            "lengths": self._lengths,
+            "post_indptr": post_indptr,
+            "post_docs": post_docs,
+            "post_tfs": post_tfs,
+        }
+        _write_sections(path, sections, {
+            "documents": len(self),
+            "terms": size,
+            "total_length": self._total_length,
+            "k1": self.k1,
+            "b": self.b,
+        })
+
+    @classmethod
+    def load(cls, path) -> "CorpusIndex":
+        """Opens a saved index by memory-mapping it.
+
+        Nothing is read up front: terms, matrices and postings are paged in
+        as queries touch them. Documents added afterwards are kept in memory
+        until the next save().
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            A file written by save()
+
+        Returns
+        -------
+        CorpusIndex
+            The loaded index
+
+        Raises
+        ------
+        ValueError
+            If the file is not a montykit corpus index or was written on a
+            machine with a different byte order
+        """
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header, views = _read_sections(mapped)
+        index = cls(header["k1"], header["b"])
+        index._mmap = mapped
+        index._mapped_terms = _MappedTerms(views["term_offsets"], views["term_blob"])
+        for name in ("indptr", "indices", "counts", "lengths",
+                     "post_indptr", "post_docs", "post_tfs"):
+            setattr(index, f"_{name}", views[name])
+        index._total_length = header["total_length"]
+        return index
+
+
+def _write_sections(path, sections: dict, header: dict) -> None:
+    """Writes a header and 8-byte aligned arrays, renaming into place."""
+    layout, offset = {}, 0
+    for name in _SECTIONS:
+        nbytes = memoryview(sections[name]).nbytes
+        layout[name] = [offset, nbytes]
+        offset += -(-nbytes // 8) * 8
+    header = dict(header, version=_FORMAT_VERSION, byteorder=sys.byteorder, sections=layout,
+                  itemsizes={code: array(code).itemsize for code in set(_SECTIONS.values())})
+    encoded = json.dumps(header).encode()
+    encoded += b" " * (-len(encoded) % 8)
+    path = os.fspath(path)
+    temp = f"{path}.{os.getpid()}.tmp"
+    with open(temp, "wb") as f:
+        f.write(_MAGIC + struct.pack("<Q", len(encoded)) + encoded)
+        for name in _SECTIONS:
+            data = sections[name]
+            f.write(data)
+            f.write(b"\0" * (-layout[name][1] % 8))
+    os.replace(temp, path)
+
+
+def _read_sections(mapped: mmap.mmap) -> tuple[dict, dict]:
+    if mapped[:len(_MAGIC)] != _MAGIC:
+        raise ValueError("File is not a montykit corpus index.")
+    (header_size,) = struct.unpack_from("<Q", mapped, len(_MAGIC))
+    start = len(_MAGIC) + 8
+    header = json.loads(mapped[start:start + header_size])
+    if header["version"] != _FORMAT_VERSION:
+        raise ValueError(f"Index format {header['version']} is not supported.")
+    if header["byteorder"] != sys.byteorder or any(
+            array(code).itemsize != size for code, size in header["itemsizes"].items()):
+        raise ValueError("Index was written on an incompatible platform.")
+    base = memoryview(mapped)[start + header_size:]
+    views = {}
+    for name, typecode in _SECTIONS.items():
+        offset, nbytes = header["sections"][name]
+        view = base[offset:offset + nbytes]
+        views[name] = view if typecode == "B" else view.cast(typecode)
+    return header, views
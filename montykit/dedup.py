@@ -0,0 +1,424 @@
+"""
+Near-duplicate detection with MinHash, SimHash and LSH banding
+
+Documents are tokenized like word_freq, split into word shingles and hashed
+with xxh64. MinHash signatures estimate the Jaccard similarity of two
+shingle sets; SimHash fingerprints place similar documents a small Hamming
+distance apart. Both are stored as flat array('Q') integer arrays, and an
+LSH banding index only compares documents that share a band, so finding
+duplicates in a corpus does not need every pair.
+"""
+
+import random
+from array import array
+from collections import Counter, defaultdict
+from functools import lru_cache, partial
+from itertools import combinations
+from multiprocessing import Pool
+
+from .analysis import _tokenize
+from .hash import _MASK64, xxh64
+
+
+# Universal hashing modulo the Mersenne prime 2**61 - 1 gives the MinHash
+# permutations; every value fits an unsigned 64-bit array slot
+_PRIME = (1 << 61) - 1
+_EMPTY = _PRIME
+_FIELD_BITS = 32
+_CHUNK_SIZE = 256
+
+
+def _shingles(text: str, size: int) -> list:
+    """The distinct word shingles of a text, hashed to 64-bit integers."""
+    tokens = _tokenize(text)
+    if len(tokens) <= size:
+        return [xxh64(" ".join(tokens))] if tokens else []
+    return list({xxh64(" ".join(tokens[i:i + size])) for i in range(len(tokens) - size + 1)})
+
+
+@lru_cache(maxsize=16)
+def _permutations(num_perm: int, seed: int) -> tuple:
+    rng = random.Random(seed)
+    return tuple((rng.randrange(1, _PRIME), rng.randrange(_PRIME)) for _ in range(num_perm))
+
+
+def _minhash_values(hashes: list, permutations: tuple) -> list:
+    if not hashes:
+        return [_EMPTY] * len(permutations)
+    return [min([(a * h + b) % _PRIME for h in hashes]) for a, b in permutations]
+
+
+def minhash(text: str, num_perm: int = 128, shingle_size: int = 3, seed: int = 1) -> array:
+    """Computes the MinHash signature of a text.
+
+    Parameters
+    ----------
+    text : str
+        The document
+    num_perm : int, optional
+        The number of hash permutations, by default 128
+    shingle_size : int, optional
+        The number of words per shingle, by default 3
+    seed : int, optional
+        Chooses the permutations; only signatures with the same seed compare
+
+    Returns
+    -------
+    array.array
+        num_perm unsigned 64-bit values (typecode 'Q')
+
+    Raises
+    ------
+    ValueError
+        If num_perm or shingle_size is not positive
+    """
+    if num_perm < 1 or shingle_size < 1:
+        raise ValueError("num_perm and shingle_size must be positive.")
+    return array("Q", _minhash_values(_shingles(text, shingle_size), _permutations(num_perm, seed)))
+
+
+@lru_cache(maxsize=1)
+def _spread_tables() -> tuple:
+    """For each byte of a 64-bit hash, maps the byte value to an integer with
+    bit i of the hash moved to the start of field i, so one multiply-add sums
+    64 bit counters at once."""
+    tables = []
+    for byte in range(8):
+        table = []
+        for value in range(256):
+            spread = 0
+            for bit in range(8):
+                if value >> bit & 1:
+                    spread |= 1 << ((byte * 8 + bit) * _FIELD_BITS)
+            table.append(spread)
+        tables.append(table)
+    return tuple(tables)
+
+
+def _simhash_value(counts: Counter) -> int:
+    t0, t1, t2, t3, t4, t5, t6, t7 = _spread_tables()
+    votes = total = 0
+    for h, weight in counts.items():
+        votes += weight * (t0[h & 255] + t1[h >> 8 & 255] + t2[h >> 16 & 255]
+                           + t3[h >> 24 & 255] + t4[h >> 32 & 255] + t5[h >> 40 & 255]
+                           + t6[h >> 48 & 255] + t7[h >> 56])
+        total += weight
+    fingerprint, mask = 0, (1 << _FIELD_BITS) - 1
+    for bit in range(64):
+        # A bit is set when the features that have it outweigh those that don't
+        if 2 * (votes >> (bit * _FIELD_BITS) & mask) > total:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def simhash(text: str, shingle_size: int = 1) -> int:
+    """Computes the 64-bit SimHash fingerprint of a text, weighting each
+    shingle by how often it occurs.
+
+    Parameters
+    ----------
+    text : str
+        The document
+    shingle_size : int, optional
+        The number of words per feature, by default 1
+
+    Returns
+    -------
+    int
+        The unsigned 64-bit fingerprint, 0 for a text without words
+
+    Raises
+    ------
+    ValueError
+        If shingle_size is not positive
+    """
+    if shingle_size < 1:
+        raise ValueError("shingle_size must be positive.")
+    tokens = _tokenize(text)
+    if shingle_size > 1:
+        tokens = [" ".join(tokens[i:i + shingle_size])
+                  for i in range(max(len(tokens) - shingle_size + 1, 1 if tokens else 0))]
+    return _simhash_value(Counter(xxh64(token) for token in tokens))
+
+
+def _minhash_chunk(texts: list, num_perm: int, shingle_size: int, seed: int) -> array:
+    permutations = _permutations(num_perm, seed)
+    values = array("Q")
+    for text in texts:
+        values.extend(_minhash_values(_shingles(text, shingle_size), permutations))
+    return values
+
+
+def _simhash_chunk(texts: list, shingle_size: int) -> array:
+    return array("Q", [simhash(text, shingle_size) for text in texts])
+
+
+def _chunked(texts, size: int):
+    chunk = []
+    for text in texts:
+        chunk.append(text)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _map_chunks(worker, texts, workers: int) -> array:
+    values = array("Q")
+    if workers > 1:
+        with Pool(workers) as pool:
+            for chunk_values in pool.imap(worker, _chunked(texts, _CHUNK_SIZE)):
+                values.extend(chunk_values)
+    else:
+        for chunk in _chunked(texts, _CHUNK_SIZE):
+            values.extend(worker(chunk))
+    return values
+
+
+def minhash_signatures(texts, num_perm: int = 128, shingle_size: int = 3, seed: int = 1,
+                       workers: int = 1) -> array:
+    """Computes the MinHash signatures of many texts.
+
+    Parameters
+    ----------
+    texts : iterable of str
+        The documents
+    num_perm : int, optional
+        The number of hash permutations, by default 128
+    shingle_size : int, optional
+        The number of words per shingle, by default 3
+    seed : int, optional
+        Chooses the permutations, by default 1
+    workers : int, optional
+        The number of processes, by default 1
+
+    Returns
+    -------
+    array.array
+        One flat 'Q' array holding num_perm values per text, in input order;
+        the signature of text i is values[i * num_perm:(i + 1) * num_perm]
+
+    Raises
+    ------
+    ValueError
+        If num_perm or shingle_size is not positive
+    """
+    if num_perm < 1 or shingle_size < 1:
+        raise ValueError("num_perm and shingle_size must be positive.")
+    worker = partial(_minhash_chunk, num_perm=num_perm, shingle_size=shingle_size, seed=seed)
+    return _map_chunks(worker, texts, workers)
+
+
+def simhash_signatures(texts, shingle_size: int = 1, workers: int = 1) -> array:
+    """Computes the SimHash fingerprints of many texts.
+
+    Parameters
+    ----------
+    texts : iterable of str
+        The documents
+    shingle_size : int, optional
+        The number of words per feature, by default 1
+    workers : int, optional
+        The number of processes, by default 1
+
+    Returns
+    -------
+    array.array
+        One 'Q' fingerprint per text, in input order
+
+    Raises
+    ------
+    ValueError
+        If shingle_size is not positive
+    """
+    if shingle_size < 1:
+        raise ValueError("shingle_size must be positive.")
+    return _map_chunks(partial(_simhash_chunk, shingle_size=shingle_size), texts, workers)
+
+
+def minhash_similarity(a, b) -> float:
+    """Estimates the Jaccard similarity of two MinHash signatures.
+
+    Raises
+    ------
+    ValueError
+        If the signatures have different lengths
+    """
+    if len(a) != len(b) or not a:
+        raise ValueError("Signatures must be non-empty and the same length.")
+    return sum(x == y for x, y in zip(a, b)) / len(a)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """The number of bits that differ between two SimHash fingerprints."""
+    return bin((a ^ b) & _MASK64).count("1")
+
+
+def lsh_bands(num_perm: int, threshold: float) -> int:
+    """Chooses the number of LSH bands for a similarity threshold.
+
+    With b bands of r rows, documents become candidates with probability
+    1 - (1 - s**r)**b, which rises steeply around (1/b)**(1/r). This picks
+    the b dividing num_perm that puts that point closest to the threshold,
+    preferring more bands (fewer missed pairs) on ties.
+    """
+    if not 0 < threshold <= 1:
+        raise ValueError("threshold must be in (0, 1].")
+    bands = [b for b in range(1, num_perm + 1) if num_perm % b == 0]
+    return min(bands, key=lambda b: (abs((1 / b) ** (b / num_perm) - threshold), -b))
+
+
+class LSHIndex:
+    """An LSH banding index over MinHash signatures.
+
+    Each signature is cut into bands of equal rows, and documents whose
+    signatures agree on every row of at least one band become candidate
+    duplicates. Lookups only touch the matching buckets.
+
+    Parameters
+    ----------
+    num_perm : int, optional
+        The signature length, by default 128
+    bands : int, optional
+        The number of bands, which must divide num_perm, by default 32
+
+    Raises
+    ------
+    ValueError
+        If bands does not divide num_perm
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 32):
+        if bands < 1 or num_perm % bands:
+            raise ValueError(f"{bands} bands do not divide {num_perm} permutations.")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.keys = []
+        self._buckets = [defaultdict(list) for _ in range(bands)]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _band_keys(self, signature):
+        if len(signature) != self.num_perm:
+            raise ValueError(f"Signature has {len(signature)} values, expected {self.num_perm}.")
+        if not isinstance(signature, array) or signature.typecode != "Q":
+            signature = array("Q", signature)
+        step = self.rows * signature.itemsize
+        data = signature.tobytes()
+        return [data[start:start + step] for start in range(0, len(data), step)]
+
+    def add(self, key, signature) -> None:
+        """Indexes one signature under key."""
+        position = len(self.keys)
+        self.keys.append(key)
+        for buckets, band in zip(self._buckets, self._band_keys(signature)):
+            buckets[band].append(position)
+
+    def add_many(self, signatures, keys=None) -> None:
+        """Indexes a flat signature array such as minhash_signatures returns.
+        The keys default to each signature's position in the array."""
+        count = len(signatures) // self.num_perm
+        for index, key in zip(range(count), range(count) if keys is None else keys):
+            self.add(key, signatures[index * self.num_perm:(index + 1) * self.num_perm])
+
+    def query(self, signature) -> list:
+        """The keys of indexed signatures sharing at least one band with
+        signature, in insertion order."""
+        positions = set()
+        for buckets, band in zip(self._buckets, self._band_keys(signature)):
+            positions.update(buckets.get(band, ()))
+        return [self.keys[position] for position in sorted(positions)]
+
+    def candidate_pairs(self) -> set:
+        """Every pair of keys sharing at least one band, each pair ordered by
+        insertion."""
+        pairs = set()
+        for buckets in self._buckets:
+            for positions in buckets.values():
+                if len(positions) > 1:
+                    pairs.update(combinations(positions, 2))
+        keys = self.keys
+        return {(keys[i], keys[j]) for i, j in pairs}
+
+
+def minhash_duplicates(texts, threshold: float = 0.8, num_perm: int = 128,
+                       shingle_size: int = 3, bands: int = None, workers: int = 1) -> list:
+    """Finds pairs of texts whose estimated Jaccard similarity is at least
+    threshold.
+
+    Parameters
+    ----------
+    texts : iterable of str
+        The documents
+    threshold : float, optional
+        The minimum similarity, by default 0.8
+    num_perm : int, optional
+        The signature length, by default 128
+    shingle_size : int, optional
+        The number of words per shingle, by default 3
+    bands : int, optional
+        The number of LSH bands, by default chosen from the threshold
+    workers : int, optional
+        The number of processes computing signatures, by default 1
+
+    Returns
+    -------
+    list of tuple
+        (i, j, similarity) for each duplicate pair, with i < j indexes into
+        texts, sorted by i then j
+    """
+    signatures = minhash_signatures(texts, num_perm, shingle_size, workers=workers)
+    index = LSHIndex(num_perm, bands or lsh_bands(num_perm, threshold))
+    index.add_many(signatures)
+    duplicates = []
+    for i, j in sorted(index.candidate_pairs()):
+        similarity = minhash_similarity(signatures[i * num_perm:(i + 1) * num_perm],
+                                        signatures[j * num_perm:(j + 1) * num_perm])
+        if similarity >= threshold:
+            duplicates.append((i, j, similarity))
+    return duplicates
+
+
+def simhash_duplicates(texts, max_distance: int = 3, shingle_size: int = 1,
+                       workers: int = 1) -> list:
+    """Finds pairs of texts whose SimHash fingerprints differ in at most
+    max_distance bits.
+
+    The fingerprints are cut into max_distance + 1 blocks: two within the
+    distance must agree on at least one whole block, so only texts sharing a
+    block are compared.
+
+    Returns
+    -------
+    list of tuple
+        (i, j, distance) for each duplicate pair, with i < j indexes into
+        texts, sorted by i then j
+
+    Raises
+    ------
+    ValueError
+        If max_distance is not between 0 and 63
+    """
+    if not 0 <= max_distance < 64:
+        raise ValueError("max_distance must be between 0 and 63.")
+    fingerprints = simhash_signatures(texts, shingle_size, workers)
+    blocks = max_distance + 1
+    bounds = [64 * block // blocks for block in range(blocks + 1)]
+    pairs = set()
+    for start, stop in zip(bounds, bounds[1:]):
+        mask = (1 << (stop - start)) - 1
+        buckets = defaultdict(list)
+        for position, fingerprint in enumerate(fingerprints):
+            buckets[fingerprint >> start & mask].append(position)
+        for positions in buckets.values():
+            if len(positions) > 1:
+                pairs.update(combinations(positions, 2))
+    duplicates = []
+    for i, j in sorted(pairs):
+        distance = hamming_distance(fingerprints[i], fingerprints[j])
+        if distance <= max_distance:
+            duplicates.append((i, j, distance))
+    return duplicates
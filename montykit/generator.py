@@ -2,23 +2,50 @@
 Utilities for basic data/text generation
 """
 
+import csv
+import io
+import os
 import string
 import secrets
+import time
 import uuid
 import json
+import random
+from functools import lru_cache
 from importlib import resources
+from multiprocessing import Pool
 
 
-with resources.open_text("montykit", "girl_boy_names.json") as f:
-    _FIRST_NAMES = json.load(f)
+@lru_cache(maxsize=None)
+def _load_names(filename: str):
+    """Loads a bundled name list on first use."""
+    with resources.open_text("montykit", filename) as f:
+        return json.load(f)
 
 
-with resources.open_text("montykit", "middle_names.json") as f:
-    _MIDDLE_NAMES = json.load(f)
+def _first_names() -> dict:
+    return _load_names("girl_boy_names.json")
 
 
-with resources.open_text("montykit", "last_names.json") as f:
-    _LAST_NAMES = json.load(f)
+def _middle_names() -> list:
+    return _load_names("middle_names.json")
+
+
+def _last_names() -> list:
+    return _load_names("last_names.json")
+
+
+_BASE62_ALPHABET = string.digits + string.ascii_uppercase + string.ascii_lowercase
+_BASE32_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"  # Crockford
+_UUID_OUTPUTS = ("str", "base62", "base32", "bytes", "packed")
+# The classes is_strong_pass requires, and characters easily misread
+_PASSWORD_CLASS_CHARS = {
+    "upper": string.ascii_uppercase,
+    "lower": string.ascii_lowercase,
+    "digits": string.digits,
+    "special": string.punctuation,
+}
+_AMBIGUOUS_CHARS = "0Oo1lI|"
 
 
 def gen_id(length: int = 12) -> str:
@@ -48,6 +75,155 @@ def gen_uuid() -> str:
     return str(uuid.uuid4())
 
 
+def _encode_fixed(value: int, alphabet: str, width: int) -> str:
+    """Encodes a non-negative integer into a zero-padded string of the given width."""
+    base = len(alphabet)
+    chars = [alphabet[0]] * width
+    for i in range(width - 1, -1, -1):
+        if not value:
+            break
+        value, rem = divmod(value, base)
+        chars[i] = alphabet[rem]
+    return "".join(chars)
+
+
+def _format_ids(buf: bytearray, output: str) -> list:
+    """Formats a packed buffer of 16-byte IDs into the requested output type."""
+    if output == "packed":
+        return bytes(buf)
+    if output == "bytes":
+        return [bytes(buf[i:i + 16]) for i in range(0, len(buf), 16)]
+    if output == "str":
+        h = buf.hex()
+        return [f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-"
+                f"{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+                for i in range(0, len(h), 32)]
+    if output == "base62":
+        alphabet, width = _BASE62_ALPHABET, 22
+    else:
+        alphabet, width = _BASE32_ALPHABET, 26
+    return [_encode_fixed(int.from_bytes(buf[i:i + 16], "big"), alphabet, width)
+            for i in range(0, len(buf), 16)]
+
+
+def _set_uuid4_bits(buf: bytearray) -> bytearray:
+    """Sets the version 4 and RFC 4122 variant bits on a packed buffer of IDs."""
+    buf[6::16] = bytes((b & 0x0F) | 0x40 for b in buf[6::16])
+    buf[8::16] = bytes((b & 0x3F) | 0x80 for b in buf[8::16])
+    return buf
+
+
+def _time_ordered_buffer(amount: int, random_bits: int) -> tuple[int, list[int]]:
+    """Draws a millisecond timestamp and a monotonic run of random values.
+
+    The random part of the first ID is drawn from the top-bit-cleared range
+    and every following ID increments it by one, so IDs generated in the same
+    call keep sorting in generation order even within one millisecond.
+    """
+    timestamp = time.time_ns() // 1_000_000
+    start = secrets.randbits(random_bits - 1)
+    return timestamp, [start + i for i in range(amount)]
+
+
+def gen_uuids(amount: int = 10, version: int = 4, output: str = "str") -> list:
+    """Generates many UUIDs at once from a single random buffer.
+
+    Parameters
+    ----------
+    amount : int, optional
+        The number of UUIDs to generate, by default 10
+    version : int, optional
+        4 for random UUIDs or 7 for time-ordered UUIDs, by default 4
+    output : str, optional
+        The output format, by default "str":
+        - "str": canonical 36-character strings
+        - "base62": 22-character base62 strings
+        - "base32": 26-character Crockford base32 strings
+        - "bytes": 16-byte bytes objects
+        - "packed": one bytes object of amount * 16 bytes for bulk inserts
+
+    Returns
+    -------
+    list or bytes
+        A list of UUIDs in the requested format, or a single bytes object
+        when output is "packed"
+
+    Raises
+    ------
+    ValueError
+        If the version or output format is not supported
+    """
+    if output not in _UUID_OUTPUTS:
+        raise ValueError(f"Output {output} is not supported.")
+    if version == 4:
+        buf = _set_uuid4_bits(bytearray(secrets.token_bytes(16 * amount)))
+    elif version == 7:
+        timestamp, randoms = _time_ordered_buffer(amount, 74)
+        head = (timestamp << 80) | (0x7 << 76) | (0x2 << 62)
+        buf = bytearray(16 * amount)
+        for i, r in enumerate(randoms):
+            value = head | ((r >> 62) << 64) | (r & 0x3FFFFFFFFFFFFFFF)
+            buf[16 * i:16 * i + 16] = value.to_bytes(16, "big")
+    else:
+        raise ValueError(f"UUID version {version} is not supported.")
+    return _format_ids(buf, output)
+
+
+def gen_uuid7() -> str:
+    """Generates a time-ordered UUID (version 7).
+
+    Returns
+    -------
+    str
+        A string representation of a UUID whose leading bits are the current
+        Unix time in milliseconds
+    """
+    return gen_uuids(1, version=7)[0]
+
+
+def gen_ulids(amount: int = 10, output: str = "base32") -> list:
+    """Generates many ULIDs (time-ordered, lexicographically sortable IDs).
+
+    Parameters
+    ----------
+    amount : int, optional
+        The number of ULIDs to generate, by default 10
+    output : str, optional
+        The output format, by default "base32" (the canonical 26-character
+        ULID form). Accepts the same formats as gen_uuids
+
+    Returns
+    -------
+    list or bytes
+        A list of ULIDs in the requested format, or a single bytes object
+        when output is "packed"
+
+    Raises
+    ------
+    ValueError
+        If the output format is not supported
+    """
+    if output not in _UUID_OUTPUTS:
+        raise ValueError(f"Output {output} is not supported.")
+    timestamp, randoms = _time_ordered_buffer(amount, 80)
+    head = timestamp << 80
+    buf = bytearray(16 * amount)
+    for i, r in enumerate(randoms):
+        buf[16 * i:16 * i + 16] = (head | r).to_bytes(16, "big")
+    return _format_ids(buf, output)
+
+
+def gen_ulid() -> str:
+    """Generates a ULID (time-ordered, lexicographically sortable ID).
+
+    Returns
+    -------
+    str
+        A 26-character Crockford base32 ULID
+    """
+    return gen_ulids(1)[0]
+
+
 def gen_password(length: int = 12) -> str:
     """Generates a strong random password with mixed characters.
 
@@ -65,6 +241,132 @@ def gen_password(length: int = 12) -> str:
     return "".join(secrets.choice(chars) for _ in range(length))
 
 
+@lru_cache(maxsize=None)
+def _index_table(n: int) -> tuple[bytes, bytes]:
+    """A bytes.translate table mapping a random byte to a number below n,
+    and the bytes to delete so every number is equally likely."""
+    limit = 256 - 256 % n
+    return bytes(b % n for b in range(256)), bytes(range(limit, 256))
+
+
+def _random_indices(n: int, count: int) -> bytes:
+    """Draws count uniform random numbers below n (at most 256) from pooled
+    os.urandom bytes, rejecting the bytes that would cause modulo bias."""
+    table, rejected = _index_table(n)
+    draw = count * 256 // (256 - len(rejected)) + 16
+    indices = os.urandom(draw).translate(table, rejected)
+    while len(indices) < count:
+        indices += os.urandom(draw).translate(table, rejected)
+    return indices[:count]
+
+
+def _random_below(n: int, count: int):
+    if n <= 256:
+        return _random_indices(n, count)
+    return [secrets.randbelow(n) for _ in range(count)]
+
+
+def _password_classes(classes, custom, exclude: str, exclude_ambiguous: bool) -> list[str]:
+    """Resolves class names and custom classes, minus excluded characters."""
+    if exclude_ambiguous:
+        exclude += _AMBIGUOUS_CHARS
+    resolved = []
+    for name in classes:
+        if name not in _PASSWORD_CLASS_CHARS:
+            raise ValueError(f"Character class {name} is not supported.")
+        resolved.append(_PASSWORD_CLASS_CHARS[name])
+    resolved.extend(custom)
+    if not resolved:
+        raise ValueError("At least one character class is required.")
+    for k, chars in enumerate(resolved):
+        resolved[k] = "".join(dict.fromkeys(c for c in chars if c not in exclude))
+        if not resolved[k]:
+            raise ValueError(f"Character class {chars!r} is empty after exclusions.")
+    return resolved
+
+
+def gen_strong_passwords(amount: int = 10, length: int = 12,
+                         classes=tuple(_PASSWORD_CLASS_CHARS), custom=(), exclude: str = "",
+                         exclude_ambiguous: bool = False, min_length: int = 12) -> list[str]:
+    """Generates passwords that contain every required character class.
+
+    One character of each class is placed at a position picked by a partial
+    Fisher-Yates shuffle and the rest are drawn from all classes combined,
+    so no password needs to be checked and regenerated. The default classes
+    and min_length are the rules of is_strong_pass, so with them every
+    password passes it.
+
+    Parameters
+    ----------
+    amount : int, optional
+        The number of passwords to generate, by default 10
+    length : int, optional
+        The length of each password, by default 12
+    classes : iterable of str, optional
+        The required classes out of "upper", "lower", "digits" and
+        "special", by default all four
+    custom : iterable of str, optional
+        Extra required classes, each a string of characters, by default ()
+    exclude : str, optional
+        Characters never to use, by default ""
+    exclude_ambiguous : bool, optional
+        Whether to also leave out characters that are easily misread, such
+        as 0/O and 1/l/I, by default False
+    min_length : int, optional
+        The shortest length allowed, by default 12 like is_strong_pass
+
+    Returns
+    -------
+    list of str
+        The generated passwords
+
+    Raises
+    ------
+    ValueError
+        If a class is unknown or empty, or length is below min_length or too
+        short to hold one character of every class
+    """
+    if length < min_length:
+        raise ValueError(f"Length {length} is below the minimum length of {min_length}.")
+    classes = _password_classes(classes, custom, exclude, exclude_ambiguous)
+    if length < len(classes):
+        raise ValueError(f"Length {length} is too short for {len(classes)} character classes.")
+    alphabet = "".join(dict.fromkeys("".join(classes)))
+    if len(alphabet) <= 256:
+        indices = _random_indices(len(alphabet), amount * length).decode("latin-1")
+        fill = indices.translate(str.maketrans("".join(map(chr, range(len(alphabet)))), alphabet))
+    else:
+        fill = "".join(alphabet[i] for i in _random_below(len(alphabet), amount * length))
+    picks = [_random_below(len(chars), amount) for chars in classes]
+    offsets = [_random_below(length - t, amount) for t in range(len(classes))]
+    passwords = []
+    for p in range(amount):
+        chars = list(fill[p * length:(p + 1) * length])
+        positions = list(range(length))
+        for t, cls in enumerate(classes):
+            j = t + offsets[t][p]
+            positions[t], positions[j] = positions[j], positions[t]
+            chars[positions[t]] = cls[picks[t][p]]
+        passwords.append("".join(chars))
+    return passwords
+
+
+def gen_strong_password(length: int = 12, classes=tuple(_PASSWORD_CLASS_CHARS),
+                        custom=(), exclude: str = "", exclude_ambiguous: bool = False,
+                        min_length: int = 12) -> str:
+    """Generates a password that contains every required character class.
+
+    Takes the same options as gen_strong_passwords.
+
+    Returns
+    -------
+    str
+        A password that passes is_strong_pass with the default classes
+    """
+    return gen_strong_passwords(1, length, classes, custom, exclude, exclude_ambiguous,
+                                min_length)[0]
+
+
 def gen_first_name() -> str:
     """Selects a random first name from the loaded resources.
 
@@ -73,7 +375,7 @@ def gen_first_name() -> str:
     str
         A random first name
     """
-    return secrets.choice(_FIRST_NAMES[secrets.choice(["girls", "boys"])])
+    return secrets.choice(_first_names()[secrets.choice(["girls", "boys"])])
 
 
 def gen_first_names(amount: int) -> list[str]:
@@ -100,7 +402,7 @@ def gen_middle_name() -> str:
     str
         A random middle name
     """
-    return secrets.choice(_MIDDLE_NAMES[secrets.choice(["girls", "boys"])])
+    return secrets.choice(_middle_names())
 
 
 def gen_middle_names(amount: int) -> list[str]:
@@ -127,7 +429,7 @@ def gen_last_name() -> str:
     str
         A random last name
     """
-    return secrets.choice(_LAST_NAMES[secrets.choice(["girls", "boys"])])
+    return secrets.choice(_last_names())
 
 
 def gen_last_names(amount: int) -> list[str]:
@@ -160,10 +462,10 @@ def gen_full_name(middle: bool = False) -> str:
         A formatted string containing a first, optional middle, and last name
     """
     gender = secrets.choice(["girls", "boys"])
-    first = secrets.choice(_FIRST_NAMES[gender])
-    last = secrets.choice(_LAST_NAMES)
+    first = secrets.choice(_first_names()[gender])
+    last = secrets.choice(_last_names())
     if middle:
-        mid = secrets.choice(_MIDDLE_NAMES)
+        mid = secrets.choice(_middle_names())
         return f"{first} {mid} {last}"
     return f"{first} {last}"
 
@@ -195,3 +497,215 @@ def gen_phone() -> str:
         A formatted random phone number string
     """
     return "".join(secrets.choice(string.digits) for _ in range(10))
+
+
+@lru_cache(maxsize=None)
+def _all_first_names() -> list:
+    return _first_names()["girls"] + _first_names()["boys"]
+
+
+_PASSWORD_CHARS = string.digits + string.ascii_letters + string.punctuation
+
+
+def _digits_column(rng: random.Random, amount: int, length: int) -> list[str]:
+    """Generates a column of zero-padded random digit strings."""
+    upper = 10 ** length
+    return [f"{rng.randrange(upper):0{length}d}" for _ in range(amount)]
+
+
+def _record_field_id(rng, amount):
+    return _digits_column(rng, amount, 12)
+
+
+def _record_field_phone(rng, amount):
+    return _digits_column(rng, amount, 10)
+
+
+def _record_field_uuid(rng, amount):
+    return _format_ids(_set_uuid4_bits(bytearray(rng.randbytes(16 * amount))), "str")
+
+
+def _record_field_first_name(rng, amount):
+    return rng.choices(_all_first_names(), k=amount)
+
+
+def _record_field_middle_name(rng, amount):
+    return rng.choices(_middle_names(), k=amount)
+
+
+def _record_field_last_name(rng, amount):
+    return rng.choices(_last_names(), k=amount)
+
+
+def _record_field_full_name(rng, amount):
+    firsts = rng.choices(_all_first_names(), k=amount)
+    lasts = rng.choices(_last_names(), k=amount)
+    return [f"{first} {last}" for first, last in zip(firsts, lasts)]
+
+
+def _record_field_password(rng, amount):
+    return ["".join(rng.choices(_PASSWORD_CHARS, k=12)) for _ in range(amount)]
+
+
+_RECORD_FIELDS = {
+    "id": _record_field_id,
+    "uuid": _record_field_uuid,
+    "phone": _record_field_phone,
+    "first_name": _record_field_first_name,
+    "middle_name": _record_field_middle_name,
+    "last_name": _record_field_last_name,
+    "full_name": _record_field_full_name,
+    "password": _record_field_password,
+}
+
+
+def _resolve_schema(schema: dict) -> list:
+    """Turns a record schema into a list of (column, column generator) pairs."""
+    columns = []
+    for column, field in schema.items():
+        if callable(field):
+            columns.append((column, field))
+        elif field in _RECORD_FIELDS:
+            columns.append((column, _RECORD_FIELDS[field]))
+        else:
+            raise ValueError(f"Field type {field} is not supported.")
+    return columns
+
+
+def _batch_plan(amount: int, batch_size: int, seed) -> list[tuple[str, int]]:
+    """Splits a record count into per-batch (seed, size) pairs.
+
+    Each batch gets its own seed derived from the base seed and its index,
+    so output depends only on the seed and batch size, never on how many
+    processes rendered it.
+    """
+    if seed is None:
+        seed = secrets.randbits(64)
+    return [(f"{seed}:{index}", min(batch_size, amount - start))
+            for index, start in enumerate(range(0, amount, batch_size))]
+
+
+def _gen_columns(columns: list, batch_seed: str, size: int) -> dict:
+    """Generates one columnar batch from a resolved schema."""
+    rng = random.Random(batch_seed)
+    return {column: generate(rng, size) for column, generate in columns}
+
+
+def gen_record_batches(schema: dict, amount: int, batch_size: int = 10_000,
+                       seed=None):
+    """Generates fake records in columnar batches.
+
+    Parameters
+    ----------
+    schema : dict
+        Maps column names to field types ("id", "uuid", "phone", "first_name",
+        "middle_name", "last_name", "full_name", "password") or to a callable
+        taking (rng, amount) and returning a list of amount values
+    amount : int
+        The total number of records to generate
+    batch_size : int, optional
+        The number of records per batch, by default 10_000
+    seed : int or str, optional
+        Makes the output reproducible, by default None (random). Seeded
+        output is not suitable for secrets
+
+    Yields
+    ------
+    dict
+        A batch mapping each column name to a list of values
+    """
+    columns = _resolve_schema(schema)
+    for batch_seed, size in _batch_plan(amount, batch_size, seed):
+        yield _gen_columns(columns, batch_seed, size)
+
+
+def gen_records(schema: dict, amount: int = 10, seed=None) -> list[dict]:
+    """Generates a list of fake records.
+
+    Parameters
+    ----------
+    schema : dict
+        Maps column names to field types, see gen_record_batches
+    amount : int, optional
+        The number of records to generate, by default 10
+    seed : int or str, optional
+        Makes the output reproducible, by default None (random)
+
+    Returns
+    -------
+    list of dict
+        A list of records mapping each column name to a value
+    """
+    records = []
+    for batch in gen_record_batches(schema, amount, seed=seed):
+        names = list(batch)
+        records.extend(dict(zip(names, row)) for row in zip(*batch.values()))
+    return records
+
+
+def _render_batch(task: tuple) -> str:
+    """Generates one batch and renders it as CSV or JSON Lines text."""
+    schema, fmt, batch_seed, size = task
+    batch = _gen_columns(_resolve_schema(schema), batch_seed, size)
+    rows = zip(*batch.values())
+    if fmt == "csv":
+        out = io.StringIO()
+        csv.writer(out, lineterminator="\n").writerows(rows)
+        return out.getvalue()
+    names = list(batch)
+    return "".join(json.dumps(dict(zip(names, row))) + "\n" for row in rows)
+
+
+def write_records(path: str, schema: dict, amount: int, fmt: str = "csv",
+                  batch_size: int = 10_000, workers: int = 1, seed=None) -> int:
+    """Streams fake records to a CSV or JSON Lines file.
+
+    Records are generated and written one batch at a time, so the dataset
+    never has to fit in memory. With several workers, batches are rendered
+    in separate processes and written in order.
+
+    Parameters
+    ----------
+    path : str
+        The file to write to
+    schema : dict
+        Maps column names to field types, see gen_record_batches. Custom
+        callables must be importable module-level functions when workers > 1
+    amount : int
+        The total number of records to write
+    fmt : str, optional
+        "csv" or "jsonl", by default "csv"
+    batch_size : int, optional
+        The number of records per batch, by default 10_000
+    workers : int, optional
+        The number of processes rendering batches, by default 1
+    seed : int or str, optional
+        Makes the output reproducible regardless of workers, by default None
+
+    Returns
+    -------
+    int
+        The number of records written
+
+    Raises
+    ------
+    ValueError
+        If the format or a field type is not supported
+    """
+    if fmt not in ("csv", "jsonl"):
+        raise ValueError(f"Format {fmt} is not supported.")
+    _resolve_schema(schema)
+    tasks = [(schema, fmt, batch_seed, size)
+             for batch_seed, size in _batch_plan(amount, batch_size, seed)]
+
+    with open(path, "w", encoding="utf-8", newline="", buffering=1 << 20) as f:
+        if fmt == "csv":
+            csv.writer(f, lineterminator="\n").writerow(schema)
+        if workers > 1:
+            with Pool(workers) as pool:
+                for chunk in pool.imap(_render_batch, tasks):
+                    f.write(chunk)
+        else:
+            for task in tasks:
+                f.write(_render_batch(task))
+    return amount
@@ -3,6 +3,82 @@ Utilities for basic hashing
 """
 
 import hashlib
+import os
+import struct
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache, partial
+
+try:
+    import mmh3 as _mmh3
+except ImportError:
+    _mmh3 = None
+
+try:
+    import xxhash as _xxhash
+except ImportError:
+    _xxhash = None
+
+
+_CHUNK_SIZE = 1 << 20
+_DEFAULT_ALGORITHMS = ("md5", "sha1", "sha256")
+_buffers = threading.local()
+
+_MASK32 = 0xFFFFFFFF
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+_XXH32_P1, _XXH32_P2, _XXH32_P3 = 0x9E3779B1, 0x85EBCA77, 0xC2B2AE3D
+_XXH32_P4, _XXH32_P5 = 0x27D4EB2F, 0x165667B1
+_XXH64_P1, _XXH64_P2 = 0x9E3779B185EBCA87, 0xC2B2AE3D27D4EB4F
+_XXH64_P3, _XXH64_P4 = 0x165667B19E3779F9, 0x85EBCA77C2B2AE63
+_XXH64_P5 = 0x27D4EB2F165667C5
+
+_GEAR = tuple(int.from_bytes(hashlib.sha256(bytes([i])).digest()[:4], "big")
+              for i in range(256))
+_MANIFEST_VERSION = 1
+
+
+@lru_cache(maxsize=None)
+def _hash_constructor(algorithm: str):
+    """Resolves and validates an algorithm name once, returning its constructor."""
+    algo = algorithm.lower()
+    if algo not in hashlib.algorithms_available:
+        raise ValueError(f"Algorithm {algorithm} is not supported.")
+    return getattr(hashlib, algo, None) or partial(hashlib.new, algo)
+
+
+def _hashers(algorithms) -> dict:
+    """Maps each algorithm name, or a single bare name, to a fresh hash object."""
+    if isinstance(algorithms, str):
+        algorithms = (algorithms,)
+    return {algo: _hash_constructor(algo)() for algo in algorithms}
+
+
+def _read_buffer(chunk_size: int) -> bytearray:
+    """Returns a read buffer reused by every file hashed on this thread."""
+    buf = getattr(_buffers, "buf", None)
+    if buf is None or len(buf) != chunk_size:
+        buf = _buffers.buf = bytearray(chunk_size)
+    return buf
+
+
+def _feed_stream(stream, hashers, chunk_size: int) -> None:
+    """Reads a binary stream in chunks into a reused buffer, updating every hasher."""
+    buf = _read_buffer(chunk_size)
+    view = memoryview(buf)
+    while True:
+        n = stream.readinto(buf)
+        if not n:
+            break
+        chunk = view[:n]
+        for h in hashers:
+            h.update(chunk)
+
+
+def _feed_file(path, hashers, chunk_size: int) -> None:
+    """Reads a file in chunks into a reused buffer, updating every hasher."""
+    with open(path, "rb", buffering=0) as f:
+        _feed_stream(f, hashers, chunk_size)
 
 
 def generate_hash(text: str, algorithm: str = "sha256") -> str:
@@ -13,7 +89,7 @@ def generate_hash(text: str, algorithm: str = "sha256") -> str:
     text : str
         The input string to be hashed
     algorithm : str, optional
-        The hashing algorithm to use (e.g., 'md5', 'sha1', 'sha256'), 
+        The hashing algorithm to use (e.g., 'md5', 'sha1', 'sha256'),
         by default "sha256"
 
     Returns
@@ -24,11 +100,921 @@ def generate_hash(text: str, algorithm: str = "sha256") -> str:
     Raises
     ------
     ValueError
-        If the specified algorithm is not supported by the system's 
+        If the specified algorithm is not supported by the system's
         hashlib implementation
     """
-    algo = algorithm.lower()
-    if algo in hashlib.algorithms_available:
-        return hashlib.new(algo, text.encode()).hexdigest()
+    return _hash_constructor(algorithm)(text.encode()).hexdigest()
+
+
+def generate_hashes(text: str, algorithms=_DEFAULT_ALGORITHMS) -> dict:
+    """Generates several hexadecimal hashes of the input text in one pass.
+
+    The text is encoded once and each chunk is fed to every hash object
+    while it is still in cache.
+
+    Parameters
+    ----------
+    text : str
+        The input string to be hashed
+    algorithms : str or iterable of str, optional
+        The hashing algorithm or algorithms to use, by default
+        ("md5", "sha1", "sha256")
+
+    Returns
+    -------
+    dict
+        A dictionary mapping each algorithm name to its hexadecimal hash
+
+    Raises
+    ------
+    ValueError
+        If any of the algorithms is not supported
+    """
+    hashers = _hashers(algorithms)
+    view = memoryview(text.encode())
+    for start in range(0, len(view), _CHUNK_SIZE):
+        chunk = view[start:start + _CHUNK_SIZE]
+        for h in hashers.values():
+            h.update(chunk)
+    return {algo: h.hexdigest() for algo, h in hashers.items()}
+
+
+def hash_many(texts, algorithm: str = "sha256") -> list[str]:
+    """Generates hexadecimal hashes for many strings.
+
+    The algorithm is resolved once and every hash starts as a copy of one
+    prototype hash object.
+
+    Parameters
+    ----------
+    texts : iterable of str
+        The input strings to be hashed
+    algorithm : str, optional
+        The hashing algorithm to use, by default "sha256"
+
+    Returns
+    -------
+    list of str
+        The hexadecimal hash of each string, in input order
+
+    Raises
+    ------
+    ValueError
+        If the specified algorithm is not supported
+    """
+    copy = _hash_constructor(algorithm)().copy
+    results = []
+    append = results.append
+    for text in texts:
+        h = copy()
+        h.update(text.encode())
+        append(h.hexdigest())
+    return results
+
+
+def hash_file(path, algorithm: str = "sha256", chunk_size: int = _CHUNK_SIZE) -> str:
+    """Generates a hexadecimal hash of a file without loading it into memory.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The file to hash
+    algorithm : str, optional
+        The hashing algorithm to use, by default "sha256"
+    chunk_size : int, optional
+        The number of bytes read per chunk, by default 1 MiB
+
+    Returns
+    -------
+    str
+        The resulting hexadecimal hash string
+
+    Raises
+    ------
+    ValueError
+        If the specified algorithm is not supported
+    OSError
+        If the file cannot be read
+    """
+    h = _hash_constructor(algorithm)()
+    _feed_file(path, (h,), chunk_size)
+    return h.hexdigest()
+
+
+def hash_stream(stream, algorithm: str = "sha256", chunk_size: int = _CHUNK_SIZE) -> str:
+    """Generates a hexadecimal hash of a binary stream, such as stdin or a
+    socket file, reading it to the end in chunks.
+
+    Parameters
+    ----------
+    stream : binary file object
+        The stream to hash, read with readinto
+    algorithm : str, optional
+        The hashing algorithm to use, by default "sha256"
+    chunk_size : int, optional
+        The number of bytes read per chunk, by default 1 MiB
+
+    Returns
+    -------
+    str
+        The resulting hexadecimal hash string
+
+    Raises
+    ------
+    ValueError
+        If the specified algorithm is not supported
+    """
+    h = _hash_constructor(algorithm)()
+    _feed_stream(stream, (h,), chunk_size)
+    return h.hexdigest()
+
+
+def hash_file_multi(path, algorithms=_DEFAULT_ALGORITHMS,
+                    chunk_size: int = _CHUNK_SIZE) -> dict:
+    """Generates several hexadecimal hashes of a file in a single read pass.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The file to hash
+    algorithms : str or iterable of str, optional
+        The hashing algorithm or algorithms to use, by default
+        ("md5", "sha1", "sha256")
+    chunk_size : int, optional
+        The number of bytes read per chunk, by default 1 MiB
+
+    Returns
+    -------
+    dict
+        A dictionary mapping each algorithm name to its hexadecimal hash
+
+    Raises
+    ------
+    ValueError
+        If any of the algorithms is not supported
+    OSError
+        If the file cannot be read
+    """
+    hashers = _hashers(algorithms)
+    _feed_file(path, hashers.values(), chunk_size)
+    return {algo: h.hexdigest() for algo, h in hashers.items()}
+
+
+def hash_files(paths, algorithm: str = "sha256", workers: int = None,
+               chunk_size: int = _CHUNK_SIZE):
+    """Hashes many files on a thread pool, yielding results as they finish.
+
+    hashlib releases the GIL while hashing large buffers, so threads hash
+    several files at once. Only a bounded number of files are in flight at
+    a time, so paths can be a lazy iterable over a huge directory tree.
+
+    Parameters
+    ----------
+    paths : iterable of str or os.PathLike
+        The files to hash
+    algorithm : str, optional
+        The hashing algorithm to use, by default "sha256"
+    workers : int, optional
+        The number of hashing threads, by default min(32, cpu count + 4)
+    chunk_size : int, optional
+        The number of bytes read per chunk, by default 1 MiB
+
+    Yields
+    ------
+    tuple
+        (path, hexadecimal hash string) pairs in completion order
+
+    Raises
+    ------
+    ValueError
+        If the specified algorithm is not supported
+    OSError
+        If a file cannot be read
+    """
+    _hash_constructor(algorithm)
+    if workers is None:
+        workers = min(32, (os.cpu_count() or 1) + 4)
+    max_pending = workers * 4
+    paths = iter(paths)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {}
+        while True:
+            for path in paths:
+                future = executor.submit(hash_file, path, algorithm, chunk_size)
+                pending[future] = path
+                if len(pending) >= max_pending:
+                    break
+            if not pending:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+
+
+def _to_bytes(data) -> bytes:
+    """Encodes str input as UTF-8 and passes bytes-like input through."""
+    return data.encode() if isinstance(data, str) else data
+
+
+def fnv1a_32(data) -> int:
+    """Computes the 32-bit FNV-1a hash of the input.
+
+    Parameters
+    ----------
+    data : str or bytes
+        The input to hash; strings are encoded as UTF-8
+
+    Returns
+    -------
+    int
+        The unsigned 32-bit hash, identical in every process
+    """
+    h = 0x811C9DC5
+    for byte in _to_bytes(data):
+        h = ((h ^ byte) * 0x01000193) & _MASK32
+    return h
+
+
+def fnv1a_64(data) -> int:
+    """Computes the 64-bit FNV-1a hash of the input.
+
+    Parameters
+    ----------
+    data : str or bytes
+        The input to hash; strings are encoded as UTF-8
+
+    Returns
+    -------
+    int
+        The unsigned 64-bit hash, identical in every process
+    """
+    h = 0xCBF29CE484222325
+    for byte in _to_bytes(data):
+        h = ((h ^ byte) * 0x100000001B3) & _MASK64
+    return h
+
+
+def _rotl32(x: int, r: int) -> int:
+    return ((x << r) | (x >> (32 - r))) & _MASK32
+
+
+def _rotl64(x: int, r: int) -> int:
+    return ((x << r) | (x >> (64 - r))) & _MASK64
+
+
+def _murmur3_32(data: bytes, seed: int) -> int:
+    """Pure Python MurmurHash3 (x86, 32-bit)."""
+    c1, c2 = 0xCC9E2D51, 0x1B873593
+    h = seed & _MASK32
+    length = len(data)
+    tail_start = length & ~3
+    for (k,) in struct.iter_unpack("<I", data[:tail_start]):
+        k = (k * c1) & _MASK32
+        k = ((k << 15) | (k >> 17)) & _MASK32
+        h ^= (k * c2) & _MASK32
+        h = ((h << 13) | (h >> 19)) & _MASK32
+        h = (h * 5 + 0xE6546B64) & _MASK32
+    tail = data[tail_start:]
+    if tail:
+        k = int.from_bytes(tail, "little")
+        k = (k * c1) & _MASK32
+        k = _rotl32(k, 15)
+        h ^= (k * c2) & _MASK32
+    h ^= length
+    h ^= h >> 16
+    h = (h * 0x85EBCA6B) & _MASK32
+    h ^= h >> 13
+    h = (h * 0xC2B2AE35) & _MASK32
+    return h ^ (h >> 16)
+
+
+def murmur3_32(data, seed: int = 0) -> int:
+    """Computes the 32-bit MurmurHash3 (x86 variant) of the input.
+
+    Uses the mmh3 package when it is installed and an equivalent pure
+    Python implementation otherwise.
+
+    Parameters
+    ----------
+    data : str or bytes
+        The input to hash; strings are encoded as UTF-8
+    seed : int, optional
+        The hash seed, by default 0
+
+    Returns
+    -------
+    int
+        The unsigned 32-bit hash, identical in every process
+    """
+    data = _to_bytes(data)
+    if _mmh3 is not None:
+        return _mmh3.hash(data, seed & _MASK32, signed=False)
+    return _murmur3_32(data, seed)
+
 
-    raise ValueError(f"Algorithm {algorithm} is not supported.")
\ No newline at end of file
+def _xxh32(data: bytes, seed: int) -> int:
+    """Pure Python xxHash32."""
+    p1, p2, p3, p4, p5 = _XXH32_P1, _XXH32_P2, _XXH32_P3, _XXH32_P4, _XXH32_P5
+    length = len(data)
+    seed &= _MASK32
+    offset = 0
+    if length >= 16:
+        v1 = (seed + p1 + p2) & _MASK32
+        v2 = (seed + p2) & _MASK32
+        v3 = seed
+        v4 = (seed - p1) & _MASK32
+        stripes_end = length & ~15
+        for a, b, c, d in struct.iter_unpack("<4I", data[:stripes_end]):
+            v1 = (_rotl32((v1 + a * p2) & _MASK32, 13) * p1) & _MASK32
+            v2 = (_rotl32((v2 + b * p2) & _MASK32, 13) * p1) & _MASK32
+            v3 = (_rotl32((v3 + c * p2) & _MASK32, 13) * p1) & _MASK32
+            v4 = (_rotl32((v4 + d * p2) & _MASK32, 13) * p1) & _MASK32
+        h = (_rotl32(v1, 1) + _rotl32(v2, 7) + _rotl32(v3, 12) + _rotl32(v4, 18)) & _MASK32
+        offset = stripes_end
+    else:
+        h = (seed + p5) & _MASK32
+    h = (h + length) & _MASK32
+    words_end = offset + ((length - offset) & ~3)
+    for (k,) in struct.iter_unpack("<I", data[offset:words_end]):
+        h = (_rotl32((h + k * p3) & _MASK32, 17) * p4) & _MASK32
+    for byte in data[words_end:]:
+        h = (_rotl32((h + byte * p5) & _MASK32, 11) * p1) & _MASK32
+    h ^= h >> 15
+    h = (h * p2) & _MASK32
+    h ^= h >> 13
+    h = (h * p3) & _MASK32
+    return h ^ (h >> 16)
+
+
+def _xxh64_round(acc: int, lane: int) -> int:
+    acc = (acc + lane * _XXH64_P2) & _MASK64
+    return (_rotl64(acc, 31) * _XXH64_P1) & _MASK64
+
+
+def _xxh64_merge(acc: int, v: int) -> int:
+    acc ^= _xxh64_round(0, v)
+    return (acc * _XXH64_P1 + _XXH64_P4) & _MASK64
+
+
+def _xxh64(data: bytes, seed: int) -> int:
+    """Pure Python xxHash64."""
+    p1, p2, p3, p4, p5 = _XXH64_P1, _XXH64_P2, _XXH64_P3, _XXH64_P4, _XXH64_P5
+    length = len(data)
+    seed &= _MASK64
+    offset = 0
+    if length >= 32:
+        v1 = (seed + p1 + p2) & _MASK64
+        v2 = (seed + p2) & _MASK64
+        v3 = seed
+        v4 = (seed - p1) & _MASK64
+        stripes_end = length & ~31
+        for a, b, c, d in struct.iter_unpack("<4Q", data[:stripes_end]):
+            v1 = _xxh64_round(v1, a)
+            v2 = _xxh64_round(v2, b)
+            v3 = _xxh64_round(v3, c)
+            v4 = _xxh64_round(v4, d)
+        h = (_rotl64(v1, 1) + _rotl64(v2, 7) + _rotl64(v3, 12) + _rotl64(v4, 18)) & _MASK64
+        for v in (v1, v2, v3, v4):
+            h = _xxh64_merge(h, v)
+        offset = stripes_end
+    else:
+        h = (seed + p5) & _MASK64
+    h = (h + length) & _MASK64
+    lanes_end = offset + ((length - offset) & ~7)
+    for (k,) in struct.iter_unpack("<Q", data[offset:lanes_end]):
+        h ^= _xxh64_round(0, k)
+        h = (_rotl64(h, 27) * p1 + p4) & _MASK64
+    offset = lanes_end
+    if length - offset >= 4:
+        (k,) = struct.unpack_from("<I", data, offset)
+        h ^= (k * p1) & _MASK64
+        h = (_rotl64(h, 23) * p2 + p3) & _MASK64
+        offset += 4
+    for byte in data[offset:]:
+        h ^= (byte * p5) & _MASK64
+        h = (_rotl64(h, 11) * p1) & _MASK64
+    h ^= h >> 33
+    h = (h * p2) & _MASK64
+    h ^= h >> 29
+    h = (h * p3) & _MASK64
+    return h ^ (h >> 32)
+
+
+def xxh32(data, seed: int = 0) -> int:
+    """Computes the 32-bit xxHash of the input.
+
+    Uses the xxhash package when it is installed and an equivalent pure
+    Python implementation otherwise.
+
+    Parameters
+    ----------
+    data : str or bytes
+        The input to hash; strings are encoded as UTF-8
+    seed : int, optional
+        The hash seed, by default 0
+
+    Returns
+    -------
+    int
+        The unsigned 32-bit hash, identical in every process
+    """
+    data = _to_bytes(data)
+    if _xxhash is not None:
+        return _xxhash.xxh32_intdigest(data, seed & _MASK32)
+    return _xxh32(bytes(data), seed)
+
+
+def xxh64(data, seed: int = 0) -> int:
+    """Computes the 64-bit xxHash of the input.
+
+    Uses the xxhash package when it is installed and an equivalent pure
+    Python implementation otherwise.
+
+    Parameters
+    ----------
+    data : str or bytes
+        The input to hash; strings are encoded as UTF-8
+    seed : int, optional
+        The hash seed, by default 0
+
+    Returns
+    -------
+    int
+        The unsigned 64-bit hash, identical in every process
+    """
+    data = _to_bytes(data)
+    if _xxhash is not None:
+        return _xxhash.xxh64_intdigest(data, seed & _MASK64)
+    return _xxh64(bytes(data), seed)
+
+
+def _mix64(h: int) -> int:
+    """MurmurHash3 64-bit finalizer, spreading every input bit over the output."""
+    h ^= h >> 33
+    h = (h * 0xFF51AFD7ED558CCD) & _MASK64
+    h ^= h >> 33
+    h = (h * 0xC4CEB9FE1A85EC53) & _MASK64
+    return h ^ (h >> 33)
+
+
+def jump_hash(key, num_buckets: int) -> int:
+    """Assigns a key to one of num_buckets shards with jump consistent hashing.
+
+    When num_buckets grows from n to n + 1, only about 1 / (n + 1) of the
+    keys move, and they all move to the new bucket.
+
+    Parameters
+    ----------
+    key : int, str or bytes
+        The key to place; strings and bytes are hashed with fnv1a_64 first
+    num_buckets : int
+        The number of shards, at least 1
+
+    Returns
+    -------
+    int
+        The shard index in range(num_buckets)
+
+    Raises
+    ------
+    ValueError
+        If num_buckets is less than 1
+    """
+    if num_buckets < 1:
+        raise ValueError("num_buckets must be at least 1.")
+    if not isinstance(key, int):
+        key = fnv1a_64(key)
+    key &= _MASK64
+    b, j = -1, 0
+    while j < num_buckets:
+        b = j
+        key = (key * 2862933555777941757 + 1) & _MASK64
+        j = int((b + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return b
+
+
+def rendezvous_hash(key, nodes):
+    """Picks the node for a key with rendezvous (highest random weight) hashing.
+
+    Every node is scored against the key and the highest score wins, so
+    adding or removing a node only moves the keys that node wins or owned.
+
+    Parameters
+    ----------
+    key : str or bytes
+        The key to place
+    nodes : iterable of str or bytes
+        The candidate nodes
+
+    Returns
+    -------
+    str or bytes
+        The winning node
+
+    Raises
+    ------
+    ValueError
+        If nodes is empty
+    """
+    key = _to_bytes(key)
+    best, best_score = None, -1
+    for node in nodes:
+        score = _mix64(fnv1a_64(_to_bytes(node) + b"\x00" + key))
+        if score > best_score:
+            best, best_score = node, score
+    if best is None:
+        raise ValueError("nodes must not be empty.")
+    return best
+
+
+def _cdc_masks(avg_size: int) -> tuple[int, int]:
+    """Builds the strict and loose Gear masks for normalized chunking.
+
+    The mask bits sit at the top of the 32-bit Gear hash, so a boundary
+    depends on the last 32 bytes rather than only the last few.
+    """
+    bits = max(avg_size.bit_length() - 1, 2)
+    strict = ((1 << (bits + 1)) - 1) << (32 - bits - 1)
+    loose = ((1 << (bits - 1)) - 1) << (32 - bits + 1)
+    return strict, loose
+
+
+def _cdc_cut(data: bytes, pos: int, min_size: int, avg_size: int, max_size: int,
+             strict: int, loose: int) -> int:
+    """Returns the length of the chunk starting at pos.
+
+    data must hold at least max_size bytes after pos unless the stream has
+    ended, so the cut found here is final.
+    """
+    remaining = len(data) - pos
+    if remaining <= min_size:
+        return remaining
+    gear, mask = _GEAR, _MASK32
+    h = 0
+    normal = min(avg_size, remaining)
+    limit = min(max_size, remaining)
+    i = min_size
+    for byte in data[pos + min_size:pos + normal]:
+        h = ((h << 1) + gear[byte]) & mask
+        i += 1
+        if not h & strict:
+            return i
+    for byte in data[pos + normal:pos + limit]:
+        h = ((h << 1) + gear[byte]) & mask
+        i += 1
+        if not h & loose:
+            return i
+    return limit
+
+
+def chunk_file(path, algorithm: str = "sha256", min_size: int = 16384,
+               avg_size: int = 65536, max_size: int = 262144,
+               read_size: int = 4 * _CHUNK_SIZE):
+    """Splits a file into content-defined chunks and hashes each one.
+
+    Chunk boundaries come from a rolling Gear hash over the content, so an
+    insertion or deletion only changes the chunks around the edit, and the
+    rest of the file keeps the same chunks and digests.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The file to chunk
+    algorithm : str, optional
+        The hashing algorithm for chunk digests, by default "sha256"
+    min_size : int, optional
+        The smallest chunk size in bytes, by default 16 KiB
+    avg_size : int, optional
+        The target average chunk size in bytes, by default 64 KiB
+    max_size : int, optional
+        The largest chunk size in bytes, by default 256 KiB
+    read_size : int, optional
+        The number of bytes read from the file at a time, by default 4 MiB
+
+    Yields
+    ------
+    tuple
+        (offset, length, hexadecimal hash string) for each chunk in order
+
+    Raises
+    ------
+    ValueError
+        If the algorithm is not supported or the sizes are not increasing
+    """
+    if not 0 < min_size < avg_size < max_size:
+        raise ValueError("Chunk sizes must satisfy 0 < min_size < avg_size < max_size.")
+    new_hash = _hash_constructor(algorithm)
+    strict, loose = _cdc_masks(avg_size)
+    read_size = max(read_size, max_size)
+    offset = 0
+    with open(path, "rb") as f:
+        data, pos, eof = b"", 0, False
+        while True:
+            if not eof and len(data) - pos < max_size:
+                block = f.read(read_size)
+                eof = not block
+                data = data[pos:] + block
+                pos = 0
+                continue
+            if pos == len(data):
+                return
+            length = _cdc_cut(data, pos, min_size, avg_size, max_size, strict, loose)
+            yield offset, length, new_hash(data[pos:pos + length]).hexdigest()
+            offset += length
+            pos += length
+
+
+def chunk_manifest(path, algorithm: str = "sha256", min_size: int = 16384,
+                   avg_size: int = 65536, max_size: int = 262144) -> dict:
+    """Builds a JSON-serializable chunk manifest of a file.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The file to describe
+    algorithm : str, optional
+        The hashing algorithm for chunk digests, by default "sha256"
+    min_size : int, optional
+        The smallest chunk size in bytes, by default 16 KiB
+    avg_size : int, optional
+        The target average chunk size in bytes, by default 64 KiB
+    max_size : int, optional
+        The largest chunk size in bytes, by default 256 KiB
+
+    Returns
+    -------
+    dict
+        The chunking parameters, the total size and a "chunks" list of
+        [offset, length, hexadecimal hash string] entries
+    """
+    chunks = [list(chunk) for chunk in
+              chunk_file(path, algorithm, min_size, avg_size, max_size)]
+    return {
+        "version": _MANIFEST_VERSION,
+        "algorithm": algorithm.lower(),
+        "min_size": min_size,
+        "avg_size": avg_size,
+        "max_size": max_size,
+        "size": sum(length for _, length, _ in chunks),
+        "chunks": chunks,
+    }
+
+
+def diff_manifests(old: dict, new: dict) -> dict:
+    """Compares two chunk manifests of a file.
+
+    Parameters
+    ----------
+    old : dict
+        The manifest of the previous version, from chunk_manifest
+    new : dict
+        The manifest of the current version, from chunk_manifest
+
+    Returns
+    -------
+    dict
+        "changed": chunks of the new version that do not exist in the old
+        one and must be re-transferred, as [offset, length, hash] entries.
+        "reused": chunks that can be copied from the old version, as
+        [new_offset, length, hash, old_offset] entries.
+        "changed_bytes": the total size of the changed chunks
+
+    Raises
+    ------
+    ValueError
+        If the manifests were built with different parameters
+    """
+    keys = ("algorithm", "min_size", "avg_size", "max_size")
+    if any(old[key] != new[key] for key in keys):
+        raise ValueError("Manifests were built with different chunking parameters.")
+    known = {}
+    for offset, _, digest in old["chunks"]:
+        known.setdefault(digest, offset)
+    changed, reused = [], []
+    for offset, length, digest in new["chunks"]:
+        if digest in known:
+            reused.append([offset, length, digest, known[digest]])
+        else:
+            changed.append([offset, length, digest])
+    return {
+        "changed": changed,
+        "reused": reused,
+        "changed_bytes": sum(length for _, length, _ in changed),
+    }
+
+
+def _leaf_digest(new_hash, block) -> bytes:
+    """Hashes a Merkle leaf without copying the block."""
+    h = new_hash(b"\x00")
+    h.update(block)
+    return h.digest()
+
+
+def _hash_block_range(path, algorithm: str, block_size: int, start: int, stop: int) -> list:
+    """Hashes blocks start..stop of a file as Merkle leaves on one thread."""
+    new_hash = _hash_constructor(algorithm)
+    leaves = []
+    with open(path, "rb") as f:
+        f.seek(start * block_size)
+        for _ in range(start, stop):
+            leaves.append(_leaf_digest(new_hash, f.read(block_size)))
+    return leaves
+
+
+class MerkleTree:
+    """A binary Merkle tree over fixed-size blocks.
+
+    Leaves are hash(0x00 + block) and inner nodes are hash(0x01 + left + right),
+    so a leaf can never be passed off as an inner node. A node without a
+    sibling is carried up to the next level unchanged.
+
+    Parameters
+    ----------
+    leaves : list of bytes
+        The leaf digests, as returned by MerkleTree.leaf_hash
+    algorithm : str, optional
+        The hashing algorithm to use, by default "sha256"
+
+    Raises
+    ------
+    ValueError
+        If the algorithm is not supported or there are no leaves
+    """
+
+    def __init__(self, leaves: list, algorithm: str = "sha256"):
+        if not leaves:
+            raise ValueError("A Merkle tree needs at least one leaf.")
+        self.algorithm = algorithm.lower()
+        self._new_hash = _hash_constructor(algorithm)
+        self._levels = [list(leaves)]
+        while len(self._levels[-1]) > 1:
+            below = self._levels[-1]
+            self._levels.append([self._node(below[i], below[i + 1]) if i + 1 < len(below)
+                                 else below[i] for i in range(0, len(below), 2)])
+
+    @classmethod
+    def from_bytes(cls, data: bytes, block_size: int = _CHUNK_SIZE,
+                   algorithm: str = "sha256", workers: int = None) -> "MerkleTree":
+        """Builds a tree over in-memory data, hashing blocks on a thread pool.
+
+        Parameters
+        ----------
+        data : bytes
+            The payload to hash
+        block_size : int, optional
+            The size of each leaf block, by default 1 MiB
+        algorithm : str, optional
+            The hashing algorithm to use, by default "sha256"
+        workers : int, optional
+            The number of hashing threads, by default the CPU count
+
+        Returns
+        -------
+        MerkleTree
+            The tree over data
+        """
+        new_hash = _hash_constructor(algorithm)
+        view = memoryview(data)
+        blocks = [view[i:i + block_size] for i in range(0, len(view), block_size)] or [b""]
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as executor:
+            leaves = list(executor.map(partial(_leaf_digest, new_hash), blocks))
+        return cls(leaves, algorithm)
+
+    @classmethod
+    def from_file(cls, path, block_size: int = _CHUNK_SIZE, algorithm: str = "sha256",
+                  workers: int = None) -> "MerkleTree":
+        """Builds a tree over a file, each thread hashing a contiguous run of blocks.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            The file to hash
+        block_size : int, optional
+            The size of each leaf block, by default 1 MiB
+        algorithm : str, optional
+            The hashing algorithm to use, by default "sha256"
+        workers : int, optional
+            The number of hashing threads, by default the CPU count
+
+        Returns
+        -------
+        MerkleTree
+            The tree over the file contents
+        """
+        _hash_constructor(algorithm)
+        workers = workers or os.cpu_count() or 1
+        count = max(-(-os.path.getsize(path) // block_size), 1)
+        step = -(-count // workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            parts = executor.map(lambda start: _hash_block_range(
+                path, algorithm, block_size, start, min(start + step, count)),
+                range(0, count, step))
+            leaves = [leaf for part in parts for leaf in part]
+        return cls(leaves, algorithm)
+
+    def _node(self, left: bytes, right: bytes) -> bytes:
+        return self._new_hash(b"\x01" + left + right).digest()
+
+    def leaf_hash(self, block: bytes) -> bytes:
+        """Returns the leaf digest of a block."""
+        return _leaf_digest(self._new_hash, block)
+
+    def __len__(self) -> int:
+        return len(self._levels[0])
+
+    @property
+    def root(self) -> str:
+        """The hexadecimal root hash of the tree."""
+        return self._levels[-1][0].hex()
+
+    def proof(self, index: int) -> list[tuple[str, str]]:
+        """Builds an inclusion proof for one block.
+
+        Parameters
+        ----------
+        index : int
+            The index of the block
+
+        Returns
+        -------
+        list of tuple
+            (sibling hexadecimal hash, "left" or "right") pairs from the
+            leaf up to the root, for use with verify_merkle_proof
+
+        Raises
+        ------
+        IndexError
+            If the index is out of range
+        """
+        if not 0 <= index < len(self):
+            raise IndexError("Block index out of range.")
+        path = []
+        for level in self._levels[:-1]:
+            sibling = index ^ 1
+            if sibling < len(level):
+                path.append((level[sibling].hex(), "left" if sibling < index else "right"))
+            index //= 2
+        return path
+
+    def update(self, index: int, block: bytes) -> str:
+        """Replaces one block and recomputes only the nodes on its path.
+
+        Parameters
+        ----------
+        index : int
+            The index of the block to replace
+        block : bytes
+            The new contents of the block
+
+        Returns
+        -------
+        str
+            The new hexadecimal root hash
+
+        Raises
+        ------
+        IndexError
+            If the index is out of range
+        """
+        if not 0 <= index < len(self):
+            raise IndexError("Block index out of range.")
+        self._levels[0][index] = self.leaf_hash(block)
+        for below, level in zip(self._levels, self._levels[1:]):
+            left = index & ~1
+            parent = index // 2
+            if left + 1 < len(below):
+                level[parent] = self._node(below[left], below[left + 1])
+            else:
+                level[parent] = below[left]
+            index = parent
+        return self.root
+
+
+def verify_merkle_proof(block: bytes, proof: list, root: str,
+                        algorithm: str = "sha256") -> bool:
+    """Checks that a block belongs to a Merkle tree with the given root.
+
+    Parameters
+    ----------
+    block : bytes
+        The block contents
+    proof : list of tuple
+        The inclusion proof, from MerkleTree.proof
+    root : str
+        The expected hexadecimal root hash
+    algorithm : str, optional
+        The hashing algorithm the tree was built with, by default "sha256"
+
+    Returns
+    -------
+    bool
+        True if the proof leads from the block to the root, False otherwise
+    """
+    new_hash = _hash_constructor(algorithm)
+    h = _leaf_digest(new_hash, block)
+    for sibling, side in proof:
+        sibling = bytes.fromhex(sibling)
+        pair = sibling + h if side == "left" else h + sibling
+        h = new_hash(b"\x01" + pair).digest()
+    return h.hex() == root
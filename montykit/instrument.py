@@ -0,0 +1,309 @@
+"""
+Opt-in instrumentation for montykit's public functions
+
+Nothing is wrapped until enable() is called (or MONTYKIT_INSTRUMENT=1 is set
+before montykit is imported), so there is no overhead when it is off. Once
+enabled, every public function records its call count, errors, cumulative
+and percentile latency, and input size.
+"""
+
+import atexit
+import functools
+import importlib.abc
+import importlib.machinery
+import inspect
+import json
+import os
+import random
+import sys
+import threading
+import time
+
+
+_RESERVOIR_SIZE = 1024
+_QUANTILES = (0.5, 0.9, 0.99)
+_lock = threading.Lock()
+_random = random.Random()
+_stats = {}
+_originals = {}
+
+
+class _Stats:
+    """Running totals for one function plus a bounded latency sample."""
+
+    __slots__ = ("calls", "errors", "seconds", "max_seconds", "input_size", "samples")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.input_size = 0
+        self.samples = []
+
+    def record(self, seconds: float, args: tuple, failed: bool):
+        size = _input_size(args)
+        with _lock:
+            self.calls += 1
+            self.errors += failed
+            self.seconds += seconds
+            self.input_size += size
+            if seconds > self.max_seconds:
+                self.max_seconds = seconds
+            # Reservoir sampling keeps a uniform sample of every call's latency
+            if len(self.samples) < _RESERVOIR_SIZE:
+                self.samples.append(seconds)
+            else:
+                index = _random.randrange(self.calls)
+                if index < _RESERVOIR_SIZE:
+                    self.samples[index] = seconds
+
+
+def _input_size(args: tuple) -> int:
+    """len() of the first argument (characters, bytes or items), or 0."""
+    if args:
+        try:
+            return len(args[0])
+        except TypeError:
+            pass
+    return 0
+
+
+def _wrap(func, stats: _Stats):
+    """Wraps a function (or generator function) to record into stats."""
+    if inspect.isgeneratorfunction(func):
+        @functools.wraps(func)
+        def generator_wrapper(*args, **kwargs):
+            # Only time spent inside the generator counts, not the consumer's
+            elapsed, failed = 0.0, True
+            iterator = func(*args, **kwargs)
+            try:
+                while True:
+                    start = time.perf_counter()
+                    try:
+                        item = next(iterator)
+                    except StopIteration:
+                        failed = False
+                        return
+                    finally:
+                        elapsed += time.perf_counter() - start
+                    try:
+                        yield item
+                    except GeneratorExit:
+                        # The consumer stopped early (break, islice), which is not an error
+                        failed = False
+                        iterator.close()
+                        raise
+            finally:
+                stats.record(elapsed, args, failed)
+        return generator_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        failed = True
+        try:
+            result = func(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            stats.record(time.perf_counter() - start, args, failed)
+    return wrapper
+
+
+def _wrap_module(module_name: str, module) -> None:
+    """Wraps the public functions of one imported montykit submodule."""
+    import montykit
+    with _lock:
+        for name in montykit._SUBMODULES[module_name]:
+            func = getattr(module, name)
+            if name in _originals or not inspect.isfunction(func):
+                continue
+            _originals[name] = (module, func)
+            wrapped = _wrap(func, _stats.setdefault(name, _Stats()))
+            setattr(module, name, wrapped)
+            setattr(montykit, name, wrapped)
+
+
+class _WrapOnImport(importlib.abc.MetaPathFinder):
+    """Wraps a montykit submodule's public functions as soon as it is
+    imported, so enabling instrumentation does not import every submodule."""
+
+    def find_spec(self, fullname, path, target=None):
+        package, _, module_name = fullname.rpartition(".")
+        if package != "montykit" or module_name not in sys.modules["montykit"]._SUBMODULES:
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path)
+        if spec is None or spec.loader is None:
+            return None
+        exec_module = spec.loader.exec_module
+
+        def exec_and_wrap(module):
+            exec_module(module)
+            _wrap_module(module_name, module)
+        spec.loader.exec_module = exec_and_wrap
+        return spec
+
+
+_hook = _WrapOnImport()
+
+
+def enable() -> None:
+    """Wraps every public montykit function to record metrics.
+
+    Each submodule attribute and package attribute is replaced, so calls
+    through montykit, montykit.<submodule> and calls between montykit
+    functions are all recorded. Submodules that are already imported are
+    wrapped right away and the rest when they are first imported, so
+    enabling keeps submodule imports lazy. Names imported with
+    ``from ... import`` before enable() keep pointing at the unwrapped
+    function.
+    """
+    import montykit
+    with _lock:
+        if _hook in sys.meta_path:
+            return
+        sys.meta_path.insert(0, _hook)
+    for module_name in montykit._SUBMODULES:
+        module = sys.modules.get(f"montykit.{module_name}")
+        if module is not None:
+            _wrap_module(module_name, module)
+
+
+def disable() -> None:
+    """Restores the original functions. Recorded metrics are kept."""
+    import montykit
+    with _lock:
+        if _hook in sys.meta_path:
+            sys.meta_path.remove(_hook)
+        for name, (module, func) in _originals.items():
+            setattr(module, name, func)
+            setattr(montykit, name, func)
+        _originals.clear()
+
+
+def is_enabled() -> bool:
+    """Checks if instrumentation is currently enabled."""
+    return _hook in sys.meta_path
+
+
+def reset() -> None:
+    """Clears all recorded metrics."""
+    with _lock:
+        for stats in _stats.values():
+            stats.__init__()
+
+
+def _percentile(ordered: list, fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+
+def snapshot() -> dict:
+    """Returns the metrics recorded so far.
+
+    Returns
+    -------
+    dict
+        Maps each function that has been called to a dict with calls,
+        errors, total_seconds, mean_ms, p50_ms, p90_ms, p99_ms, max_ms and
+        input_size (the summed len() of each call's first argument).
+        Percentiles come from a uniform sample of up to 1024 calls
+    """
+    with _lock:
+        copies = [(name, stats.calls, stats.errors, stats.seconds, stats.max_seconds,
+                   stats.input_size, sorted(stats.samples))
+                  for name, stats in _stats.items() if stats.calls]
+    result = {}
+    for name, calls, errors, seconds, max_seconds, input_size, samples in sorted(copies):
+        result[name] = {
+            "calls": calls,
+            "errors": errors,
+            "total_seconds": seconds,
+            "mean_ms": seconds / calls * 1000,
+            "p50_ms": _percentile(samples, 0.5) * 1000,
+            "p90_ms": _percentile(samples, 0.9) * 1000,
+            "p99_ms": _percentile(samples, 0.99) * 1000,
+            "max_ms": max_seconds * 1000,
+            "input_size": input_size,
+        }
+    return result
+
+
+def prometheus_text(metrics: dict = None) -> str:
+    """Formats a snapshot in the Prometheus text exposition format.
+
+    Parameters
+    ----------
+    metrics : dict, optional
+        A snapshot, by default the current one
+
+    Returns
+    -------
+    str
+        Counters for calls, errors and input size, and a latency summary
+        with 0.5/0.9/0.99 quantiles, labelled by function
+    """
+    if metrics is None:
+        metrics = snapshot()
+    lines = []
+    for metric, key, kind, help_text in [
+            ("montykit_calls_total", "calls", "counter", "Calls per montykit function."),
+            ("montykit_errors_total", "errors", "counter", "Calls that raised an exception."),
+            ("montykit_input_size_total", "input_size", "counter",
+             "Summed len() of the first argument.")]:
+        lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} {kind}"]
+        lines += [f'{metric}{{function="{name}"}} {values[key]}' for name, values in metrics.items()]
+    lines += ["# HELP montykit_latency_seconds Latency per montykit function.",
+              "# TYPE montykit_latency_seconds summary"]
+    for name, values in metrics.items():
+        for quantile in _QUANTILES:
+            key = f"p{round(quantile * 100)}_ms"
+            lines.append(f'montykit_latency_seconds{{function="{name}",quantile="{quantile}"}} '
+                         f"{values[key] / 1000:.9f}")
+        lines.append(f'montykit_latency_seconds_sum{{function="{name}"}} {values["total_seconds"]:.9f}')
+        lines.append(f'montykit_latency_seconds_count{{function="{name}"}} {values["calls"]}')
+    return "\n".join(lines) + "\n"
+
+
+def export(path, fmt: str = None) -> None:
+    """Writes the current metrics to a file.
+
+    The file is written next to its destination and renamed into place, so
+    a scraper never reads a half-written file.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The file to write
+    fmt : str, optional
+        "json" or "prometheus", by default "prometheus" for .prom files and
+        "json" otherwise
+
+    Raises
+    ------
+    ValueError
+        If the format is not supported
+    """
+    path = os.fspath(path)
+    if fmt is None:
+        fmt = "prometheus" if path.endswith(".prom") else "json"
+    if fmt == "json":
+        text = json.dumps(snapshot(), indent=2)
+    elif fmt == "prometheus":
+        text = prometheus_text()
+    else:
+        raise ValueError(f"Format {fmt} is not supported.")
+    temp = f"{path}.{os.getpid()}.tmp"
+    with open(temp, "w") as f:
+        f.write(text)
+    os.replace(temp, path)
+
+
+def _enable_from_environment() -> None:
+    """Enables instrumentation if MONTYKIT_INSTRUMENT is set, and exports
+    to MONTYKIT_INSTRUMENT_EXPORT (if set) when the process exits."""
+    if os.environ.get("MONTYKIT_INSTRUMENT", "").lower() not in ("", "0", "false", "no"):
+        enable()
+        export_path = os.environ.get("MONTYKIT_INSTRUMENT_EXPORT")
+        if export_path:
+            atexit.register(export, export_path)
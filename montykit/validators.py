@@ -2,8 +2,72 @@
 Utilities for basic validation
 """
 
+import csv
+import hashlib
+import itertools
 import json
+import math
+import mmap
+import os
 import re
+import string
+from functools import partial
+from multiprocessing import Pool
+
+
+_JSON_WS = re.compile(rb"[ \t\n\r]*")
+_JSON_STRING_BODY = re.compile(rb'[^"\\\x00-\x1f]*(?:\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4})[^"\\\x00-\x1f]*)*')
+_JSON_STRING = rb'"' + _JSON_STRING_BODY.pattern + rb'"'
+_JSON_SCALAR = (rb"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?"
+                rb"|true|false|null|NaN|Infinity|-Infinity")
+# A string or scalar only counts once the delimiter after it is in the buffer,
+# so a number split across chunks is never accepted half-read
+_JSON_ATOM = rb"(?:" + _JSON_STRING + rb"|" + _JSON_SCALAR + rb")(?=[ \t\n\r]*[,\]}])"
+_JSON_FLAT = (rb"\[[ \t\n\r]*(?:" + _JSON_ATOM + rb"(?:[ \t\n\r]*,[ \t\n\r]*" + _JSON_ATOM
+              + rb")*)?[ \t\n\r]*\]|\{[ \t\n\r]*(?:" + _JSON_STRING + rb"[ \t\n\r]*:[ \t\n\r]*"
+              + _JSON_ATOM + rb"(?:[ \t\n\r]*,[ \t\n\r]*" + _JSON_STRING
+              + rb"[ \t\n\r]*:[ \t\n\r]*" + _JSON_ATOM + rb")*)?[ \t\n\r]*\}")
+_JSON_ITEM = rb"(?:" + _JSON_FLAT + rb"|" + _JSON_ATOM + rb")"
+_JSON_TOKEN = re.compile(
+    rb"[ \t\n\r]*(?:(" + _JSON_STRING + rb")|(" + _JSON_SCALAR + rb")|(" + _JSON_FLAT + rb")"
+    rb"|([{[])|([}\]])|(,)|(:))"
+)
+# Runs of ", item" (arrays) or ", key: item" (objects) whose items hold no
+# nested containers beyond one flat level, consumed in a single match
+_JSON_ARRAY_RUN = re.compile(rb"(?:[ \t\n\r]*,[ \t\n\r]*" + _JSON_ITEM + rb")+")
+_JSON_OBJECT_RUN = re.compile(rb"(?:[ \t\n\r]*,[ \t\n\r]*" + _JSON_STRING
+                              + rb"[ \t\n\r]*:[ \t\n\r]*" + _JSON_ITEM + rb")+")
+(_TOKEN_STRING, _TOKEN_SCALAR, _TOKEN_FLAT, _TOKEN_OPEN, _TOKEN_CLOSE, _TOKEN_COMMA,
+ _TOKEN_COLON) = range(1, 8)
+_JSON_LONGEST_LITERAL = len(b"-Infinity")
+
+# Parser states: what the next token may be
+_VALUE, _VALUE_OR_CLOSE, _KEY_OR_CLOSE, _KEY, _COLON, _COMMA_OR_CLOSE, _END = range(7)
+_CHUNK_SIZE = 1 << 16
+
+_SCHEMA_CACHE = {}
+_SCHEMA_CACHE_SIZE = 256
+
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# RFC 5322 dot-atom local part and RFC 1035 hostname labels
+_STRICT_EMAIL_LOCAL = re.compile(
+    r"[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+)*")
+_STRICT_EMAIL_DOMAIN = re.compile(
+    r"(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+[A-Za-z]{2,63}")
+_EMAIL_DOMAIN_CACHE = {}
+_EMAIL_DOMAIN_CACHE_SIZE = 100_000
+
+# Maps every ASCII character to its class: Upper, Lower, Digit or Special
+_PASSWORD_CLASSES = str.maketrans(
+    string.ascii_uppercase + string.ascii_lowercase + string.digits
+    + string.punctuation + " ",
+    "U" * 26 + "L" * 26 + "D" * 10 + "S" * (len(string.punctuation) + 1),
+)
+_PASSWORD_POOLS = {"U": 26, "L": 26, "D": 10, "S": 33}
+_KEYBOARD_ROWS = ("1234567890-=", "qwertyuiop[]", "asdfghjkl;'", "zxcvbnm,./")
+_KEYBOARD_POSITIONS = {char: (row, col) for row, keys in enumerate(_KEYBOARD_ROWS)
+                       for col, char in enumerate(keys)}
+_PASSWORD_LISTS = {}
 
 
 def json_validator(data: str) -> bool:
@@ -39,8 +103,7 @@ def is_email(email: str) -> bool:
     bool
         True if the email matches the standard format, False otherwise
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_PATTERN.match(email))
 
 
 def is_strong_pass(password: str) -> bool:
@@ -71,4 +134,1147 @@ def is_strong_pass(password: str) -> bool:
     has_digit = any(c.isdigit() for c in password)
     has_special = any(not c.isalnum() for c in password)
 
-    return all([has_upper, has_lower, has_digit, has_special])
\ No newline at end of file
+    return all([has_upper, has_lower, has_digit, has_special])
+
+
+def _json_chunks(source, chunk_size: int):
+    """Turns str, bytes, file objects or chunk iterables into UTF-8 byte chunks."""
+    if isinstance(source, str):
+        for start in range(0, len(source), chunk_size):
+            yield source[start:start + chunk_size].encode("utf-8", "surrogatepass")
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        yield bytes(source)
+    else:
+        read = getattr(source, "read", None)
+        chunks = iter(lambda: read(chunk_size), source.read(0)) if read else source
+        for chunk in chunks:
+            yield chunk.encode("utf-8", "surrogatepass") if isinstance(chunk, str) else chunk
+
+
+def find_json_error(source, chunk_size: int = _CHUNK_SIZE):
+    """Finds the first syntax error in a JSON document without building it.
+
+    The document is checked by a state machine over a stream of chunks, so
+    memory use stays flat no matter how large the document is. It accepts
+    the same syntax as json.loads, including NaN and Infinity, but does not
+    check that the bytes inside strings are valid UTF-8.
+
+    Parameters
+    ----------
+    source : str, bytes, file object or iterable of str/bytes chunks
+        The JSON document to check
+    chunk_size : int, optional
+        The number of characters or bytes read at a time, by default 64 KiB
+
+    Returns
+    -------
+    int or None
+        The byte offset (in UTF-8) of the first error, or None if the
+        document is valid
+    """
+    token, ws, body = _JSON_TOKEN.match, _JSON_WS.match, _JSON_STRING_BODY.match
+    array_run, object_run = _JSON_ARRAY_RUN.match, _JSON_OBJECT_RUN.match
+    stack = bytearray()
+    expect = _VALUE
+    in_string = is_key = False
+    base = 0
+    data = b""
+    chunks = _json_chunks(source, chunk_size)
+    final = False
+
+    while not final:
+        chunk = next(chunks, None)
+        if chunk is None:
+            final = True
+        elif not chunk:
+            continue
+        else:
+            data += chunk
+        n = len(data)
+        pos = 0
+
+        while True:
+            if in_string:  # a string longer than the buffer, or split across chunks
+                pos = body(data, pos).end()
+                if pos == n:
+                    break
+                c = data[pos]
+                if c == 0x22:  # closing quote
+                    pos += 1
+                    in_string = False
+                    if is_key:
+                        expect = _COLON
+                    else:
+                        expect = _COMMA_OR_CLOSE if stack else _END
+                    continue
+                if c == 0x5C and not final and n - pos < 6:  # split escape
+                    break
+                return base + pos
+
+            if expect == _COMMA_OR_CLOSE:
+                m = (object_run if stack[-1] == 0x7B else array_run)(data, pos)
+                if m is not None:
+                    pos = m.end()
+
+            m = token(data, pos)
+            if m is None:
+                pos = ws(data, pos).end()
+                if pos == n:
+                    break
+                if data[pos] == 0x22 and expect != _COLON and expect != _COMMA_OR_CLOSE \
+                        and expect != _END:
+                    in_string, is_key = True, expect == _KEY or expect == _KEY_OR_CLOSE
+                    pos += 1
+                    continue
+                if not final and n - pos < _JSON_LONGEST_LITERAL:  # e.g. "tru"
+                    break
+                return base + pos
+
+            kind = m.lastindex
+            end = m.end()
+            if kind == _TOKEN_SCALAR and not final and n - end < 3:  # "1." may continue
+                break
+
+            if expect == _COMMA_OR_CLOSE:
+                if kind == _TOKEN_COMMA:
+                    expect = _KEY if stack[-1] == 0x7B else _VALUE
+                elif kind == _TOKEN_CLOSE and data[end - 1] == stack[-1] + 2:
+                    stack.pop()  # { -> }, [ -> ]
+                    expect = _COMMA_OR_CLOSE if stack else _END
+                else:
+                    return base + m.start(kind)
+            elif expect == _COLON:
+                if kind != _TOKEN_COLON:
+                    return base + m.start(kind)
+                expect = _VALUE
+            elif expect == _KEY or expect == _KEY_OR_CLOSE:
+                if kind == _TOKEN_STRING:
+                    expect = _COLON
+                elif kind == _TOKEN_CLOSE and expect == _KEY_OR_CLOSE and data[end - 1] == 0x7D:
+                    stack.pop()
+                    expect = _COMMA_OR_CLOSE if stack else _END
+                else:
+                    return base + m.start(kind)
+            elif expect == _END:
+                return base + m.start(kind)
+            elif kind == _TOKEN_STRING or kind == _TOKEN_SCALAR or kind == _TOKEN_FLAT:
+                expect = _COMMA_OR_CLOSE if stack else _END
+            elif kind == _TOKEN_OPEN:
+                stack.append(data[end - 1])
+                expect = _KEY_OR_CLOSE if data[end - 1] == 0x7B else _VALUE_OR_CLOSE
+            elif kind == _TOKEN_CLOSE and expect == _VALUE_OR_CLOSE and data[end - 1] == 0x5D:
+                stack.pop()
+                expect = _COMMA_OR_CLOSE if stack else _END
+            else:
+                return base + m.start(kind)
+            pos = end
+
+        base += pos
+        data = data[pos:]
+
+    if expect != _END or in_string:
+        return base + len(data)
+    return None
+
+
+def json_stream_validator(source, chunk_size: int = _CHUNK_SIZE) -> bool:
+    """Checks if a JSON document is valid without building it in memory.
+
+    Parameters
+    ----------
+    source : str, bytes, file object or iterable of str/bytes chunks
+        The JSON document to check
+    chunk_size : int, optional
+        The number of characters or bytes read at a time, by default 64 KiB
+
+    Returns
+    -------
+    bool
+        True if the document is valid JSON, False otherwise
+    """
+    return find_json_error(source, chunk_size) is None
+
+
+def _validate_jsonl_range(path, start: int, stop: int) -> tuple[int, list]:
+    """Validates the JSON Lines records that start within [start, stop)."""
+    errors = []
+    count = 0
+    with open(path, "rb") as f:
+        if start:
+            f.seek(start - 1)
+            if f.read(1) != b"\n":
+                f.readline()
+        offset = f.tell()
+        while offset < stop:
+            line = f.readline()
+            if not line:
+                break
+            if line.strip(b" \t\r\n"):
+                error = find_json_error(line.rstrip(b"\r\n"))
+                if error is not None:
+                    errors.append((count, offset + error))
+            count += 1
+            offset += len(line)
+    return count, errors
+
+
+def jsonl_validator(path, workers: int = 1) -> list[tuple[int, int]]:
+    """Validates a JSON Lines file, optionally splitting it across processes.
+
+    Blank lines are skipped. With several workers the file is split into
+    byte ranges and each process validates the lines starting in its range.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The JSON Lines file to validate
+    workers : int, optional
+        The number of processes, by default 1
+
+    Returns
+    -------
+    list of tuple
+        (line number, byte offset of the error in the file) for every invalid
+        line, with 1-based line numbers. Empty if the whole file is valid
+    """
+    size = os.path.getsize(path)
+    step = max(-(-size // max(workers, 1)), 1)
+    tasks = [(path, start, min(start + step, size)) for start in range(0, size, step)]
+    if workers > 1 and len(tasks) > 1:
+        with Pool(workers) as pool:
+            results = pool.starmap(_validate_jsonl_range, tasks)
+    else:
+        results = [_validate_jsonl_range(*task) for task in tasks]
+
+    invalid = []
+    line_base = 1
+    for count, errors in results:
+        invalid.extend((line_base + index, offset) for index, offset in errors)
+        line_base += count
+    return invalid
+
+
+def _accept(value) -> bool:
+    return True
+
+
+def _reject(value) -> bool:
+    return False
+
+
+def _all_checks(checks: list):
+    """Combines checks into one function that stops at the first failure."""
+    if not checks:
+        return _accept
+    if len(checks) == 1:
+        return checks[0]
+    if len(checks) == 2:
+        first, second = checks
+        return lambda value: first(value) and second(value)
+    checks = tuple(checks)
+
+    def check(value):
+        for c in checks:
+            if not c(value):
+                return False
+        return True
+    return check
+
+
+def _json_key(value):
+    """Returns a hashable key under which equal JSON values compare equal.
+
+    Unlike Python equality it keeps true/false apart from 1/0.
+    """
+    if isinstance(value, bool) or value is None:
+        return (0, value)
+    if isinstance(value, (int, float)):
+        return (1, value)
+    if isinstance(value, str):
+        return (2, value)
+    return (3, json.dumps(value, sort_keys=True))
+
+
+def _is_integer(value) -> bool:
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+_SCHEMA_TYPES = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "integer": _is_integer,
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+    "null": lambda value: value is None,
+}
+_PYTHON_TYPES = {"object": dict, "array": list, "string": str}
+# Validation keywords that need annotation tracking or dynamic scopes
+_UNSUPPORTED_KEYWORDS = ("unevaluatedItems", "unevaluatedProperties", "$dynamicRef",
+                         "$recursiveRef")
+
+
+def _only_for(kind: type, check):
+    """Applies a type-specific check only to values of that type."""
+    return lambda value: not isinstance(value, kind) or check(value)
+
+
+def _only_for_numbers(check):
+    """Applies a numeric check only to ints and floats, never to bools."""
+    return lambda value: (isinstance(value, bool) or not isinstance(value, (int, float))
+                          or check(value))
+
+
+def _bounds(schema: dict, low_key: str, high_key: str) -> tuple:
+    return schema.get(low_key, 0), schema.get(high_key, math.inf)
+
+
+class _SchemaCompiler:
+    """Turns a JSON Schema into nested closures, resolving local $refs once.
+
+    Every keyword that applies to one JSON type is folded into a single
+    closure for that type, and when the schema names a single type that
+    closure is fused with the type test, so a typical schema node costs one
+    or two Python calls per value.
+    """
+
+    def __init__(self, root: dict):
+        self.root = root
+        self.refs = {}
+
+    def compile(self, schema):
+        if schema is True or schema == {}:
+            return _accept
+        if schema is False:
+            return _reject
+        if not isinstance(schema, dict):
+            raise ValueError(f"Schema {schema!r} is not a valid JSON Schema.")
+        for keyword in _UNSUPPORTED_KEYWORDS:
+            if keyword in schema:
+                raise ValueError(f"Keyword {keyword} is not supported.")
+
+        checks = []
+        typed = {
+            "number": self._numeric(schema),
+            "string": self._string(schema),
+            "array": self._array(schema),
+            "object": self._object(schema),
+        }
+        kinds = schema.get("type")
+        if isinstance(kinds, list) and len(kinds) == 1:
+            kinds = kinds[0]
+        if isinstance(kinds, str):
+            checks.append(self._single_type(kinds, typed))
+        else:
+            if kinds is not None:
+                checks.append(self._type(kinds))
+            for kind, own in typed.items():
+                if own is not None:
+                    checks.append(_only_for_numbers(own) if kind == "number"
+                                  else _only_for(_PYTHON_TYPES[kind], own))
+        if "enum" in schema:
+            allowed = frozenset(_json_key(item) for item in schema["enum"])
+            checks.append(lambda value: _json_key(value) in allowed)
+        if "const" in schema:
+            const = _json_key(schema["const"])
+            checks.append(lambda value: _json_key(value) == const)
+        if "$ref" in schema:
+            checks.append(self._ref(schema["$ref"]))
+        checks += self._combinators(schema)
+        return _all_checks(checks)
+
+    def _ref(self, ref: str):
+        if ref not in self.refs:
+            if not ref.startswith("#"):
+                raise ValueError(f"Reference {ref} is not supported.")
+            cell = self.refs[ref] = []
+            target = self.root
+            for part in filter(None, ref[1:].split("/")):
+                part = part.replace("~1", "/").replace("~0", "~")
+                target = target[int(part)] if isinstance(target, list) else target[part]
+            cell.append(self.compile(target))
+        cell = self.refs[ref]
+        return lambda value: cell[0](value)
+
+    def _type(self, types: list):
+        unknown = [name for name in types if name not in _SCHEMA_TYPES]
+        if unknown:
+            raise ValueError(f"Type {unknown[0]} is not a JSON Schema type.")
+        checks = tuple(_SCHEMA_TYPES[name] for name in types)
+        return lambda value: any(check(value) for check in checks)
+
+    def _single_type(self, kind: str, typed: dict):
+        if kind not in _SCHEMA_TYPES:
+            raise ValueError(f"Type {kind} is not a JSON Schema type.")
+        own = typed["number"] if kind == "integer" else typed.get(kind)
+        if own is None:
+            return _SCHEMA_TYPES[kind]
+        if kind in _PYTHON_TYPES:
+            python_type = _PYTHON_TYPES[kind]
+            return lambda value: isinstance(value, python_type) and own(value)
+        is_kind = _SCHEMA_TYPES[kind]
+        return lambda value: is_kind(value) and own(value)
+
+    def _numeric(self, schema: dict):
+        is_number = _SCHEMA_TYPES["number"]
+        low, high = schema.get("minimum"), schema.get("maximum")
+        xlow, xhigh = schema.get("exclusiveMinimum"), schema.get("exclusiveMaximum")
+        if xlow is True:  # draft 4 booleans turn minimum/maximum exclusive
+            xlow, low = low, None
+        if xhigh is True:
+            xhigh, high = high, None
+        checks = []
+        if low is not None and high is not None:
+            checks.append(lambda value: low <= value <= high)
+        elif low is not None:
+            checks.append(lambda value: value >= low)
+        elif high is not None:
+            checks.append(lambda value: value <= high)
+        if is_number(xlow):
+            checks.append(lambda value: value > xlow)
+        if is_number(xhigh):
+            checks.append(lambda value: value < xhigh)
+        if "multipleOf" in schema:
+            step = schema["multipleOf"]
+            if isinstance(step, int):
+                checks.append(lambda value: (value % step == 0 if isinstance(value, int)
+                                             else (value / step).is_integer()))
+            else:
+                checks.append(lambda value: math.isclose(round(value / step) * step, value))
+        return _all_checks(checks) if checks else None
+
+    def _string(self, schema: dict):
+        low, high = _bounds(schema, "minLength", "maxLength")
+        search = re.compile(schema["pattern"]).search if "pattern" in schema else None
+        sized = "minLength" in schema or "maxLength" in schema
+        if search and sized:
+            return lambda value: low <= len(value) <= high and search(value) is not None
+        if search:
+            return lambda value: search(value) is not None
+        if sized:
+            return lambda value: low <= len(value) <= high
+        return None
+
+    def _array(self, schema: dict):
+        checks = []
+        if "minItems" in schema or "maxItems" in schema:
+            low, high = _bounds(schema, "minItems", "maxItems")
+            checks.append(lambda value: low <= len(value) <= high)
+        if schema.get("uniqueItems"):
+            checks.append(lambda value: len({_json_key(item) for item in value}) == len(value))
+        items = schema.get("prefixItems", schema.get("items"))
+        if isinstance(items, list):
+            positional = tuple(self.compile(item) for item in items)
+            extra = schema.get("items", True) if "prefixItems" in schema else schema.get(
+                "additionalItems", True)
+            rest = self.compile(extra)
+            size = len(positional)
+            checks.append(lambda value: all(check(item) for check, item in zip(positional, value))
+                          and all(map(rest, value[size:])))
+        elif items is not None:
+            each = self.compile(items)
+            if each is not _accept:
+                checks.append(lambda value: all(map(each, value)))
+        if "contains" in schema:
+            contains = self.compile(schema["contains"])
+            low, high = _bounds(schema, "minContains", "maxContains")
+            if "minContains" in schema or "maxContains" in schema:
+                checks.append(lambda value: low <= sum(map(bool, map(contains, value))) <= high)
+            else:
+                checks.append(lambda value: any(map(contains, value)))
+        return _all_checks(checks) if checks else None
+
+    def _object(self, schema: dict):
+        checks = []
+        members = self._properties(schema)
+        if members is not None:
+            checks.append(members)
+        if "propertyNames" in schema:
+            names = self.compile(schema["propertyNames"])
+            if names is not _accept:
+                checks.append(lambda value: all(map(names, value)))
+        checks += self._dependencies(schema)
+        return _all_checks(checks) if checks else None
+
+    def _dependencies(self, schema: dict) -> list:
+        required = dict(schema.get("dependentRequired", {}))
+        schemas = dict(schema.get("dependentSchemas", {}))
+        # Draft 4-7 "dependencies" holds both kinds
+        for name, dependency in schema.get("dependencies", {}).items():
+            if isinstance(dependency, list):
+                required[name] = dependency
+            else:
+                schemas[name] = dependency
+        checks = []
+        if required:
+            needs = tuple((name, frozenset(names)) for name, names in required.items())
+            checks.append(lambda value: all(name not in value or value.keys() >= names
+                                            for name, names in needs))
+        if schemas:
+            subschemas = tuple((name, self.compile(sub)) for name, sub in schemas.items())
+            checks.append(lambda value: all(name not in value or check(value)
+                                            for name, check in subschemas))
+        return checks
+
+    def _properties(self, schema: dict):
+        required = frozenset(schema.get("required", ()))
+        sized = "minProperties" in schema or "maxProperties" in schema
+        low, high = _bounds(schema, "minProperties", "maxProperties")
+        known = frozenset(schema.get("properties", {}))
+        properties = {}
+        for name, sub in schema.get("properties", {}).items():
+            check = self.compile(sub)
+            if check is not _accept:
+                properties[name] = check
+        patterns = tuple((re.compile(pattern).search, self.compile(sub))
+                         for pattern, sub in schema.get("patternProperties", {}).items())
+        extra = self.compile(schema["additionalProperties"]) \
+            if "additionalProperties" in schema else _accept
+        if not (required or sized or properties or patterns or extra is not _accept):
+            return None
+        get_check = properties.get
+
+        def check_object(value):
+            if sized and not low <= len(value) <= high:
+                return False
+            if required and not value.keys() >= required:
+                return False
+            for key, item in value.items():
+                check = get_check(key)
+                if check is not None:
+                    if not check(item):
+                        return False
+                    if not patterns:
+                        continue
+                matched = False
+                for search, pattern_check in patterns:
+                    if search(key):
+                        matched = True
+                        if not pattern_check(item):
+                            return False
+                if not matched and key not in known and not extra(item):
+                    return False
+            return True
+
+        if patterns or extra is not _accept:
+            return check_object
+        if not properties:
+            return lambda value: ((not sized or low <= len(value) <= high)
+                                  and value.keys() >= required)
+
+        def check_properties(value):
+            if sized and not low <= len(value) <= high:
+                return False
+            if required and not value.keys() >= required:
+                return False
+            for name, check in properties.items():
+                if name in value and not check(value[name]):
+                    return False
+            return True
+        return check_properties
+
+    def _combinators(self, schema: dict) -> list:
+        checks = []
+        if "allOf" in schema:
+            checks.append(_all_checks([self.compile(sub) for sub in schema["allOf"]]))
+        if "anyOf" in schema:
+            options = tuple(self.compile(sub) for sub in schema["anyOf"])
+            checks.append(lambda value: any(option(value) for option in options))
+        if "oneOf" in schema:
+            options = tuple(self.compile(sub) for sub in schema["oneOf"])
+            checks.append(lambda value: sum(1 for option in options if option(value)) == 1)
+        if "not" in schema:
+            negated = self.compile(schema["not"])
+            checks.append(lambda value: not negated(value))
+        if "if" in schema:
+            condition = self.compile(schema["if"])
+            then = self.compile(schema.get("then", True))
+            otherwise = self.compile(schema.get("else", True))
+            checks.append(lambda value: then(value) if condition(value) else otherwise(value))
+        return checks
+
+
+def compile_schema(schema):
+    """Compiles a JSON Schema into a fast validation function.
+
+    The schema is turned into a tree of specialized closures once, so
+    validating a document does no schema interpretation. Compiled validators
+    are cached by the hash of the canonical schema JSON. Supports the
+    validation keywords of drafts 4 to 2020-12 for types, enum/const,
+    numbers, strings, arrays (including contains counts), objects
+    (including propertyNames and dependencies), combinators, if/then/else
+    and local $refs. Annotation-only keywords such as format and title are
+    ignored.
+
+    Parameters
+    ----------
+    schema : dict or bool
+        The JSON Schema
+
+    Returns
+    -------
+    callable
+        A function taking a decoded JSON document and returning True if
+        it matches the schema, False otherwise
+
+    Raises
+    ------
+    ValueError
+        If the schema is malformed, uses a remote $ref, or uses
+        unevaluatedItems, unevaluatedProperties, $dynamicRef or $recursiveRef
+    """
+    digest = hashlib.sha256(json.dumps(schema, sort_keys=True).encode()).hexdigest()
+    validator = _SCHEMA_CACHE.get(digest)
+    if validator is None:
+        validator = _SchemaCompiler(schema).compile(schema)
+        if len(_SCHEMA_CACHE) >= _SCHEMA_CACHE_SIZE:
+            _SCHEMA_CACHE.pop(next(iter(_SCHEMA_CACHE)))
+        _SCHEMA_CACHE[digest] = validator
+    return validator
+
+
+def schema_validator(document, schema) -> bool:
+    """Checks if a decoded JSON document matches a JSON Schema.
+
+    Parameters
+    ----------
+    document : object
+        The decoded JSON document (dict, list, str, number, bool or None)
+    schema : dict or bool
+        The JSON Schema, compiled once and cached
+
+    Returns
+    -------
+    bool
+        True if the document matches the schema, False otherwise
+
+    Notes
+    -----
+    Looking up the cached validator hashes the schema on every call; in a
+    hot loop, call compile_schema once and reuse the returned function.
+    """
+    return compile_schema(schema)(document)
+
+
+def schema_batch_validator(documents, schema) -> list[bool]:
+    """Checks many decoded JSON documents against one JSON Schema.
+
+    Parameters
+    ----------
+    documents : iterable
+        The decoded JSON documents
+    schema : dict or bool
+        The JSON Schema, compiled once and cached
+
+    Returns
+    -------
+    list of bool
+        Whether each document matches the schema, in input order
+    """
+    return list(map(compile_schema(schema), documents))
+
+
+def _email_flags(emails: list, strict: bool) -> bytearray:
+    """Validates a chunk of addresses, returning one 0/1 byte per address."""
+    if not strict:
+        # One precompiled match per address, iterated entirely in C
+        return bytearray(map(bool, map(_EMAIL_PATTERN.match, emails)))
+
+    local_ok, domain_ok = _STRICT_EMAIL_LOCAL.fullmatch, _STRICT_EMAIL_DOMAIN.fullmatch
+    cache = _EMAIL_DOMAIN_CACHE
+    flags = bytearray(len(emails))
+    for i, email in enumerate(emails):
+        if not 6 <= len(email) <= 254:
+            continue
+        local, at, domain = email.partition("@")
+        if not at or len(local) > 64 or len(domain) > 253:
+            continue
+        valid_domain = cache.get(domain)
+        if valid_domain is None:
+            if len(cache) >= _EMAIL_DOMAIN_CACHE_SIZE:
+                cache.clear()
+            valid_domain = cache[domain] = domain_ok(domain) is not None
+        if valid_domain and local_ok(local) is not None:
+            flags[i] = 1
+    return flags
+
+
+def _chunked(items, size: int):
+    items = iter(items)
+    while True:
+        chunk = list(itertools.islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def validate_emails(emails, strict: bool = False, workers: int = 1,
+                    chunk_size: int = 100_000) -> bytearray:
+    """Validates many email addresses at once.
+
+    By default every address is matched against the precompiled is_email
+    pattern in a single C-level pass. In strict mode, obviously invalid
+    inputs are rejected by length and "@" checks before any regex runs, and
+    each domain is matched once and cached.
+
+    Parameters
+    ----------
+    emails : iterable of str
+        The email addresses to validate
+    strict : bool, optional
+        If True, use an RFC 5322 dot-atom pattern with RFC length limits
+        instead of the pattern used by is_email, by default False
+    workers : int, optional
+        The number of processes validating chunks, by default 1
+    chunk_size : int, optional
+        The number of addresses per chunk, by default 100_000
+
+    Returns
+    -------
+    bytearray
+        One byte per address, 1 if it is valid and 0 otherwise
+    """
+    chunks = _chunked(emails, chunk_size)
+    flags = bytearray()
+    if workers > 1:
+        with Pool(workers) as pool:
+            for chunk_flags in pool.imap(_email_flags_strict if strict else _email_flags_loose,
+                                         chunks):
+                flags += chunk_flags
+    else:
+        for chunk in chunks:
+            flags += _email_flags(chunk, strict)
+    return flags
+
+
+def _email_flags_loose(emails: list) -> bytearray:
+    return _email_flags(emails, False)
+
+
+def _email_flags_strict(emails: list) -> bytearray:
+    return _email_flags(emails, True)
+
+
+def validate_email_column(path, column=0, strict: bool = False, workers: int = 1,
+                          has_header: bool = True, delimiter: str = ",") -> bytearray:
+    """Validates the email addresses in one column of a CSV file.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The CSV file to read
+    column : int or str, optional
+        The column index, or its name in the header row, by default 0
+    strict : bool, optional
+        If True, use the stricter RFC 5322 pattern, by default False
+    workers : int, optional
+        The number of processes validating chunks, by default 1
+    has_header : bool, optional
+        Whether the first row is a header, by default True
+    delimiter : str, optional
+        The CSV field delimiter, by default ","
+
+    Returns
+    -------
+    bytearray
+        One byte per data row, 1 if its address is valid and 0 otherwise
+
+    Raises
+    ------
+    ValueError
+        If the column name is not in the header row
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = csv.reader(f, delimiter=delimiter)
+        header = next(rows, []) if has_header else []
+        if isinstance(column, str):
+            if column not in header:
+                raise ValueError(f"Column {column} is not in the header row.")
+            column = header.index(column)
+        values = (row[column] if len(row) > column else "" for row in rows)
+        return validate_emails(values, strict=strict, workers=workers)
+
+
+def _password_patterns(password: str) -> list[tuple[str, int, int]]:
+    """Finds runs of 3+ repeated, sequential or keyboard-adjacent characters.
+
+    Returns (kind, start, length) for each maximal run.
+    """
+    lowered = password.lower()
+    patterns = []
+    positions = _KEYBOARD_POSITIONS
+    kinds = ("repeat", "sequence", "keyboard")
+    starts = [0, 0, 0]
+    steps = [None, None, None]
+    for i in range(1, len(lowered) + 1):
+        if i < len(lowered):
+            a, b = lowered[i - 1], lowered[i]
+            diff = ord(b) - ord(a)
+            pa, pb = positions.get(a), positions.get(b)
+            links = (
+                0 if a == b else None,
+                diff if diff in (1, -1) and a.isalnum() and b.isalnum() else None,
+                pb[1] - pa[1] if pa and pb and pa[0] == pb[0] and abs(pb[1] - pa[1]) == 1
+                else None,
+            )
+        else:
+            links = (None, None, None)
+        for k in range(3):
+            if links[k] is not None and (steps[k] is None or links[k] == steps[k]):
+                steps[k] = links[k]
+                continue
+            if i - starts[k] >= 3:
+                patterns.append((kinds[k], starts[k], i - starts[k]))
+            starts[k] = i - 1 if links[k] is not None else i
+            steps[k] = links[k]
+    return patterns
+
+
+def build_password_list(passwords, path) -> int:
+    """Writes a sorted, de-duplicated password list for fast lookups.
+
+    Parameters
+    ----------
+    passwords : iterable of str
+        The passwords to store, e.g. a list of common or breached passwords
+    path : str or os.PathLike
+        The file to write
+
+    Returns
+    -------
+    int
+        The number of unique passwords written
+    """
+    unique = sorted({p.encode() for p in passwords if p and "\n" not in p})
+    with open(path, "wb") as f:
+        f.write(b"\n".join(unique))
+    _PASSWORD_LISTS.pop(os.fspath(path), None)
+    return len(unique)
+
+
+def _open_password_list(path):
+    """Memory-maps a password list once per process."""
+    key = os.fspath(path)
+    mapped = _PASSWORD_LISTS.get(key)
+    if mapped is None:
+        with open(key, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) \
+                if os.fstat(f.fileno()).st_size else b""
+        _PASSWORD_LISTS[key] = mapped
+    return mapped
+
+
+def password_in_list(password: str, path) -> bool:
+    """Checks if a password appears in a list made by build_password_list.
+
+    The file is memory-mapped and binary searched, so lookups touch only a
+    few pages and the list is never loaded into memory.
+
+    Parameters
+    ----------
+    password : str
+        The password to look up
+    path : str or os.PathLike
+        The sorted password list
+
+    Returns
+    -------
+    bool
+        True if the password is in the list, False otherwise
+    """
+    target = password.encode()
+    mapped = _open_password_list(path)
+    lo, hi = 0, len(mapped)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        start = mapped.rfind(b"\n", 0, mid) + 1
+        end = mapped.find(b"\n", start)
+        if end == -1:
+            end = len(mapped)
+        line = mapped[start:end]
+        if line == target:
+            return True
+        if line < target:
+            lo = end + 1
+        else:
+            hi = start
+    return False
+
+
+def password_strength(password: str, common_list=None) -> dict:
+    """Scores a password by its character classes, patterns and entropy.
+
+    Characters are classified in one pass with a translation table. Runs of
+    three or more repeated (aaa), sequential (abc, 321) or keyboard-adjacent
+    (qwe) characters count as a single character towards the entropy.
+
+    Parameters
+    ----------
+    password : str
+        The password to score
+    common_list : str or os.PathLike, optional
+        A list made by build_password_list; passwords found in it score 0,
+        by default None
+
+    Returns
+    -------
+    dict
+        "length", the per-class counts "upper", "lower", "digits", "special"
+        and "other" (non-ASCII), "entropy" in bits, "patterns" as
+        (kind, start, length) tuples, "common" and a "score" from 0 (very
+        weak) to 4 (very strong)
+    """
+    classes = password.translate(_PASSWORD_CLASSES)
+    counts = {kind: classes.count(kind) for kind in "ULDS"}
+    other = len(password) - sum(counts.values())
+    pool = sum(size for kind, size in _PASSWORD_POOLS.items() if counts[kind])
+    if other:
+        pool += 100
+    patterns = _password_patterns(password)
+    predictable = bytearray(len(password))
+    for _, start, length in patterns:
+        predictable[start + 1:start + length] = b"\x01" * (length - 1)
+    effective = len(password) - sum(predictable)
+    entropy = round(effective * math.log2(pool), 2) if pool else 0.0
+    common = bool(common_list) and password_in_list(password, common_list)
+    if common:
+        entropy = 0.0
+    score = sum(entropy >= threshold for threshold in (28, 36, 60, 128))
+    return {
+        "length": len(password),
+        "upper": counts["U"],
+        "lower": counts["L"],
+        "digits": counts["D"],
+        "special": counts["S"],
+        "other": other,
+        "entropy": entropy,
+        "patterns": patterns,
+        "common": common,
+        "score": score,
+    }
+
+
+def _audit_chunk(passwords: list, common_list) -> list[dict]:
+    return [password_strength(password, common_list) for password in passwords]
+
+
+def audit_passwords(passwords, common_list=None, workers: int = 1,
+                    chunk_size: int = 10_000) -> list[dict]:
+    """Scores many passwords, e.g. to audit a credential dump.
+
+    Parameters
+    ----------
+    passwords : iterable of str
+        The passwords to score
+    common_list : str or os.PathLike, optional
+        A list made by build_password_list, by default None
+    workers : int, optional
+        The number of processes scoring chunks, by default 1
+    chunk_size : int, optional
+        The number of passwords per chunk, by default 10_000
+
+    Returns
+    -------
+    list of dict
+        The password_strength result for each password, in input order
+    """
+    score_chunk = partial(_audit_chunk, common_list=common_list)
+    results = []
+    if workers > 1:
+        with Pool(workers) as pool:
+            for chunk_results in pool.imap(score_chunk, _chunked(passwords, chunk_size)):
+                results += chunk_results
+    else:
+        for chunk in _chunked(passwords, chunk_size):
+            results += score_chunk(chunk)
+    return results
+
+
+def _rule_type(kind):
+    if kind is float:
+        return lambda value: isinstance(value, (int, float)) and not isinstance(value, bool)
+    if kind is int:
+        return lambda value: isinstance(value, int) and not isinstance(value, bool)
+    return lambda value: isinstance(value, kind)
+
+
+def _rule_one_of(choices):
+    choices = frozenset(choices)
+    return lambda value: value in choices
+
+
+def _rule_range(low=None, high=None):
+    low = -math.inf if low is None else low
+    high = math.inf if high is None else high
+    return lambda value: low <= value <= high
+
+
+def _rule_pattern(pattern):
+    fullmatch = re.compile(pattern).fullmatch
+    return lambda value: fullmatch(value) is not None
+
+
+def _rule_email_strict():
+    return lambda value: _email_flags([value], True)[0] == 1
+
+
+# Rule name: (relative cost, factory taking the rule arguments)
+_RULES = {
+    "type": (1, _rule_type),
+    "one_of": (1, _rule_one_of),
+    "min_length": (2, lambda low: lambda value: len(value) >= low),
+    "max_length": (2, lambda high: lambda value: len(value) <= high),
+    "range": (2, _rule_range),
+    "pattern": (5, _rule_pattern),
+    "email": (5, lambda: lambda value: _EMAIL_PATTERN.match(value) is not None),
+    "email_strict": (8, _rule_email_strict),
+    "strong_pass": (10, lambda: is_strong_pass),
+    "schema": (30, lambda schema: compile_schema(schema)),
+    "json": (50, lambda: json_stream_validator),
+}
+_CALLABLE_RULE_COST = 20
+
+
+def _compile_field(rules: list) -> tuple[int, object]:
+    """Builds one checker for a field, returning (total cost, checker).
+
+    The checker returns None if the value passes and otherwise the name of
+    the first failing rule; a rule that raises TypeError or ValueError on
+    the value counts as failed. Missing values (None or "") fail
+    "required" and skip every other rule.
+    """
+    required = False
+    compiled = []
+    for rule in rules:
+        if callable(rule):
+            compiled.append((_CALLABLE_RULE_COST, getattr(rule, "__name__", "check"), rule))
+            continue
+        name, *args = (rule,) if isinstance(rule, str) else rule
+        if name == "required":
+            required = True
+        elif name in _RULES:
+            cost, factory = _RULES[name]
+            compiled.append((cost, name, factory(*args)))
+        else:
+            raise ValueError(f"Rule {name} is not supported.")
+    compiled.sort(key=lambda item: item[0])
+    checks = tuple((name, check) for _, name, check in compiled)
+    missing = "required" if required else None
+
+    def check_field(value):
+        if value is None or value == "":
+            return missing
+        for name, check in checks:
+            try:
+                if not check(value):
+                    return name
+            except (TypeError, ValueError):
+                return name
+        return None
+    return sum(cost for cost, _, _ in compiled), check_field
+
+
+def compile_rules(rules: dict):
+    """Compiles per-field validation rules into a single record checker.
+
+    Rules within a field and the fields themselves are ordered cheapest
+    first, and checking stops at the first failure.
+
+    Parameters
+    ----------
+    rules : dict
+        Maps field names to lists of rules. A rule is a name ("required",
+        "email", "email_strict", "strong_pass", "json"), a tuple of a name
+        and its arguments (("type", int), ("one_of", choices),
+        ("min_length", n), ("max_length", n), ("range", low, high),
+        ("pattern", regex), ("schema", json_schema)), or a callable taking
+        the value and returning a bool
+
+    Returns
+    -------
+    callable
+        A function taking a record (dict) and returning None if it is valid
+        or a (field, rule name) tuple for the first failure
+
+    Raises
+    ------
+    ValueError
+        If a rule name is not supported
+    """
+    fields = sorted(((field,) + _compile_field(field_rules)
+                     for field, field_rules in rules.items()), key=lambda item: item[1])
+    fields = tuple((field, check) for field, _, check in fields)
+
+    def check_record(record):
+        get = record.get
+        for field, check in fields:
+            failed = check(get(field))
+            if failed is not None:
+                return field, failed
+        return None
+    check_record.fields = fields
+    return check_record
+
+
+def validate_records(records, rules: dict) -> dict:
+    """Validates many records against per-field rules.
+
+    Parameters
+    ----------
+    records : iterable of dict
+        The records to validate
+    rules : dict
+        The per-field rules, see compile_rules
+
+    Returns
+    -------
+    dict
+        Maps the index of every invalid record to its (field, rule name)
+        failure; empty if all records are valid
+    """
+    check = compile_rules(rules)
+    failures = {}
+    for index, record in enumerate(records):
+        failed = check(record)
+        if failed is not None:
+            failures[index] = failed
+    return failures
+
+
+def validate_columns(columns: dict, rules: dict) -> dict:
+    """Validates a columnar batch of records against per-field rules.
+
+    Each field is checked down its column, cheapest field first, and rows
+    that have already failed are skipped for every later field.
+
+    Parameters
+    ----------
+    columns : dict
+        Maps field names to equally long lists of values; a field missing
+        from columns is treated as missing in every row
+    rules : dict
+        The per-field rules, see compile_rules
+
+    Returns
+    -------
+    dict
+        Maps the index of every invalid row to its (field, rule name)
+        failure; empty if all rows are valid
+    """
+    rows = max((len(values) for values in columns.values()), default=0)
+    alive = range(rows)
+    failures = {}
+    for field, check in compile_rules(rules).fields:
+        values = columns.get(field)
+        survivors = []
+        keep = survivors.append
+        for index in alive:
+            failed = check(values[index] if values is not None else None)
+            if failed is None:
+                keep(index)
+            else:
+                failures[index] = (field, failed)
+        alive = survivors
+    return dict(sorted(failures.items()))
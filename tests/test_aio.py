@@ -0,0 +1,77 @@
+import asyncio
+import hashlib
+import threading
+import time
+import pytest
+from montykit import aio
+from montykit.ciphers import rot13
+from montykit.hash import generate_hash
+
+
+@pytest.fixture(autouse=True)
+def fresh_executor():
+    yield
+    aio.shutdown()
+
+
+def test_async_versions():
+    async def main():
+        return (await aio.generate_hash("hello", "md5"), await aio.rot13("abc"),
+                await aio.gen_record_batches({"id": "id"}, 25, batch_size=10))
+    digest, text, batches = asyncio.run(main())
+    assert digest == generate_hash("hello", "md5")
+    assert text == rot13("abc")
+    assert [len(b["id"]) for b in batches] == [10, 10, 5]
+    assert asyncio.iscoroutinefunction(aio.word_freq)
+    assert "text_polarity" in dir(aio)
+    with pytest.raises(AttributeError):
+        aio.not_a_function
+
+
+def test_process_pool():
+    aio.configure("process", max_workers=2)
+    texts = ["a", "bb", "ccc"]
+    results = asyncio.run(aio.map_bounded(rot13, texts))
+    assert results == [rot13(text) for text in texts]
+    with pytest.raises(ValueError):
+        aio.configure("fiber")
+
+
+def test_map_bounded_limits_concurrency():
+    lock = threading.Lock()
+    running, peak = 0, 0
+
+    def work(value):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        return value * 2
+
+    aio.configure("thread", max_workers=8)
+    results = asyncio.run(aio.map_bounded(work, iter(range(20)), limit=3))
+    assert results == [value * 2 for value in range(20)]
+    assert peak <= 3
+
+
+def test_hash_and_stream_files(tmp_path):
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"{index}.bin"
+        path.write_bytes(bytes([index]) * (300_000 + index))
+        paths.append(path)
+
+    async def main():
+        chunks = [chunk async for chunk in aio.stream_file(paths[0], chunk_size=65536)]
+        digests = [pair async for pair in aio.hash_files(paths, "sha1", limit=2, chunk_size=65536)]
+        return chunks, digests
+
+    chunks, digests = asyncio.run(main())
+    assert b"".join(chunks) == paths[0].read_bytes()
+    assert max(len(chunk) for chunk in chunks) == 65536
+    assert digests == [(p, hashlib.sha1(p.read_bytes()).hexdigest()) for p in paths]
+    with pytest.raises(ValueError):
+        asyncio.run(aio.hash_file(paths[0], "nope"))
@@ -1,6 +1,11 @@
+import math
 import pytest
 from montykit.analysis import (
+    NgramCounter,
     text_polarity,
+    text_sentiment,
+    text_sentiments,
+    text_subjectivity,
     word_freq,
     text_difficulty,
     text_is_difficult
@@ -25,6 +30,93 @@ def test_word_freq():
     assert "Apple" not in result
 
 
+NGRAM_TEXTS = [
+    "New York is big. I love New York!",
+    "new york, new york",
+    "The cat sat on the mat.",
+    "",
+]
+
+
+def test_ngram_counter_counts():
+    counter = NgramCounter(n=3)
+    counter.add_many(NGRAM_TEXTS)
+    assert counter.total == sum(sum(word_freq(text).values()) for text in NGRAM_TEXTS)
+    assert counter.vocabulary_size == len(set().union(*map(word_freq, NGRAM_TEXTS)))
+    assert counter.count("new york") == 4
+    assert counter.count(("new", "york", "is")) == 1
+    assert counter.count("york") == 4
+    assert counter.count("mat the") == 0
+    assert counter.count("never seen") == 0
+    assert counter.most_common(1, order=2) == [(("new", "york"), 4)]
+    assert counter.most_common(1, order=1) == [(("new",), 4)]
+    with pytest.raises(ValueError):
+        counter.most_common(order=4)
+
+
+def test_ngram_counter_collocations():
+    counter = NgramCounter()
+    counter.add_many(NGRAM_TEXTS)
+    (pair, pmi), = counter.collocations(1, min_count=2)
+    assert pair == ("new", "york")
+    assert pmi == pytest.approx(math.log2(4 * 18 / (4 * 4)))
+    (pair, llr), = counter.collocations(1, measure="llr", min_count=2)
+    assert pair == ("new", "york")
+    assert llr > 10
+    with pytest.raises(ValueError):
+        counter.collocations(measure="dice")
+
+
+def test_ngram_counter_llr_with_repeated_words():
+    counter = NgramCounter()
+    counter.add("a a a")
+    (pair, llr), = counter.collocations(measure="llr", min_count=1)
+    assert pair == ("a", "a")
+    assert llr >= 0
+
+
+def test_ngram_counter_merge_and_files(tmp_path):
+    paths = []
+    for index, text in enumerate(NGRAM_TEXTS):
+        paths.append(tmp_path / f"{index}.txt")
+        paths[-1].write_text(text + "\n" + text)
+    whole = NgramCounter(n=3)
+    whole.add_many(NGRAM_TEXTS * 2)
+    for workers in (1, 2):
+        merged = NgramCounter.from_files(paths, n=3, workers=workers)
+        assert merged.total == whole.total
+        for order in (1, 2, 3):
+            assert dict(merged.most_common(100, order)) == dict(whole.most_common(100, order))
+
+
+def test_ngram_counter_pruning():
+    counter = NgramCounter(max_ngrams=10)
+    counter.add_many(["common phrase"] * 5 + [f"rare{i} word{i}" for i in range(20)])
+    assert counter.pruned
+    assert len(counter.most_common(100)) <= 10
+    assert counter.count("common phrase") == 5
+    counter.prune(6)
+    assert counter.most_common() == []
+    assert counter.count("common") == 5
+
+
+@pytest.mark.parametrize("max_ngrams, texts, kept", [
+    (4, ["a b c d e f g"], 2),
+    (2, ["a b", "c d", "e f"], 1),
+])
+def test_ngram_counter_pruning_tied_counts(max_ngrams, texts, kept):
+    counter = NgramCounter(max_ngrams=max_ngrams)
+    counter.add_many(texts)
+    assert counter.pruned
+    assert len(counter.most_common(100)) == kept
+
+
+def test_ngram_counter_pruning_keeps_the_most_frequent():
+    counter = NgramCounter(max_ngrams=1)
+    counter.add_many(["common phrase"] * 3 + ["rare words"])
+    assert counter.most_common(order=2) == [(("common", "phrase"), 3)]
+
+
 def test_text_difficulty_structure():
     text = "The quick brown fox jumps over the lazy dog."
     metrics = text_difficulty(text)
@@ -46,4 +138,57 @@ def test_text_difficulty_structure():
     ("The ontological ramifications of existentialism are inherently multifaceted.", True),
 ])
 def test_text_is_difficult(text, expected_bool):
-    assert text_is_difficult(text) == expected_bool
\ No newline at end of file
+    assert text_is_difficult(text) == expected_bool
+
+
+SENTIMENT_TEXTS = [
+    "I love this! It is wonderful and happy.",
+    "The movie was not very good, but the actors were really great!",
+    "I don't like it. It's NOT bad at all :) (!) but kinda sad :( ...",
+    "Mr. Smith was extremely happy!!! e.g. a terribly awful, horribly bad day.",
+    "“Quoted” ‘text’ isn't bad; really not good.\n\nNever a dull moment o.O xD <3",
+    "The chair is brown.",
+    "",
+]
+
+
+@pytest.mark.parametrize("text", SENTIMENT_TEXTS)
+def test_text_sentiment_matches_textblob(text):
+    from textblob import TextBlob
+    expected = TextBlob(text).sentiment
+    polarity, subjectivity = text_sentiment(text)
+    assert polarity == pytest.approx(expected.polarity, abs=1e-9)
+    assert subjectivity == pytest.approx(expected.subjectivity, abs=1e-9)
+    assert text_polarity(text) == polarity
+    assert text_subjectivity(text) == subjectivity
+
+
+def test_sentiment_falls_back_to_textblob(monkeypatch):
+    from textblob import TextBlob
+    from montykit import analysis
+
+    monkeypatch.setattr(analysis._SentimentLexicon, "score", lambda self, text: (0.5, 0.5))
+    analysis._lexicon.cache_clear()
+    try:
+        assert isinstance(analysis._lexicon(), analysis._TextBlobScorer)
+        text = SENTIMENT_TEXTS[1]
+        assert text_sentiment(text) == tuple(TextBlob(text).sentiment)
+    finally:
+        analysis._lexicon.cache_clear()
+
+
+def test_text_sentiments_matches_textblob():
+    import random
+    from textblob import TextBlob
+
+    sentences = SENTIMENT_TEXTS[:-1] + [
+        "Shipping took three weeks and the box arrived damaged.",
+        "Customer service never answered my emails, which was disappointing.",
+        "Overall, a solid product for the price; I would buy it again.",
+        "The battery lasts about two days with normal use.",
+    ]
+    rng = random.Random(0)
+    texts = [" ".join(rng.choice(sentences) for _ in range(rng.randint(1, 6)))
+             for _ in range(200)]
+    assert text_sentiments(texts) == [pytest.approx(tuple(TextBlob(t).sentiment), abs=1e-9)
+                                      for t in texts]
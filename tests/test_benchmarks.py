@@ -0,0 +1,40 @@
+import pytest
+from benchmarks import suite
+
+
+def test_every_public_function_has_a_case():
+    assert suite.missing_cases() == []
+
+
+# functions that may need nltk data or network access
+NEEDS_DATA = {"text_difficulty", "text_is_difficult", "detect_lang"}
+
+
+@pytest.mark.parametrize("name", suite.public_functions())
+def test_case_runs(name):
+    size = suite._CASES[name][1][0]
+    result = suite.run_case(name, size, min_time=0, min_runs=1)
+    if "error" in result:
+        assert name in NEEDS_DATA, result["error"]
+        assert result["error"].startswith(("LookupError", "OSError", "URLError", "HTTPError")), result["error"]
+    elif "skipped" not in result:
+        assert result["runs"] >= 1
+        assert result["p50_ms"] <= result["p90_ms"] <= result["p99_ms"]
+        assert result["throughput_mb_s"] > 0 and result["peak_kb"] >= 0
+
+
+def test_compare_flags_regressions():
+    def run(p50, peak):
+        return {"results": [{"name": "rot13", "size": "1KB", "p50_ms": p50, "peak_kb": peak},
+                            {"name": "gen_id", "size": "1KB", "skipped": "x"}]}
+    assert suite.compare(run(1.2, 10), run(1.0, 10)) == []
+    regressions = suite.compare(run(2.0, 30), run(1.0, 10))
+    assert [(r["metric"], r["ratio"]) for r in regressions] == [("p50_ms", 2.0), ("peak_kb", 3.0)]
+
+
+def test_main_writes_and_compares(tmp_path, capsys):
+    output = tmp_path / "results.json"
+    args = ["--filter", "^rot13$", "--sizes", "1KB", "--min-time", "0"]
+    assert suite.main(args + ["-o", str(output)]) == 0
+    assert suite.main(args + ["--baseline", str(output), "--threshold", "1000"]) == 0
+    assert "rot13 [1KB]" in capsys.readouterr().out
@@ -0,0 +1,80 @@
+import pytest
+from multiprocessing import Pool
+from montykit import analysis
+from montykit.cache import ResultCache, disable_cache, enable_cache
+
+
+calls = []
+
+
+def square_length(text):
+    calls.append(text)
+    return {"length": len(text) ** 2}
+
+
+def _fill(task):
+    path, start = task
+    cache = ResultCache(path)
+    return [cache.call(len, str(i)) for i in range(start, start + 200)]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    calls.clear()
+    cache = ResultCache(tmp_path / "cache.sqlite")
+    yield cache
+    cache.close()
+
+
+def test_hits_and_misses(cache):
+    assert cache.get("f", "abc") == (False, None)
+    assert cache.call(square_length, "abc") == {"length": 9}
+    assert cache.call(square_length, "abc") == {"length": 9}
+    assert cache.call(square_length, "abcd") == {"length": 16}
+    assert calls == ["abc", "abcd"]
+    assert len(cache) == 2
+    assert cache.key("f", "abc") != cache.key("g", "abc")
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_persists_across_instances(cache):
+    cache.set("f", "text", [1, 2.5, "x"])
+    other = ResultCache(cache.path)
+    assert other.get("f", "text") == (True, [1, 2.5, "x"])
+    other.close()
+
+
+def test_eviction_removes_oldest(tmp_path):
+    cache = ResultCache(tmp_path / "cache.sqlite", max_bytes=10_000)
+    for i in range(100):
+        cache.set("f", str(i), "x" * 100)
+    cache.evict()
+    assert cache.size() <= 10_000
+    assert cache.get("f", "99")[0]
+    assert not cache.get("f", "0")[0]
+    cache.close()
+
+
+def test_concurrent_processes(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    with Pool(4) as pool:
+        results = pool.map(_fill, [(path, start) for start in (0, 100, 100, 200)])
+    assert results[1] == results[2] == [len(str(i)) for i in range(100, 300)]
+    cache = ResultCache(path)
+    assert len(cache) == 400
+    cache.close()
+
+
+def test_analysis_integration(tmp_path):
+    cache = enable_cache(tmp_path / "cache.sqlite")
+    try:
+        text = "What a wonderful, happy day."
+        first = analysis.text_polarity(text)
+        assert cache.get("montykit.analysis.text_polarity", text) == (True, first)
+        cache.set("montykit.analysis.text_polarity", text, 0.125)
+        assert analysis.text_polarity(text) == 0.125
+    finally:
+        disable_cache()
+    assert analysis.text_polarity(text) == first
+    cache.close()
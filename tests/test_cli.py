@@ -0,0 +1,85 @@
+import io
+import hashlib
+import json
+import subprocess
+import sys
+import pytest
+from montykit.cli import main
+from montykit.ciphers import rot13, caesar_cipher
+from montykit.converters import base64_encode
+
+
+def run(monkeypatch, capsys, argv, stdin=""):
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(stdin.encode())))
+    status = main(argv)
+    return status, capsys.readouterr().out
+
+
+@pytest.mark.parametrize("argv, stdin, expected", [
+    (["cipher", "rot13"], "Hello\nworld\n", f"{rot13('Hello')}\n{rot13('world')}\n"),
+    (["cipher", "caesar_cipher", "--shift", "3", "--decrypt"], "khoor\n",
+     f"{caesar_cipher('khoor', 3, True)}\n"),
+    (["convert", "base64_encode"], "hi\n", f"{base64_encode('hi')}\n"),
+    (["validate", "email"], "a@b.com\nnope\n", "nope\n"),
+    (["validate", "email", "--valid"], "a@b.com\nnope\n", "a@b.com\n"),
+])
+def test_line_commands_stdin(monkeypatch, capsys, argv, stdin, expected):
+    status, out = run(monkeypatch, capsys, argv, stdin)
+    assert out == expected
+    assert status == (1 if argv[0] == "validate" else 0)
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_line_commands_files(tmp_path, monkeypatch, capsys, jobs):
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"{index}.txt"
+        path.write_text(f"file {index}\nline two\n")
+        paths.append(str(path))
+    status, out = run(monkeypatch, capsys, ["cipher", "rot13", "-j", jobs, *paths])
+    assert status == 0
+    assert out == "".join(f"{rot13(f'file {i}')}\n{rot13('line two')}\n" for i in range(3))
+
+
+def test_hash_command(tmp_path, monkeypatch, capsys):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"abc" * 1000)
+    status, out = run(monkeypatch, capsys, ["hash", "-a", "md5", str(path), "-"], "xyz")
+    assert status == 0
+    assert out.splitlines() == [f"{hashlib.md5(b'abc' * 1000).hexdigest()}  {path}",
+                                f"{hashlib.md5(b'xyz').hexdigest()}  -"]
+
+
+def test_gen_command(monkeypatch, capsys):
+    status, out = run(monkeypatch, capsys, ["gen", "password", "-n", "5", "--length", "20"])
+    assert status == 0
+    assert [len(line) for line in out.splitlines()] == [20] * 5
+
+
+def test_json_commands(tmp_path, monkeypatch, capsys):
+    path = tmp_path / "data.jsonl"
+    path.write_text('{"a": 1}\n{"a": }\n')
+    status, out = run(monkeypatch, capsys, ["validate", "jsonl", str(path)])
+    assert status == 1 and out == f"{path}:2: invalid JSON at byte 15\n"
+    status, out = run(monkeypatch, capsys, ["validate", "json"], '{"a": [1, 2]}')
+    assert status == 0 and out == ""
+
+
+def test_analyze_command(tmp_path, monkeypatch, capsys):
+    status, out = run(monkeypatch, capsys, ["analyze", "word_freq"], "the cat the")
+    assert status == 0 and json.loads(out) == {"the": 2, "cat": 1}
+
+
+def test_errors(monkeypatch, capsys):
+    assert run(monkeypatch, capsys, ["cipher", "shift_cipher"], "x\n")[0] == 1
+    assert run(monkeypatch, capsys, ["hash", "-a", "nope"], "x")[0] == 1
+    with pytest.raises(SystemExit):
+        main(["cipher", "rot13", "--bogus"])
+
+
+def test_cli_loads_only_needed_submodule():
+    code = ("import sys; from montykit.cli import main; main(['gen', 'id']); "
+            "print(sorted(m for m in sys.modules if m.startswith('montykit.')), "
+            "'textblob' in sys.modules, file=sys.stderr)")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stderr.strip() == "['montykit.cli', 'montykit.generator'] False"
@@ -0,0 +1,92 @@
+import math
+import pytest
+from montykit.analysis import word_freq
+from montykit.corpus import CorpusIndex
+
+
+DOCS = [
+    "The quick brown fox jumps over the lazy dog.",
+    "A quick brown dog outpaces a quick fox!",
+    "Lazy afternoons are the best afternoons.",
+    "",
+    "Über café: naïve résumé, fox.",
+]
+
+
+@pytest.fixture
+def index():
+    index = CorpusIndex()
+    assert index.add_many(DOCS) == range(len(DOCS))
+    return index
+
+
+def test_documents_match_word_freq(index):
+    assert len(index) == len(DOCS)
+    for doc, text in enumerate(DOCS):
+        assert index.term_counts(doc) == word_freq(text)
+    assert index.vocabulary_size == len(set().union(*map(word_freq, DOCS)))
+
+
+def test_postings(index):
+    assert index.postings("fox") == [(0, 1), (1, 1), (4, 1)]
+    assert index.postings("quick") == [(0, 1), (1, 2)]
+    assert index.postings("missing") == []
+
+
+def test_bm25_matches_formula(index):
+    n, average = len(DOCS), sum(sum(word_freq(d).values()) for d in DOCS) / len(DOCS)
+
+    def expected(doc):
+        score = 0.0
+        for term in ("quick", "fox"):
+            postings = dict(index.postings(term))
+            if doc in postings:
+                tf, length = postings[doc], sum(word_freq(DOCS[doc]).values())
+                idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+                score += idf * tf * 2.5 / (tf + 1.5 * (0.25 + 0.75 * length / average))
+        return score
+
+    results = index.search("Quick fox?")
+    assert [doc for doc, _ in results] == [1, 0, 4]
+    for doc, score in results:
+        assert score == pytest.approx(expected(doc))
+    assert index.search("quick fox", k=1) == results[:1]
+    assert [doc for doc, _ in index.search("afternoons", method="tfidf")] == [2]
+    assert index.search("nothing here") == []
+    with pytest.raises(ValueError):
+        index.search("fox", method="cosine")
+
+
+def test_tfidf_matrix(index):
+    indptr, indices, weights = index.tfidf_matrix()
+    assert list(indptr) == list(index._indptr)
+    row = {index.term(t): w for t, w in zip(indices[indptr[2]:indptr[3]], weights[indptr[2]:indptr[3]])}
+    idf = math.log(6 / 2) + 1
+    assert row["afternoons"] == pytest.approx(2 / 6 * idf, rel=1e-6)
+
+
+def test_save_load_and_add(index, tmp_path):
+    path = tmp_path / "corpus.idx"
+    index.save(path)
+    loaded = CorpusIndex.load(path)
+    assert len(loaded) == len(index)
+    assert loaded.vocabulary_size == index.vocabulary_size
+    for query in ["quick fox", "café", "lazy afternoons"]:
+        assert loaded.search(query) == index.search(query)
+    assert loaded.term_counts(4) == index.term_counts(4)
+
+    for target in (index, loaded):
+        assert target.add("fox fox fox and brand new words") == len(DOCS)
+    assert loaded.search("fox new") == index.search("fox new")
+
+    loaded.save(tmp_path / "again.idx")
+    again = CorpusIndex.load(tmp_path / "again.idx")
+    assert again.search("fox new words") == index.search("fox new words")
+    assert again.postings("brand") == [(len(DOCS), 1)]
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "other.idx"
+    path.write_bytes(b"not an index at all")
+    with pytest.raises(ValueError):
+        CorpusIndex.load(path)
@@ -0,0 +1,98 @@
+import pytest
+from array import array
+from montykit.dedup import (
+    LSHIndex, hamming_distance, lsh_bands, minhash, minhash_duplicates, minhash_signatures,
+    minhash_similarity, simhash, simhash_duplicates, simhash_signatures,
+)
+from montykit.analysis import _tokenize
+
+
+BASE = ("Arthur remained very worried about the quick brown fox while the happy dog "
+        "jumped over the lazy cat near the old river bank at the end of a long day")
+DOCS = [
+    BASE,
+    "An entirely different sentence about databases, indexes and query planners in production",
+    BASE + " again",
+    "Completely unrelated words: violin, harbour, pepper, glacier, lantern, orbit, tundra",
+    BASE.replace("lazy", "sleepy"),
+]
+
+
+def jaccard(a, b, size=3):
+    def shingles(text):
+        tokens = _tokenize(text)
+        return {tuple(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+    a, b = shingles(a), shingles(b)
+    return len(a & b) / len(a | b)
+
+
+def test_minhash_estimates_jaccard():
+    signature = minhash(BASE)
+    assert isinstance(signature, array) and signature.typecode == "Q"
+    assert len(signature) == 128 and len(minhash(BASE, num_perm=16)) == 16
+    assert minhash_similarity(signature, minhash(BASE.upper())) == 1.0
+    for other in DOCS[1:]:
+        estimate = minhash_similarity(minhash(BASE, num_perm=512), minhash(other, num_perm=512))
+        assert estimate == pytest.approx(jaccard(BASE, other), abs=0.1)
+    assert minhash("") == minhash("!!!")
+    with pytest.raises(ValueError):
+        minhash(BASE, num_perm=0)
+    with pytest.raises(ValueError):
+        minhash_similarity(signature, signature[:10])
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_signatures_match_single_documents(workers):
+    docs = DOCS * 100
+    signatures = minhash_signatures(docs, num_perm=32, workers=workers)
+    assert len(signatures) == len(docs) * 32
+    assert signatures[4 * 32:5 * 32] == minhash(DOCS[4], num_perm=32)
+    fingerprints = simhash_signatures(docs, workers=workers)
+    assert list(fingerprints[:5]) == [simhash(doc) for doc in DOCS]
+
+
+def test_simhash_matches_bitwise_vote():
+    from collections import Counter
+    from montykit.hash import xxh64
+
+    counts = Counter(xxh64(token) for token in _tokenize(BASE))
+    expected = 0
+    for bit in range(64):
+        votes = sum(weight if h >> bit & 1 else -weight for h, weight in counts.items())
+        if votes > 0:
+            expected |= 1 << bit
+    assert simhash(BASE) == expected
+    assert simhash("") == 0
+    assert hamming_distance(simhash(BASE), simhash(DOCS[2])) <= 3
+    assert hamming_distance(simhash(BASE), simhash(DOCS[3])) > 10
+
+
+def test_lsh_index():
+    index = LSHIndex(num_perm=64, bands=16)
+    for key, doc in zip("abcde", DOCS):
+        index.add(key, minhash(doc, num_perm=64))
+    assert len(index) == 5
+    assert ("a", "c") in index.candidate_pairs()
+    assert ("a", "b") not in index.candidate_pairs()
+    assert index.query(minhash(BASE, num_perm=64))[:2] == ["a", "c"]
+    with pytest.raises(ValueError):
+        LSHIndex(num_perm=64, bands=7)
+    with pytest.raises(ValueError):
+        index.add("f", minhash(BASE))
+
+
+@pytest.mark.parametrize("threshold,bands", [(0.8, 8), (0.5, 32), (1.0, 1)])
+def test_lsh_bands(threshold, bands):
+    assert lsh_bands(128, threshold) == bands
+
+
+def test_find_duplicates():
+    docs = DOCS * 2
+    pairs = {(i, j) for i, j, _ in minhash_duplicates(docs, threshold=0.7)}
+    assert {(0, 2), (0, 5), (1, 6), (3, 8)} <= pairs
+    assert (0, 1) not in pairs and (1, 3) not in pairs
+    assert all(similarity >= 0.7 for *_, similarity in minhash_duplicates(docs, threshold=0.7))
+    close = simhash_duplicates(docs, max_distance=3)
+    assert (0, 5, 0) in close and (0, 1) not in {(i, j) for i, j, _ in close}
+    with pytest.raises(ValueError):
+        simhash_duplicates(docs, max_distance=64)
@@ -1,11 +1,27 @@
 import pytest
+import csv
+import json
+import uuid
 from montykit.generator import (
     gen_id,
     gen_uuid,
+    gen_uuids,
+    gen_uuid7,
+    gen_ulid,
+    gen_ulids,
+    gen_record_batches,
+    gen_records,
+    write_records,
     gen_password,
+    gen_strong_password,
+    gen_strong_passwords,
     gen_first_name,
     gen_first_names,
     gen_full_name,
+    gen_middle_name,
+    gen_middle_names,
+    gen_last_name,
+    gen_last_names,
     gen_phone
 )
 
@@ -29,6 +45,40 @@ def test_gen_password_complexity():
     assert any(c.isupper() for c in result) or any(c.islower() for c in result)
 
 
+def test_gen_strong_passwords_always_pass():
+    from montykit.validators import is_strong_pass
+    passwords = gen_strong_passwords(5000)
+    assert len(passwords) == 5000
+    assert all(len(p) == 12 and is_strong_pass(p) for p in passwords)
+    assert is_strong_pass(gen_strong_password(16))
+    # Each required character lands anywhere, not only at the front
+    assert {i for p in passwords for i, c in enumerate(p) if c.isdigit()} == set(range(12))
+
+
+@pytest.mark.parametrize("kwargs, allowed", [
+    ({"classes": ("digits",), "exclude": "0123"}, set("456789")),
+    ({"classes": ("lower", "digits"), "exclude_ambiguous": True}, set("abcdefghijkmnpqrstuvwxyz23456789")),
+    ({"classes": ("upper",), "custom": ["€£"]}, set("ABCDEFGHIJKLMNOPQRSTUVWXYZ€£")),
+])
+def test_gen_strong_passwords_policies(kwargs, allowed):
+    passwords = gen_strong_passwords(500, length=6, min_length=6, **kwargs)
+    assert set("".join(passwords)) == allowed
+    if "custom" in kwargs:
+        assert all(set(p) & set("€£") for p in passwords)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"classes": ("upper", "emoji")},
+    {"classes": ()},
+    {"classes": ("digits",), "exclude": "0123456789"},
+    {"length": 3, "min_length": 0},
+    {"length": 8},
+])
+def test_gen_strong_passwords_invalid(kwargs):
+    with pytest.raises(ValueError):
+        gen_strong_passwords(1, **kwargs)
+
+
 def test_gen_first_name():
     name = gen_first_name()
     assert isinstance(name, str)
@@ -43,6 +93,19 @@ def test_gen_first_names_list():
     assert all(isinstance(n, str) for n in names)
 
 
+@pytest.mark.parametrize("func", [gen_middle_names, gen_last_names])
+def test_gen_middle_and_last_names(func):
+    names = func(5)
+    assert len(names) == 5
+    assert all(isinstance(n, str) and n for n in names)
+
+
+@pytest.mark.parametrize("func", [gen_middle_name, gen_last_name])
+def test_gen_middle_and_last_name(func):
+    names = [func() for _ in range(20)]
+    assert all(isinstance(n, str) and n for n in names)
+
+
 def test_gen_full_name_variants():
     name_simple = gen_full_name(middle=False)
     name_with_middle = gen_full_name(middle=True)
@@ -53,3 +116,95 @@ def test_gen_full_name_variants():
 def test_gen_phone_format():
     phone = gen_phone()
     assert len(phone) == 10
+
+
+@pytest.mark.parametrize("version", [4, 7])
+def test_gen_uuids_versions(version):
+    results = gen_uuids(50, version=version)
+    assert len(set(results)) == 50
+    for result in results:
+        parsed = uuid.UUID(result)
+        assert parsed.version == version
+        assert parsed.variant == uuid.RFC_4122
+
+
+@pytest.mark.parametrize("output, length", [
+    ("str", 36),
+    ("base62", 22),
+    ("base32", 26),
+    ("bytes", 16),
+])
+def test_gen_uuids_outputs(output, length):
+    results = gen_uuids(5, output=output)
+    assert len(results) == 5
+    assert all(len(r) == length for r in results)
+
+
+def test_gen_uuids_packed():
+    packed = gen_uuids(8, output="packed")
+    assert isinstance(packed, bytes)
+    assert len(packed) == 8 * 16
+    assert uuid.UUID(bytes=packed[16:32]).version == 4
+
+
+def test_gen_uuids_invalid():
+    with pytest.raises(ValueError):
+        gen_uuids(1, version=1)
+    with pytest.raises(ValueError):
+        gen_uuids(1, output="xml")
+
+
+def test_time_ordered_ids_sort_in_order():
+    batch = gen_uuids(100, version=7)
+    assert batch == sorted(batch)
+    assert gen_uuid7()[:13] >= batch[-1][:13]
+    ulids = gen_ulids(100)
+    assert ulids == sorted(ulids)
+    assert len(gen_ulid()) == 26
+
+
+SCHEMA = {"id": "id", "name": "full_name", "phone": "phone", "key": "uuid"}
+
+
+def test_gen_records_schema():
+    records = gen_records(SCHEMA, amount=20)
+    assert len(records) == 20
+    for record in records:
+        assert list(record) == list(SCHEMA)
+        assert len(record["id"]) == 12 and record["id"].isdigit()
+        assert len(record["name"].split()) == 2
+        assert uuid.UUID(record["key"]).version == 4
+
+
+def test_gen_record_batches_columnar():
+    batches = list(gen_record_batches(SCHEMA, amount=25, batch_size=10))
+    assert [len(b["id"]) for b in batches] == [10, 10, 5]
+
+
+def test_gen_records_seeded():
+    assert gen_records(SCHEMA, 30, seed=7) == gen_records(SCHEMA, 30, seed=7)
+    assert gen_records(SCHEMA, 30, seed=7) != gen_records(SCHEMA, 30, seed=8)
+
+
+def test_gen_records_invalid_field():
+    with pytest.raises(ValueError):
+        gen_records({"x": "favourite_colour"})
+
+
+def test_write_records_csv_parallel(tmp_path):
+    serial, parallel = tmp_path / "serial.csv", tmp_path / "parallel.csv"
+    write_records(serial, SCHEMA, 250, batch_size=40, seed=1)
+    write_records(parallel, SCHEMA, 250, batch_size=40, seed=1, workers=2)
+    assert serial.read_bytes() == parallel.read_bytes()
+    with open(serial, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 250
+    assert list(rows[0]) == list(SCHEMA)
+
+
+def test_write_records_jsonl(tmp_path):
+    path = tmp_path / "records.jsonl"
+    assert write_records(path, SCHEMA, 15, fmt="jsonl", batch_size=4) == 15
+    lines = path.read_text().splitlines()
+    assert len(lines) == 15
+    assert set(json.loads(lines[0])) == set(SCHEMA)
@@ -1,6 +1,29 @@
 import pytest
 import hashlib
-from montykit.hash import generate_hash
+import io
+from montykit.hash import (
+    generate_hash,
+    generate_hashes,
+    hash_many,
+    hash_file,
+    hash_file_multi,
+    hash_stream,
+    hash_files,
+    fnv1a_32,
+    fnv1a_64,
+    murmur3_32,
+    xxh32,
+    xxh64,
+    jump_hash,
+    rendezvous_hash,
+    chunk_file,
+    chunk_manifest,
+    diff_manifests,
+    MerkleTree,
+    verify_merkle_proof
+)
+import random
+import montykit.hash
 
 
 def test_generate_hash_default():
@@ -20,3 +43,192 @@ def test_generate_hash_algorithms(algo, text, expected):
 def test_generate_hash_invalid():
     with pytest.raises(ValueError, match="Algorithm invalid_algo is not supported."):
         generate_hash("This should NOT WORK!", algorithm="invalid_algo")
+
+
+@pytest.mark.parametrize("algo", ["md5", "sha256", "SHA1"])
+def test_hash_file_matches_hashlib(tmp_path, algo):
+    payload = bytes(range(256)) * 5000
+    path = tmp_path / "payload.bin"
+    path.write_bytes(payload)
+    expected = hashlib.new(algo.lower(), payload).hexdigest()
+    assert hash_file(path, algo) == expected
+    assert hash_file(path, algo, chunk_size=1000) == expected
+
+
+def test_hash_file_invalid():
+    with pytest.raises(ValueError, match="Algorithm nope is not supported."):
+        hash_file("does-not-matter", algorithm="nope")
+
+
+def test_hash_files_parallel(tmp_path):
+    expected = {}
+    for i in range(40):
+        path = tmp_path / f"file{i}.txt"
+        path.write_text("x" * i)
+        expected[path] = hashlib.sha256(b"x" * i).hexdigest()
+    results = dict(hash_files(iter(expected), workers=3))
+    assert results == expected
+
+
+def test_generate_hashes_single_pass():
+    text = "hello" * 1000
+    result = generate_hashes(text, ("md5", "sha1", "sha256"))
+    assert result == {algo: generate_hash(text, algo) for algo in result}
+
+
+def test_multi_digest_accepts_a_single_algorithm_name(tmp_path):
+    path = tmp_path / "payload.txt"
+    path.write_text("hello")
+    assert generate_hashes("hello", "sha256") == {"sha256": generate_hash("hello")}
+    assert hash_file_multi(path, "sha256") == {"sha256": generate_hash("hello")}
+
+
+def test_hash_many():
+    texts = ["a", "b", "", "hello"]
+    assert hash_many(texts, "md5") == [generate_hash(t, "md5") for t in texts]
+    with pytest.raises(ValueError):
+        hash_many(texts, "invalid_algo")
+
+
+def test_hash_stream():
+    payload = b"montykit" * 100_000
+    assert hash_stream(io.BytesIO(payload), "md5", chunk_size=4096) == hashlib.md5(payload).hexdigest()
+    assert hash_stream(io.BytesIO(b"")) == hashlib.sha256(b"").hexdigest()
+
+
+def test_hash_file_multi(tmp_path):
+    payload = b"montykit" * 100_000
+    path = tmp_path / "payload.bin"
+    path.write_bytes(payload)
+    result = hash_file_multi(path, ["md5", "sha256"], chunk_size=4096)
+    assert result == {
+        "md5": hashlib.md5(payload).hexdigest(),
+        "sha256": hashlib.sha256(payload).hexdigest(),
+    }
+
+
+@pytest.mark.parametrize("func, data, expected", [
+    (fnv1a_32, "", 0x811C9DC5),
+    (fnv1a_32, "a", 0xE40C292C),
+    (fnv1a_64, "a", 0xAF63DC4C8601EC8C),
+    (fnv1a_64, b"foobar", 0x85944171F73967E8),
+])
+def test_fnv1a(func, data, expected):
+    assert func(data) == expected
+
+
+@pytest.fixture(params=["accelerated", "pure"])
+def hash_backend(request, monkeypatch):
+    if request.param == "pure":
+        monkeypatch.setattr(montykit.hash, "_mmh3", None)
+        monkeypatch.setattr(montykit.hash, "_xxhash", None)
+    return request.param
+
+
+@pytest.mark.parametrize("func, data, seed, expected", [
+    (murmur3_32, "", 0, 0),
+    (murmur3_32, "hello", 0, 0x248BFA47),
+    (murmur3_32, "The quick brown fox jumps over the lazy dog", 0, 0x2E4FF723),
+    (xxh32, "", 0, 0x02CC5D05),
+    (xxh32, "a", 0, 0x550D7456),
+    (xxh32, "Nobody inspects the spammish repetition", 0, 0xE2293B2F),
+    (xxh64, "", 0, 0xEF46DB3751D8E999),
+    (xxh64, "a", 0, 0xD24EC4F1A98C6E5B),
+    (xxh64, "Nobody inspects the spammish repetition", 0, 0xFBCEA83C8A378BF1),
+])
+def test_fast_hashes(hash_backend, func, data, seed, expected):
+    assert func(data, seed) == expected
+    assert func(data.encode(), seed) == expected
+
+
+def test_jump_hash_range_and_stability():
+    keys = [f"user-{i}" for i in range(2000)]
+    before = [jump_hash(k, 10) for k in keys]
+    after = [jump_hash(k, 11) for k in keys]
+    assert set(before) == set(range(10))
+    moved = [(b, a) for b, a in zip(before, after) if a != b]
+    assert all(a == 10 for _, a in moved)
+    assert len(moved) < len(keys) * 0.2
+    assert jump_hash(123456789, 1) == 0
+    with pytest.raises(ValueError):
+        jump_hash("key", 0)
+
+
+def test_rendezvous_hash_minimal_disruption():
+    nodes = ["node-a", "node-b", "node-c", "node-d"]
+    keys = [f"key-{i}" for i in range(1000)]
+    owners = {k: rendezvous_hash(k, nodes) for k in keys}
+    assert set(owners.values()) == set(nodes)
+    remaining = [n for n in nodes if n != "node-b"]
+    for key, owner in owners.items():
+        if owner != "node-b":
+            assert rendezvous_hash(key, remaining) == owner
+    with pytest.raises(ValueError):
+        rendezvous_hash("key", [])
+
+
+CDC_SIZES = {"min_size": 256, "avg_size": 1024, "max_size": 4096}
+
+
+def test_chunk_file_covers_file(tmp_path):
+    payload = random.Random(0).randbytes(200_000)
+    path = tmp_path / "data.bin"
+    path.write_bytes(payload)
+    chunks = list(chunk_file(path, read_size=5000, **CDC_SIZES))
+    assert chunks[0][0] == 0
+    assert sum(length for _, length, _ in chunks) == len(payload)
+    for offset, length, digest in chunks:
+        assert length <= CDC_SIZES["max_size"]
+        assert hashlib.sha256(payload[offset:offset + length]).hexdigest() == digest
+    assert all(length >= CDC_SIZES["min_size"] for _, length, _ in chunks[:-1])
+
+
+def test_chunk_manifest_diff_after_insert(tmp_path):
+    payload = random.Random(1).randbytes(300_000)
+    old_path, new_path = tmp_path / "old.bin", tmp_path / "new.bin"
+    old_path.write_bytes(payload)
+    new_path.write_bytes(payload[:150_000] + b"inserted bytes" + payload[150_000:])
+    old = chunk_manifest(old_path, **CDC_SIZES)
+    new = chunk_manifest(new_path, **CDC_SIZES)
+    assert new["size"] == old["size"] + 14
+    diff = diff_manifests(old, new)
+    assert 0 < diff["changed_bytes"] < 3 * CDC_SIZES["max_size"]
+    assert len(diff["reused"]) > len(new["chunks"]) - 4
+
+
+def test_chunk_file_invalid_sizes(tmp_path):
+    with pytest.raises(ValueError):
+        list(chunk_file(tmp_path / "x", min_size=10, avg_size=5, max_size=20))
+
+
+@pytest.mark.parametrize("size", [0, 1, 1000, 4096, 10_001])
+def test_merkle_tree_file_matches_bytes(tmp_path, size):
+    payload = random.Random(size).randbytes(size)
+    path = tmp_path / "payload.bin"
+    path.write_bytes(payload)
+    from_file = MerkleTree.from_file(path, block_size=1024, workers=3)
+    from_bytes = MerkleTree.from_bytes(payload, block_size=1024, workers=2)
+    assert from_file.root == from_bytes.root
+    assert len(from_file) == max(-(-size // 1024), 1)
+
+
+def test_merkle_proofs():
+    blocks = [bytes([i]) * 100 for i in range(7)]
+    tree = MerkleTree.from_bytes(b"".join(blocks), block_size=100)
+    for index, block in enumerate(blocks):
+        proof = tree.proof(index)
+        assert verify_merkle_proof(block, proof, tree.root)
+        assert not verify_merkle_proof(b"tampered", proof, tree.root)
+    with pytest.raises(IndexError):
+        tree.proof(7)
+
+
+def test_merkle_incremental_update():
+    blocks = [bytes([i]) * 64 for i in range(9)]
+    tree = MerkleTree.from_bytes(b"".join(blocks), block_size=64, algorithm="md5")
+    blocks[8] = b"x" * 64
+    blocks[3] = b"y" * 64
+    tree.update(8, blocks[8])
+    root = tree.update(3, blocks[3])
+    rebuilt = MerkleTree.from_bytes(b"".join(blocks), block_size=64, algorithm="md5")
+    assert root == rebuilt.root
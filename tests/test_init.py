@@ -0,0 +1,53 @@
+import subprocess
+import sys
+import pytest
+import montykit
+
+
+def _import_times(statement: str) -> dict:
+    """Runs a statement under -X importtime and maps module names to their
+    cumulative import time in microseconds."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_is_lazy():
+    times = _import_times("import montykit")
+    assert "montykit" in times
+    for module in ["textblob", "textstat", "nltk", "montykit.analysis",
+                   "montykit.generator", "montykit.hash", "montykit.validators"]:
+        assert module not in times
+
+
+@pytest.mark.parametrize("statement, loaded, not_loaded", [
+    ("from montykit import base64_encode", "montykit.converters", "montykit.generator"),
+    ("import montykit; montykit.generate_hash", "montykit.hash", "montykit.validators"),
+    ("from montykit import text_polarity", "montykit.analysis", "textblob"),
+])
+def test_import_loads_only_needed_submodule(statement, loaded, not_loaded):
+    times = _import_times(statement)
+    assert loaded in times
+    assert not_loaded not in times
+
+
+def test_import_time_benchmark():
+    lazy = _import_times("import montykit")["montykit"]
+    eager = _import_times("import montykit.analysis, textblob, textstat")
+    assert lazy < eager["textblob"] + eager["textstat"]
+
+
+def test_lazy_attributes():
+    for name in montykit.__all__:
+        assert getattr(montykit, name) is not None
+    assert set(montykit.__all__) <= set(dir(montykit))
+    assert montykit.generate_hash is montykit.hash.generate_hash
+    with pytest.raises(AttributeError):
+        montykit.not_a_function
@@ -0,0 +1,100 @@
+import json
+import os
+import subprocess
+import sys
+import pytest
+import montykit
+from montykit import ciphers, generator, instrument
+
+
+@pytest.fixture
+def instrumented():
+    instrument.reset()
+    instrument.enable()
+    yield
+    instrument.disable()
+    instrument.reset()
+
+
+def test_disabled_by_default():
+    assert not instrument.is_enabled()
+    assert not hasattr(ciphers.rot13, "__wrapped__")
+    assert montykit.rot13 is ciphers.rot13
+
+
+def test_records_calls(instrumented):
+    assert hasattr(ciphers.rot13, "__wrapped__")
+    assert montykit.rot13 is ciphers.rot13
+    for text in ["a", "bb", "ccc"]:
+        montykit.rot13(text)
+    with pytest.raises(ValueError):
+        montykit.generate_hash("x", "nope")
+    stats = instrument.snapshot()
+    assert stats["rot13"]["calls"] == 3
+    assert stats["rot13"]["input_size"] == 6
+    assert stats["rot13"]["errors"] == 0
+    assert stats["shift_cipher"]["calls"] == 3  # rot13 calls shift_cipher
+    assert stats["generate_hash"]["errors"] == 1
+    metrics = stats["rot13"]
+    assert 0 <= metrics["p50_ms"] <= metrics["p90_ms"] <= metrics["p99_ms"] <= metrics["max_ms"]
+
+
+def test_generators_are_timed_when_consumed(instrumented):
+    batches = generator.gen_record_batches({"id": "id"}, 25, batch_size=10)
+    assert "gen_record_batches" not in instrument.snapshot()
+    assert len(list(batches)) == 3
+    assert instrument.snapshot()["gen_record_batches"]["calls"] == 1
+
+
+def test_generators_stopped_early_are_not_errors(instrumented):
+    for _ in generator.gen_record_batches({"id": "id"}, 25, batch_size=10):
+        break
+    stats = instrument.snapshot()["gen_record_batches"]
+    assert stats["calls"] == 1
+    assert stats["errors"] == 0
+
+
+def test_reservoir_is_bounded(instrumented):
+    for _ in range(instrument._RESERVOIR_SIZE + 100):
+        montykit.reverse_cipher("x")
+    assert instrument.snapshot()["reverse_cipher"]["calls"] == instrument._RESERVOIR_SIZE + 100
+    assert len(instrument._stats["reverse_cipher"].samples) == instrument._RESERVOIR_SIZE
+
+
+def test_disable_restores_functions(instrumented):
+    instrument.disable()
+    assert not hasattr(ciphers.rot13, "__wrapped__")
+    montykit.rot13("a")
+    assert "rot13" not in instrument.snapshot()
+
+
+def test_export(instrumented, tmp_path):
+    montykit.rot13("abc")
+    instrument.export(tmp_path / "metrics.json")
+    assert json.loads((tmp_path / "metrics.json").read_text())["rot13"]["calls"] == 1
+    instrument.export(tmp_path / "metrics.prom")
+    text = (tmp_path / "metrics.prom").read_text()
+    assert 'montykit_calls_total{function="rot13"} 1' in text
+    assert 'montykit_latency_seconds{function="rot13",quantile="0.99"}' in text
+    with pytest.raises(ValueError):
+        instrument.export(tmp_path / "metrics.txt", fmt="xml")
+
+
+def test_environment_variable(tmp_path):
+    path = tmp_path / "metrics.json"
+    env = dict(os.environ, MONTYKIT_INSTRUMENT="1", MONTYKIT_INSTRUMENT_EXPORT=str(path))
+    subprocess.run([sys.executable, "-c", "from montykit.converters import base64_encode; "
+                    "base64_encode('hello')"], env=env, check=True)
+    assert json.loads(path.read_text())["base64_encode"]["input_size"] == 5
+
+
+def test_enabling_keeps_submodules_lazy():
+    code = ("import sys, montykit; "
+            "print(sorted(m for m in sys.modules if m.startswith('montykit.'))); "
+            "montykit.rot13('a'); "
+            "from montykit import instrument; "
+            "print(sorted(instrument.snapshot()))")
+    env = dict(os.environ, MONTYKIT_INSTRUMENT="1")
+    out = subprocess.run([sys.executable, "-c", code], env=env, check=True,
+                         capture_output=True, text=True).stdout.splitlines()
+    assert out == ["['montykit.instrument']", "['rot13', 'shift_cipher']"]
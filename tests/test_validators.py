@@ -1,5 +1,26 @@
 import pytest
-from montykit.validators import json_validator, is_email, is_strong_pass
+import io
+import json
+from montykit.validators import (
+    json_validator,
+    is_email,
+    is_strong_pass,
+    find_json_error,
+    json_stream_validator,
+    jsonl_validator,
+    compile_schema,
+    schema_validator,
+    schema_batch_validator,
+    validate_emails,
+    validate_email_column,
+    build_password_list,
+    password_in_list,
+    password_strength,
+    audit_passwords,
+    compile_rules,
+    validate_records,
+    validate_columns
+)
 
 
 @pytest.mark.parametrize("data, expected", [
@@ -36,3 +57,292 @@ def test_is_email(email, expected):
 ])
 def test_is_strong_pass(password, expected):
     assert is_strong_pass(password) == expected
+
+
+JSON_CASES = [
+    '{"name": "Alice", "age": 30}', '["item1", "item2"]', 'invalid string',
+    '{name: "Alice"}', '', '  [ 1 , 2 ]  ', '-0', '01', '1.', '1.5e+3', '1e',
+    'truex', 'NaN', '[NaN, -Infinity]', '"abc', '"a\\u00e9"', '"a\\x"',
+    '"tab\there"', '[1,]', '{"a":1,}', '{"a" 1}', '[[[]]]', '[[[]]', '[]]',
+    '{"a":[1,2,{"b":null}],"c":"d"}', '1 2', '{"a":1 "b":2}', '{1:2}', '[}',
+    '"\\u12"', '[[1, 2], {"x": [3]}]',
+]
+
+
+@pytest.mark.parametrize("data", JSON_CASES)
+@pytest.mark.parametrize("chunk_size", [1, 3, 64])
+def test_json_stream_validator_matches_json_validator(data, chunk_size):
+    expected = json_validator(data)
+    assert json_stream_validator(data, chunk_size=chunk_size) == expected
+    assert json_stream_validator(data.encode(), chunk_size=chunk_size) == expected
+    assert json_stream_validator(io.BytesIO(data.encode()), chunk_size=chunk_size) == expected
+
+
+@pytest.mark.parametrize("data, offset", [
+    ('{"a": [1, 2,, 3]}', 12),
+    ('[1, 2', 5),
+    ('{"a": 1} x', 9),
+    ('"\u00e9" 1', 5),
+])
+def test_find_json_error_offset(data, offset):
+    assert find_json_error(data) == offset
+    assert find_json_error(iter([data[:4], data[4:]])) == offset
+
+
+def test_find_json_error_large_document():
+    doc = json.dumps({"rows": [[i, str(i), {"v": i / 3}] for i in range(5000)],
+                      "blob": "x" * 100_000})
+    assert find_json_error(doc, chunk_size=1000) is None
+    assert find_json_error(doc[:-1], chunk_size=1000) == len(doc) - 1
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_jsonl_validator(tmp_path, workers):
+    lines = [json.dumps({"id": i}) for i in range(200)]
+    lines[57] = '{"id": }'
+    lines[120] = ''
+    lines[199] = '[1, 2'
+    path = tmp_path / "data.jsonl"
+    path.write_text("\n".join(lines) + "\n")
+    offset_58 = sum(len(line) + 1 for line in lines[:57]) + 7
+    offset_200 = sum(len(line) + 1 for line in lines[:199]) + 5
+    assert jsonl_validator(path, workers=workers) == [(58, offset_58), (200, offset_200)]
+
+
+USER_SCHEMA = {
+    "type": "object",
+    "required": ["id", "email"],
+    "additionalProperties": False,
+    "properties": {
+        "id": {"type": "integer", "minimum": 1},
+        "email": {"type": "string", "pattern": "@", "maxLength": 254},
+        "score": {"type": "number", "exclusiveMaximum": 100},
+        "tags": {"type": "array", "items": {"type": "string"}, "uniqueItems": True},
+        "status": {"enum": ["active", "disabled"]},
+    },
+}
+
+
+@pytest.mark.parametrize("document, expected", [
+    ({"id": 1, "email": "a@b.co"}, True),
+    ({"id": 1, "email": "a@b.co", "score": 99.5, "tags": ["x", "y"]}, True),
+    ({"id": 0, "email": "a@b.co"}, False),
+    ({"id": True, "email": "a@b.co"}, False),
+    ({"id": 2.0, "email": "a@b.co"}, True),
+    ({"id": 1}, False),
+    ({"id": 1, "email": "nope"}, False),
+    ({"id": 1, "email": "a@b.co", "score": 100}, False),
+    ({"id": 1, "email": "a@b.co", "tags": ["x", "x"]}, False),
+    ({"id": 1, "email": "a@b.co", "status": "gone"}, False),
+    ({"id": 1, "email": "a@b.co", "extra": 1}, False),
+    (["not", "an", "object"], False),
+])
+def test_schema_validator(document, expected):
+    assert schema_validator(document, USER_SCHEMA) == expected
+
+
+@pytest.mark.parametrize("schema, valid, invalid", [
+    ({"anyOf": [{"type": "string"}, {"type": "null"}]}, [None, "x"], [1, []]),
+    ({"oneOf": [{"multipleOf": 3}, {"multipleOf": 5}]}, [3, 10], [15, 7]),
+    ({"not": {"type": "string"}}, [1, None], ["x"]),
+    ({"allOf": [{"minLength": 2}, {"maxLength": 3}]}, ["ab", 5], ["a", "abcd"]),
+    ({"type": ["integer", "null"]}, [1, None], [1.5, "1"]),
+    ({"const": 1}, [1, 1.0], [True, "1"]),
+    ({"patternProperties": {"^x-": {"type": "integer"}}, "additionalProperties": False},
+     [{"x-a": 1}], [{"x-a": "1"}, {"y": 1}]),
+    ({"prefixItems": [{"type": "string"}, {"type": "integer"}], "items": False},
+     [["a", 1], ["a"]], [["a", 1, 2], [1, "a"]]),
+    ({"prefixItems": [{"type": "string"}, {"type": "integer"}]},
+     [["a", 1, None, "x"], []], [["a", "1", None], [1]]),
+    ({"minimum": 0, "exclusiveMinimum": True}, [1], [0]),
+    ({"if": {"type": "integer"}, "then": {"minimum": 0}, "else": {"type": "string"}},
+     [1, "x"], [-1, None]),
+    ({"propertyNames": {"pattern": "^[a-z]+$"}}, [{"ab": 1}, {}, 1], [{"Ab": 1}]),
+    ({"dependentRequired": {"card": ["cvv"]}}, [{"card": 1, "cvv": 2}, {"cvv": 2}], [{"card": 1}]),
+    ({"dependentSchemas": {"card": {"required": ["cvv"]}}}, [{"cvv": 2}], [{"card": 1}]),
+    ({"dependencies": {"a": ["b"], "c": {"properties": {"d": {"type": "string"}}}}},
+     [{"a": 1, "b": 2}, {"c": 1, "d": "x"}], [{"a": 1}, {"c": 1, "d": 2}]),
+    ({"contains": {"type": "integer"}, "minContains": 2, "maxContains": 3},
+     [[1, 2], ["x", 1, 2, 3]], [[1, "x"], [1, 2, 3, 4]]),
+    ({"contains": {"type": "integer"}, "minContains": 0}, [[], ["x"]], []),
+    (False, [], [1, None]),
+])
+def test_compile_schema_keywords(schema, valid, invalid):
+    validate = compile_schema(schema)
+    assert all(validate(doc) for doc in valid)
+    assert not any(validate(doc) for doc in invalid)
+
+
+def test_compile_schema_recursive_ref_and_cache():
+    schema = {
+        "$defs": {"node": {
+            "type": "object",
+            "required": ["value"],
+            "properties": {
+                "value": {"type": "integer"},
+                "children": {"type": "array", "items": {"$ref": "#/$defs/node"}},
+            },
+        }},
+        "$ref": "#/$defs/node",
+    }
+    validate = compile_schema(schema)
+    assert compile_schema(dict(schema)) is validate
+    assert validate({"value": 1, "children": [{"value": 2, "children": []}]})
+    assert not validate({"value": 1, "children": [{"value": "2"}]})
+
+
+def test_compile_schema_invalid():
+    with pytest.raises(ValueError):
+        compile_schema({"type": "datetime"})
+    with pytest.raises(ValueError):
+        compile_schema({"$ref": "https://example.com/schema.json"})
+    with pytest.raises(ValueError, match="unevaluatedProperties"):
+        compile_schema({"properties": {"a": {"unevaluatedProperties": False}}})
+
+
+def test_schema_batch_validator():
+    documents = [{"id": i, "email": "a@b.co"} for i in range(3)]
+    assert schema_batch_validator(documents, USER_SCHEMA) == [False, True, True]
+
+
+EMAILS = [
+    "tyleruploads@yahoo.com", "no", "@icloud.com", "tyler@.com",
+    "first.last+tag@sub.example.org", "a..b@example.com", "a@b@example.com",
+    "o'brien@example.ie", "user@-example.com", "user@example.c0m", "",
+]
+
+
+def test_validate_emails_matches_is_email():
+    flags = validate_emails(EMAILS, chunk_size=3)
+    assert isinstance(flags, bytearray)
+    assert list(flags) == [int(is_email(email)) for email in EMAILS]
+
+
+def test_validate_emails_strict():
+    flags = validate_emails(EMAILS, strict=True)
+    assert list(flags) == [1, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0]
+    assert validate_emails(["a" * 65 + "@example.com"], strict=True) == bytearray([0])
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_email_column(tmp_path, workers):
+    path = tmp_path / "users.csv"
+    path.write_text("name,email\n" + "".join(f"user,{email}\n" for email in EMAILS))
+    flags = validate_email_column(path, "email", workers=workers)
+    assert flags == validate_emails(EMAILS)
+    assert validate_email_column(path, 1) == flags
+    with pytest.raises(ValueError):
+        validate_email_column(path, "phone")
+
+
+@pytest.mark.parametrize("password, upper, lower, digits, special", [
+    ("Str0ng!Pass2026", 2, 7, 5, 1),
+    ("abc DEF 123", 3, 3, 3, 2),
+    ("", 0, 0, 0, 0),
+])
+def test_password_strength_classes(password, upper, lower, digits, special):
+    result = password_strength(password)
+    assert (result["upper"], result["lower"], result["digits"], result["special"]) == \
+        (upper, lower, digits, special)
+    assert result["length"] == len(password)
+
+
+@pytest.mark.parametrize("password, kinds", [
+    ("xaaaax", {"repeat"}),
+    ("x9876x", {"sequence", "keyboard"}),
+    ("Qwerty!1", {"keyboard"}),
+    ("Tr0ub4dor&3", set()),
+])
+def test_password_strength_patterns(password, kinds):
+    assert {kind for kind, _, _ in password_strength(password)["patterns"]} == kinds
+
+
+def test_password_strength_scores():
+    weak = password_strength("qwerty123")
+    strong = password_strength("W0KZsN1rVzqzha4zvKDgct47SPZgIv2r5ZnD8m3KYyfRRzg35T")
+    assert weak["score"] == 0
+    assert strong["score"] == 4
+    assert weak["entropy"] < password_strength("Tr0ub4dor&3")["entropy"] < strong["entropy"]
+
+
+def test_password_list_lookup(tmp_path):
+    path = tmp_path / "common.txt"
+    words = ["123456", "password", "qwerty", "letmein", "dragon", "a", "zz"]
+    assert build_password_list(words + ["qwerty"], path) == len(words)
+    for word in words:
+        assert password_in_list(word, path)
+    for word in ["", "b", "passwor", "password1", "zzz", "0"]:
+        assert not password_in_list(word, path)
+    result = password_strength("letmein", common_list=path)
+    assert result["common"] and result["score"] == 0
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_audit_passwords(tmp_path, workers):
+    path = tmp_path / "common.txt"
+    build_password_list(["password"], path)
+    passwords = ["password", "Str0ng!Pass2026", "x"] * 5
+    results = audit_passwords(passwords, common_list=path, workers=workers, chunk_size=4)
+    assert results == [password_strength(p, path) for p in passwords]
+    assert [r["common"] for r in results[:3]] == [True, False, False]
+
+
+_USER_RULES = {
+    "name": ["required", ("type", str), ("min_length", 2), ("max_length", 20)],
+    "email": ["required", "email"],
+    "age": [("type", int), ("range", 0, 150)],
+    "role": [("one_of", {"admin", "user"})],
+    "password": ["strong_pass"],
+    "meta": ["json"],
+}
+
+
+@pytest.mark.parametrize("record, expected", [
+    ({"name": "Ann", "email": "ann@example.com"}, None),
+    ({"name": "Ann", "email": "ann@example.com", "age": 30, "role": "user",
+      "password": "Str0ng!Pass2026", "meta": '{"a": 1}'}, None),
+    ({"email": "ann@example.com"}, ("name", "required")),
+    ({"name": "", "email": "ann@example.com"}, ("name", "required")),
+    ({"name": "A", "email": "ann@example.com"}, ("name", "min_length")),
+    ({"name": 42, "email": "ann@example.com"}, ("name", "type")),
+    ({"name": "Ann", "email": "not-an-email"}, ("email", "email")),
+    ({"name": "Ann", "email": "ann@example.com", "age": True}, ("age", "type")),
+    ({"name": "Ann", "email": "ann@example.com", "age": 200}, ("age", "range")),
+    ({"name": "Ann", "email": "ann@example.com", "role": "root"}, ("role", "one_of")),
+    ({"name": "Ann", "email": "ann@example.com", "password": "weak"}, ("password", "strong_pass")),
+    ({"name": "Ann", "email": "ann@example.com", "meta": "{"}, ("meta", "json")),
+])
+def test_compile_rules(record, expected):
+    assert compile_rules(_USER_RULES)(record) == expected
+
+
+def test_compile_rules_order_and_callables():
+    calls = []
+
+    def expensive(value):
+        calls.append(value)
+        return value.startswith("ok")
+
+    check = compile_rules({"code": [expensive, ("pattern", r"[a-z]+")]})
+    assert check({"code": "ok"}) is None
+    assert check({"code": "OK"}) == ("code", "pattern")
+    assert check({"code": "okay"}) is None
+    assert check({"code": "nope"}) == ("code", "expensive")
+    assert calls == ["ok", "okay", "nope"]
+    assert compile_rules({"n": [("min_length", 1)]})({"n": 5}) == ("n", "min_length")
+    with pytest.raises(ValueError):
+        compile_rules({"n": ["unknown"]})
+
+
+def test_validate_records_and_columns():
+    records = [
+        {"name": "Ann", "email": "ann@example.com", "age": 30},
+        {"name": "B", "email": "bad"},
+        {"name": "Cid", "email": "bad"},
+        {"name": "Dee", "email": "dee@example.com", "age": -1},
+    ]
+    expected = {1: ("name", "min_length"), 2: ("email", "email"), 3: ("age", "range")}
+    assert validate_records(records, _USER_RULES) == expected
+    columns = {field: [record.get(field) for record in records] for field in ("name", "email", "age")}
+    assert validate_columns(columns, _USER_RULES) == expected
+    assert validate_columns({}, _USER_RULES) == {}